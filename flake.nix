@@ -695,7 +695,7 @@
       # Checks                                                                #
       #########################################################################
 
-      checks = lib.genAttrs [ "aarch64-darwin" ] (
+      checks = lib.genAttrs [ "x86_64-linux" "aarch64-darwin" ] (
         system:
         let
           pkgs = import nixpkgs {
@@ -705,6 +705,30 @@
           skhdConfigText = self.darwinConfigurations.halcyon.config.services.skhd.skhdConfig;
         in
         {
+          # Offline fixture tests for scripts/hypr-balance-all.py; themectl's
+          # own suite runs in its package checkPhase.
+          hyprBalanceAll =
+            pkgs.runCommand "hypr-balance-all-tests"
+              {
+                nativeBuildInputs = [ (pkgs.python311.withPackages (ps: [ ps.pytest ])) ];
+                src = lib.fileset.toSource {
+                  root = ./scripts;
+                  fileset = lib.fileset.unions [
+                    ./scripts/hypr-balance-all.py
+                    ./scripts/tests
+                  ];
+                };
+              }
+              ''
+                set -euo pipefail
+                cp -r "$src" scripts
+                chmod -R u+w scripts
+                cd scripts
+                pytest -q -p no:cacheprovider tests
+                touch "$out"
+              '';
+        }
+        // lib.optionalAttrs (system == "aarch64-darwin") {
           skhdHexKeycase =
             pkgs.runCommand "skhd-hex-keycase"
               {
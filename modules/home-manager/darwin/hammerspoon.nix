@@ -111,7 +111,7 @@ in
     end
 
     local function runThemectl(args, successMessage)
-      local cmd = string.format("/usr/bin/env themectl %s 2>&1", args)
+      local cmd = string.format("/usr/bin/env themectl-client %s 2>&1", args)
       local output, status = hs.execute(cmd, true)
       if output and output ~= "" then
         print("themectl:", output)
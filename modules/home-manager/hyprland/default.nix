@@ -359,7 +359,7 @@ in
         "$mod CTRL, SPACE, exec, rotate-background"
 
         # Theme automation via themectl (manifest-driven)
-        "${hyprChord themeCycleBinding}, exec, themectl cycle"
+        "${hyprChord themeCycleBinding}, exec, themectl-client cycle"
         "${hyprChord themePickerBinding}, exec, theme-picker"
 
         # Captures (screenshots) - Omarchy-style with hyprshot + satty
@@ -1208,78 +1208,19 @@ in
     fi
   '';
 
-  # Theme picker (Omarchy-style)
+  # Theme picker (Omarchy-style). `themectl pick` lists themes, marks the
+  # current one, runs walker --dmenu and applies the choice in one process.
   home.file.".local/bin/theme-picker" = {
     text = ''
       #!/usr/bin/env bash
       # Interactive theme picker using Walker + themectl
 
-      THEMES_DIR="${config.home.homeDirectory}/.config/omarchy/themes"
-      CURRENT_THEME_LINK="${config.home.homeDirectory}/.config/omarchy/current/theme"
-
       if ! command -v themectl &>/dev/null; then
         ${pkgs.libnotify}/bin/notify-send "themectl unavailable" "Ensure programs.themectl is enabled" -t 3000
         exit 1
       fi
 
-      # Get list of themes with proper formatting (Title Case with spaces)
-      get_theme_list() {
-        ${pkgs.findutils}/bin/find "$THEMES_DIR" -mindepth 1 -maxdepth 1 \( -type d -o -type l \) 2>/dev/null | \
-          ${pkgs.coreutils}/bin/sort | \
-          while read -r path; do
-            ${pkgs.coreutils}/bin/basename "$path" | \
-              ${pkgs.gnused}/bin/sed -E 's/(^|-)([a-z])/\1\u\2/g; s/-/ /g'
-          done
-      }
-
-      # Get current theme name with proper formatting
-      get_current_theme() {
-        if [[ -L "$CURRENT_THEME_LINK" ]]; then
-          ${pkgs.coreutils}/bin/basename "$(${pkgs.coreutils}/bin/readlink "$CURRENT_THEME_LINK")" | \
-            ${pkgs.gnused}/bin/sed -E 's/(^|-)([a-z])/\1\u\2/g; s/-/ /g'
-        fi
-      }
-
-      # Check if themes directory exists
-      if [[ ! -d "$THEMES_DIR" ]]; then
-        ${pkgs.libnotify}/bin/notify-send "No themes found" "Run themectl sync-assets first" -t 3000
-        exit 1
-      fi
-
-      # Get theme list
-      THEME_LIST=$(get_theme_list)
-      if [[ -z "$THEME_LIST" ]]; then
-        ${pkgs.libnotify}/bin/notify-send "No themes found" "Run themectl sync-assets first" -t 3000
-        exit 1
-      fi
-
-      # Get current theme for default selection
-      CURRENT_THEME=$(get_current_theme)
-
-      # Calculate the index of the current theme (0-based; walker 2.x --current expects an index)
-      CURRENT_INDEX=0
-      if [[ -n "$CURRENT_THEME" ]]; then
-        CURRENT_INDEX=$(echo "$THEME_LIST" | ${pkgs.coreutils}/bin/cat -n | \
-          ${pkgs.gnugrep}/bin/grep -F "$CURRENT_THEME" | \
-          ${pkgs.gawk}/bin/awk '{print $1-1}' || echo 0)
-      fi
-
-      # Show theme picker with Walker. Walker 2.x renamed the "mark current" flag
-      # from -a (0.13) to -c; using the old flag silently fails under 2>/dev/null.
-      SELECTED_THEME=$(echo "$THEME_LIST" | \
-        walker --dmenu -p "Theme" -c "$CURRENT_INDEX" 2>/dev/null)
-
-      # If selection was made (not cancelled), apply theme
-      if [[ -n "$SELECTED_THEME" && "$SELECTED_THEME" != "CNCLD" ]]; then
-        # Convert display name back to directory name (lowercase with dashes)
-        THEME_NAME=$(echo "$SELECTED_THEME" | \
-          ${pkgs.gnused}/bin/sed -E 's/ /-/g' | \
-          ${pkgs.coreutils}/bin/tr '[:upper:]' '[:lower:]')
-
-        if ! themectl apply "$THEME_NAME"; then
-          ${pkgs.libnotify}/bin/notify-send "Failed to apply theme" "$THEME_NAME" -t 3000
-        fi
-      fi
+      exec themectl pick
     '';
     executable = true;
   };
@@ -33,6 +33,17 @@ let
   defaultMetadata = "${config.home.homeDirectory}/.config/themectl/themes.json";
   defaultState = "${config.home.homeDirectory}/.config/themes/.current-theme";
   defaultHotkeys = "${config.home.homeDirectory}/.config/themectl/hotkeys.json";
+  # Service managers start the daemon with a bare environment; hooks still need
+  # tmux/nvr/hyprctl/swww/desktoppr from the user profile.
+  daemonPath = lib.concatStringsSep ":" [
+    "${config.home.profileDirectory}/bin"
+    "/etc/profiles/per-user/${config.home.username}/bin"
+    "/run/current-system/sw/bin"
+    "/opt/homebrew/bin"
+    "/usr/local/bin"
+    "/usr/bin"
+    "/bin"
+  ];
 in
 {
   options.programs.themectl = {
@@ -82,6 +93,18 @@ in
       default = true;
       description = "Whether to run `themectl sync-assets` during activation.";
     };
+
+    prescaleWallpapers = mkOption {
+      type = types.bool;
+      default = false;
+      description = "Pass `--prescale` to the activation sync so wallpapers are cached at each display's resolution (uses libvips).";
+    };
+
+    daemon = mkOption {
+      type = types.bool;
+      default = true;
+      description = "Run `themectl daemon` so hotkeys reach a warm process through `themectl-client`.";
+    };
   };
 
   config = lib.mkIf cfg.enable {
@@ -123,13 +146,45 @@ in
       fi
     '';
 
+    systemd.user.services.themectl = lib.mkIf (cfg.daemon && themectlPkg != null && pkgs.stdenv.isLinux) {
+      Unit = {
+        Description = "themectl resident daemon for hotkey-driven theme commands";
+        After = [ "graphical-session.target" ];
+        PartOf = [ "graphical-session.target" ];
+      };
+
+      Service = {
+        ExecStart = "${themectlPkg}/bin/themectl daemon";
+        Environment = [ "PATH=${daemonPath}" ];
+        Restart = "on-failure";
+        RestartSec = 2;
+      };
+
+      Install.WantedBy = [ "graphical-session.target" ];
+    };
+
+    launchd.agents.themectl = lib.mkIf (cfg.daemon && themectlPkg != null && pkgs.stdenv.isDarwin) {
+      enable = true;
+      config = {
+        ProgramArguments = [
+          "${themectlPkg}/bin/themectl"
+          "daemon"
+        ];
+        EnvironmentVariables.PATH = daemonPath;
+        KeepAlive = true;
+        RunAtLoad = true;
+      };
+    };
+
     home.activation.themectlAssets = lib.mkIf (cfg.autoSyncAssets && themectlPkg != null) (
       lib.hm.dag.entryAfter [ "themectlState" ] ''
         if [[ ! -f "${cfg.metadataPath}" ]]; then
           echo "Skipping themectl sync-assets; metadata missing at ${cfg.metadataPath}"
         else
           echo "Syncing theme assets via themectl..."
-          $DRY_RUN_CMD ${themectlPkg}/bin/themectl sync-assets >/dev/null || true
+          ${lib.optionalString cfg.prescaleWallpapers ''PATH="${lib.makeBinPath [ pkgs.libvips ]}:$PATH"''} \
+            $DRY_RUN_CMD ${themectlPkg}/bin/themectl sync-assets --platform ${cfg.platform} \
+            ${lib.optionalString cfg.prescaleWallpapers "--prescale"} >/dev/null || true
         fi
       ''
     );
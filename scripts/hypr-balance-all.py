@@ -11,10 +11,26 @@ Usage:
     python3 hypr-balance-all.py
 
 How it works:
-1. Identifies top-row windows as column representatives
-2. Calculates target width = (monitor_width - gaps) / num_columns
-3. Iteratively resizes columns toward target
-4. Detects oscillation and tree constraints, exiting gracefully
+1. Rebuilds the dwindle split tree from window geometry (guillotine cuts;
+   when several fit, the orientation dwindle would pick for the box's aspect
+   ratio wins, then the cut nearest its default even split)
+2. Computes the exact split ratio of every side-by-side node so that the
+   top-row columns end up equally wide
+3. Applies them in one `[[BATCH]]` of `focuswindow` + `splitratio exact`
+   dispatches and restores focus
+4. Falls back to iterative resizing only if the result is still off (the
+   tree guess was wrong, or a node has no window child to address)
+
+Talking to Hyprland:
+- Requests go straight to the instance's `.socket.sock` (no `hyprctl`
+  processes). Dispatches are applied before Hyprland answers, so the one
+  `j/clients` snapshot taken after a resize already holds the new sizes and
+  no sleeps are needed.
+- Windows are resized with `resizewindowpixel ...,address:<addr>`, so focus
+  never moves and does not have to be restored.
+- One `.socket2` connection stays open for the whole run; when it reports
+  windows opening, closing or moving, the columns are re-derived instead of
+  resizing stale addresses.
 
 Limitations:
 - Dwindle layout uses a binary tree; not all configurations can achieve
@@ -24,10 +40,14 @@ Limitations:
 """
 
 import json
-import subprocess
-import time
-from dataclasses import dataclass
+import os
+import select
+import socket
+import sys
 from collections import deque
+from dataclasses import dataclass, field
+from itertools import pairwise
+from pathlib import Path
 
 
 @dataclass
@@ -39,144 +59,357 @@ class Window:
     height: int
 
 
-def hyprctl(args: list[str]) -> str:
-    """Run hyprctl command and return stdout."""
-    result = subprocess.run(["hyprctl"] + args, capture_output=True, text=True)
-    return result.stdout.strip()
+# socket2 events after which the column set must be re-derived
+LAYOUT_EVENTS = {
+    "openwindow",
+    "closewindow",
+    "movewindow",
+    "movewindowv2",
+    "changefloatingmode",
+    "fullscreen",
+}
+
+
+def instance_dir() -> Path:
+    """Directory holding the running instance's sockets."""
+    signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    if not signature:
+        sys.exit("HYPRLAND_INSTANCE_SIGNATURE is not set; is Hyprland running?")
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    for base in ([Path(runtime) / "hypr"] if runtime else []) + [Path("/tmp/hypr")]:
+        if (base / signature / ".socket.sock").exists():
+            return base / signature
+    sys.exit(f"No Hyprland socket found for instance {signature}")
+
+
+class Hyprland:
+    """Request socket client; Hyprland answers once and closes per request."""
+
+    def __init__(self, directory: Path, timeout: float = 2.0):
+        self.path = str(directory / ".socket.sock")
+        self.timeout = timeout
+
+    def request(self, command: str) -> str:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            sock.sendall(command.encode())
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+        return b"".join(chunks).decode(errors="replace").strip()
+
+    def json(self, command: str):
+        return json.loads(self.request(f"j/{command}"))
+
+    def dispatch(self, *args: str) -> bool:
+        return self.request("dispatch " + " ".join(args)) == "ok"
+
+    def batch(self, commands: list[str]) -> bool:
+        reply = self.request("[[BATCH]]" + ";".join(commands))
+        return reply.split() == ["ok"] * len(commands)
+
+
+class Events:
+    """Persistent `.socket2` subscription."""
+
+    def __init__(self, directory: Path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(directory / ".socket2.sock"))
+        self.buffer = b""
+
+    def poll(self, timeout: float = 0.0) -> list[tuple[str, str]]:
+        """Return the events that arrive within ``timeout`` seconds."""
+        events = []
+        while select.select([self.sock], [], [], timeout)[0]:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                break
+            self.buffer += chunk
+            timeout = 0.0  # drain what is queued, never wait twice
+        *lines, self.buffer = self.buffer.split(b"\n")
+        for line in lines:
+            name, _, data = line.decode(errors="replace").partition(">>")
+            events.append((name, data))
+        return events
+
+    def layout_changed(self) -> bool:
+        return any(name in LAYOUT_EVENTS for name, _ in self.poll())
+
+    def close(self) -> None:
+        self.sock.close()
+
+    def __enter__(self) -> "Events":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def parse_clients(clients: list[dict], workspace_id: int) -> dict[str, Window]:
+    """All tiled (non-floating) windows in workspace, by address."""
+    return {
+        c["address"]: Window(
+            c["address"], c["at"][0], c["at"][1], c["size"][0], c["size"][1]
+        )
+        for c in clients
+        if c["workspace"]["id"] == workspace_id and not c["floating"]
+    }
 
 
-def hyprctl_json(args: list[str]):
-    """Run hyprctl with -j flag and parse JSON."""
-    return json.loads(hyprctl(args + ["-j"]))
+def snapshot(hypr: Hyprland, workspace_id: int) -> dict[str, Window]:
+    return parse_clients(hypr.json("clients"), workspace_id)
 
 
-def get_all_tiled(workspace_id: int) -> list[Window]:
-    """Get all tiled (non-floating) windows in workspace."""
-    return [
-        Window(c["address"], c["at"][0], c["at"][1], c["size"][0], c["size"][1])
-        for c in hyprctl_json(["clients"])
-        if c["workspace"]["id"] == workspace_id and not c["floating"]
-    ]
+def layout_box(monitor: dict) -> tuple[float, float, float, float]:
+    """Area dwindle tiles on a monitor (logical px, minus bars), as x0, y0, x1, y1."""
+    scale = monitor.get("scale", 1) or 1
+    width, height = monitor["width"] / scale, monitor["height"] / scale
+    if monitor.get("transform", 0) % 2:  # rotated 90/270 degrees
+        width, height = height, width
+    left, top, right, bottom = monitor.get("reserved", [0, 0, 0, 0])
+    x, y = monitor["x"], monitor["y"]
+    return (x + left, y + top, x + width - right, y + height - bottom)
+
+
+@dataclass
+class Node:
+    """Dwindle tree node; ``box`` is its layout box (windows sit inside gaps)."""
+
+    box: tuple[float, float, float, float]
+    window: Window | None = None
+    children: tuple["Node", "Node"] | None = None
+    side_by_side: bool = False
+    windows: list[Window] = field(default_factory=list, repr=False)
+
+    @property
+    def left(self) -> int:
+        return min(w.x for w in self.windows)
+
+    @property
+    def right(self) -> int:
+        return max(w.x + w.width for w in self.windows)
+
+    @property
+    def ratio(self) -> float:
+        """Current dwindle split ratio (first child gets ``ratio / 2``)."""
+        x0, y0, x1, y1 = self.box
+        first = self.children[0].box
+        if self.side_by_side:
+            return 2 * (first[2] - x0) / (x1 - x0)
+        return 2 * (first[3] - y0) / (y1 - y0)
+
+    def columns(self) -> int:
+        """Top-row columns under this node."""
+        if self.children is None:
+            return 1
+        first, second = self.children
+        if self.side_by_side:
+            return first.columns() + second.columns()
+        return first.columns()
+
+
+def _cuts(windows: list[Window], side_by_side: bool):
+    """Yield ``(position, first, second)`` for every straight cut between windows."""
+
+    def start(w: Window) -> int:
+        return w.x if side_by_side else w.y
+
+    def end(w: Window) -> int:
+        return w.x + w.width if side_by_side else w.y + w.height
+
+    ordered = sorted(windows, key=start)
+    reach = float("-inf")
+    for i in range(len(ordered) - 1):
+        reach = max(reach, end(ordered[i]))
+        following = start(ordered[i + 1])
+        if reach <= following:
+            yield (reach + following) / 2, ordered[: i + 1], ordered[i + 1 :]
+
+
+def build_tree(
+    windows: list[Window], box: tuple[float, float, float, float]
+) -> Node | None:
+    """Reconstruct the dwindle tree; None if the layout is not a guillotine split."""
+    if len(windows) == 1:
+        return Node(box, window=windows[0], windows=windows)
+    x0, y0, x1, y1 = box
+    wide = (x1 - x0) >= (y1 - y0)
+    best = None
+    for side_by_side in (True, False):
+        lo, hi = (x0, x1) if side_by_side else (y0, y1)
+        for position, first, second in _cuts(windows, side_by_side):
+            ratio = 2 * (position - lo) / (hi - lo)
+            score = (side_by_side != wide, round(abs(ratio - 1), 3))
+            if best is None or score < best[0]:
+                best = (score, side_by_side, position, first, second)
+    if best is None:
+        return None
+    _, side_by_side, position, first, second = best
+    if side_by_side:
+        boxes = ((x0, y0, position, y1), (position, y0, x1, y1))
+    else:
+        boxes = ((x0, y0, x1, position), (x0, position, x1, y1))
+    a, b = build_tree(first, boxes[0]), build_tree(second, boxes[1])
+    if a is None or b is None:
+        return None
+    return Node(box, children=(a, b), side_by_side=side_by_side, windows=windows)
+
 
+def solve(tree: Node) -> tuple[list[tuple[str, float]], int]:
+    """
+    Split ratios that make every top-row column equally wide.
 
-def get_top_row(workspace_id: int) -> list[Window]:
-    """Get windows at the topmost Y position, sorted by X."""
-    windows = get_all_tiled(workspace_id)
+    Returns ``(ops, fixed)``: ``ops`` pairs a window address with the exact
+    ratio for its parent node (what ``splitratio exact`` sets), ``fixed``
+    counts side-by-side nodes without a window child, whose ratio cannot be
+    addressed and is kept (their subtrees are balanced around it).
+    """
+    ops: list[tuple[str, float]] = []
+    fixed = 0
+
+    def visit(node: Node, x0: float, x1: float, left: float, right: float) -> None:
+        nonlocal fixed
+        if node.children is None:
+            return
+        first, second = node.children
+        if not node.side_by_side:
+            visit(first, x0, x1, left, right)
+            visit(second, x0, x1, left, right)
+            return
+        gap = second.left - first.right
+        leaf = next((child for child in node.children if child.window), None)
+        if leaf is None:
+            fixed += 1
+            ratio = node.ratio
+        else:
+            n, k = node.columns(), first.columns()
+            width = (right - left - (n - 1) * gap) / n
+            cut = left + k * width + (k - 1) * gap + gap / 2
+            ratio = min(1.9, max(0.1, 2 * (cut - x0) / (x1 - x0)))
+            if abs(ratio - node.ratio) > 0.001:
+                ops.append((leaf.window.address, round(ratio, 4)))
+        cut = x0 + ratio * (x1 - x0) / 2
+        visit(first, x0, cut, left, cut - gap / 2)
+        visit(second, cut, x1, cut + gap / 2, right)
+
+    visit(tree, tree.box[0], tree.box[2], tree.left, tree.right)
+    return ops, fixed
+
+
+def batch_commands(ops: list[tuple[str, float]], focus: str | None) -> list[str]:
+    commands = []
+    for address, ratio in ops:
+        commands.append(f"dispatch focuswindow address:{address}")
+        commands.append(f"dispatch splitratio exact {ratio}")
+    if commands and focus:
+        commands.append(f"dispatch focuswindow address:{focus}")
+    return commands
+
+
+def column_target(columns: list[Window]) -> int:
+    """Equal column width for the span the top row covers."""
+    span = columns[-1].x + columns[-1].width - columns[0].x
+    gaps = sum(b.x - (a.x + a.width) for a, b in pairwise(columns))
+    return (span - gaps) // len(columns)
+
+
+def top_row(windows: dict[str, Window]) -> list[Window]:
+    """Windows at the topmost Y position, sorted by X."""
     if not windows:
         return []
-    min_y = min(w.y for w in windows)
-    top = [w for w in windows if abs(w.y - min_y) <= 50]
+    min_y = min(w.y for w in windows.values())
+    top = [w for w in windows.values() if abs(w.y - min_y) <= 50]
     top.sort(key=lambda w: w.x)
     return top
 
 
-def get_window(workspace_id: int, address: str) -> Window | None:
-    """Get current state of a window by address."""
-    for c in hyprctl_json(["clients"]):
-        if c["address"] == address and c["workspace"]["id"] == workspace_id:
-            return Window(
-                c["address"], c["at"][0], c["at"][1], c["size"][0], c["size"][1]
-            )
-    return None
-
-
-def try_resize(workspace_id: int, address: str, target: int, step: int = 100) -> bool:
+def try_resize(
+    hypr: Hyprland,
+    workspace_id: int,
+    windows: dict[str, Window],
+    address: str,
+    target: int,
+    step: int = 100,
+) -> dict[str, Window] | None:
     """
     Attempt to resize a window toward target width.
 
     The resize direction depends on window position in the layout, so we
     try positive delta first, check if it moved correctly, and if not,
-    undo and try negative delta.
+    undo and apply the negative delta in one dispatch.
 
-    Returns True if resize moved in the correct direction.
+    Returns the post-resize snapshot if the window moved in the correct
+    direction, otherwise None.
     """
-    w = get_window(workspace_id, address)
+    w = windows.get(address)
     if not w:
-        return False
+        return None
 
     current = w.width
     if abs(current - target) < 30:
-        return False  # Already close enough
+        return None  # Already close enough
 
     need_shrink = current > target
     need_grow = current < target
+    selector = f"address:{address}"
+
+    def moved_correctly(after: dict[str, Window]) -> bool:
+        w_after = after.get(address)
+        if not w_after:
+            return False
+        return (need_shrink and w_after.width < current) or (
+            need_grow and w_after.width > current
+        )
+
+    hypr.dispatch("resizewindowpixel", f"{step} 0,{selector}")
+    after = snapshot(hypr, workspace_id)
+    if moved_correctly(after):
+        return after
+
+    w_after = after.get(address)
+    if w_after and w_after.width != current:
+        # Wrong direction - undo and go the other way in one step
+        hypr.dispatch("resizewindowpixel", f"{-2 * step} 0,{selector}")
+        after = snapshot(hypr, workspace_id)
+        if moved_correctly(after):
+            return after
 
-    # Focus window
-    hyprctl(["dispatch", "focuswindow", f"address:{address}"])
-    time.sleep(0.01)
-
-    # Try positive delta first
-    hyprctl(["dispatch", "resizeactive", "--", str(step), "0"])
-    time.sleep(0.01)
-
-    w_after = get_window(workspace_id, address)
-    if not w_after:
-        return False
-
-    grew = w_after.width > current
-    shrank = w_after.width < current
-
-    if (need_shrink and shrank) or (need_grow and grew):
-        return True  # Correct direction
-
-    if grew or shrank:
-        # Wrong direction - undo and try negative
-        hyprctl(["dispatch", "resizeactive", "--", str(-step), "0"])
-        time.sleep(0.01)
-
-        hyprctl(["dispatch", "resizeactive", "--", str(-step), "0"])
-        time.sleep(0.01)
-
-        w_after2 = get_window(workspace_id, address)
-        if w_after2:
-            grew2 = w_after2.width > current
-            shrank2 = w_after2.width < current
-            if (need_shrink and shrank2) or (need_grow and grew2):
-                return True
-
-    return False
-
-
-def main():
-    workspace_id = hyprctl_json(["activeworkspace"])["id"]
-    monitors = hyprctl_json(["monitors"])
-
-    monitor_width = monitors[0]["width"]
-    for m in monitors:
-        if m.get("activeWorkspace", {}).get("id") == workspace_id:
-            monitor_width = m["width"]
-            break
+    return None
 
-    original_focus = hyprctl_json(["activewindow"]).get("address")
 
-    # Configuration
-    GAPS = 10
-    TOLERANCE = 80
+def refine(
+    hypr: Hyprland,
+    events: Events,
+    workspace_id: int,
+    windows: dict[str, Window],
+    tolerance: int,
+) -> tuple[dict[str, Window], list[str], int]:
+    """Greedy resize loop; returns the final snapshot, columns and target."""
     MAX_ITER = 60
     STEP = 150
 
-    print(f"Monitor: {monitor_width}px | Workspace: {workspace_id}")
-
-    columns = get_top_row(workspace_id)
-    n = len(columns)
-
-    if n <= 1:
-        print("Need ≥2 columns to balance")
-        return
-
-    target = (monitor_width - GAPS * (n + 1)) // n
-    col_addresses = [c.address for c in columns]
-
-    print(f"\nColumns: {n} | Target: {target}px")
-    print(f"Initial: {[c.width for c in columns]}")
-
+    col_addresses = [c.address for c in top_row(windows)]
+    target = column_target(top_row(windows))
+    n = len(col_addresses)
     history: deque[tuple] = deque(maxlen=15)
 
     for iteration in range(1, MAX_ITER + 1):
-        widths = []
-        for addr in col_addresses:
-            w = get_window(workspace_id, addr)
-            widths.append(w.width if w else 0)
+        if events.layout_changed():
+            windows = snapshot(hypr, workspace_id)
+            columns = top_row(windows)
+            col_addresses = [c.address for c in columns]
+            n = len(col_addresses)
+            if n <= 1:
+                print("\n⚠ Layout changed; fewer than 2 columns left")
+                break
+            target = column_target(columns)
+            history.clear()
+            print(f"\nLayout changed | Columns: {n} | Target: {target}px")
+
+        widths = [
+            windows[addr].width if addr in windows else 0 for addr in col_addresses
+        ]
 
         state = tuple(widths)
         max_dev = max(abs(w - target) for w in widths)
@@ -184,7 +417,7 @@ def main():
         if iteration <= 10 or iteration % 10 == 0:
             print(f"[{iteration:2d}] {widths} max_dev={max_dev}")
 
-        if all(abs(w - target) <= TOLERANCE for w in widths):
+        if all(abs(w - target) <= tolerance for w in widths):
             print(f"\n✓ Balanced in {iteration} iterations!")
             break
 
@@ -193,36 +426,85 @@ def main():
             break
         history.append(state)
 
-        # Find most deviated column
-        best_i = -1
-        best_dev = 0
-        for i in range(n):
-            dev = abs(widths[i] - target)
-            if dev > best_dev and dev > TOLERANCE:
-                best_dev = dev
-                best_i = i
+        # Most deviated columns first
+        candidates = sorted(
+            ((i, abs(widths[i] - target)) for i in range(n)),
+            key=lambda x: -x[1],
+        )
+        resized = None
+        for idx, dev in candidates:
+            if dev <= tolerance:
+                break
+            resized = try_resize(
+                hypr, workspace_id, windows, col_addresses[idx], target, STEP
+            )
+            if resized is not None:
+                break
+        if resized is None:
+            # Nothing moved the right way; refresh once in case the layout
+            # shifted under us, and let the history check end the run.
+            resized = snapshot(hypr, workspace_id)
+        windows = resized
+
+    return windows, col_addresses, target
 
-        if best_i < 0:
-            break
 
-        # Try to resize
-        success = try_resize(workspace_id, col_addresses[best_i], target, STEP)
-        if not success:
-            # Try next most deviated column
-            candidates = sorted(
-                [(i, abs(widths[i] - target)) for i in range(n) if i != best_i],
-                key=lambda x: -x[1],
+def main():
+    directory = instance_dir()
+    hypr = Hyprland(directory)
+    with Events(directory) as events:
+        workspace_id = hypr.json("activeworkspace")["id"]
+        monitors = hypr.json("monitors")
+
+        monitor = monitors[0]
+        for m in monitors:
+            if m.get("activeWorkspace", {}).get("id") == workspace_id:
+                monitor = m
+                break
+
+        # Configuration
+        TOLERANCE = 80
+
+        print(f"Monitor: {monitor['width']}px | Workspace: {workspace_id}")
+
+        windows = snapshot(hypr, workspace_id)
+        columns = top_row(windows)
+        n = len(columns)
+
+        if n <= 1:
+            print("Need ≥2 columns to balance")
+            return
+
+        target = column_target(columns)
+        col_addresses = [c.address for c in columns]
+
+        print(f"\nColumns: {n} | Target: {target}px")
+        print(f"Initial: {[c.width for c in columns]}")
+
+        layout = hypr.json("getoption general:layout").get("str")
+        tree = build_tree(list(windows.values()), layout_box(monitor))
+        if layout != "dwindle" or tree is None:
+            print(f"\nCannot model the {layout} layout; resizing iteratively")
+        else:
+            ops, fixed = solve(tree)
+            focus = hypr.json("activewindow").get("address")
+            commands = batch_commands(ops, focus)
+            if commands and not hypr.batch(commands):
+                print("\n⚠ Hyprland rejected part of the split-ratio batch")
+            windows = snapshot(hypr, workspace_id)
+            print(f"Solved: {len(ops)} split ratio(s) in one batch", end="")
+            print(f", {fixed} node(s) without a window child kept" if fixed else "")
+
+        widths = [
+            windows[addr].width if addr in windows else 0 for addr in col_addresses
+        ]
+        if not all(abs(w - target) <= TOLERANCE for w in widths):
+            windows, col_addresses, target = refine(
+                hypr, events, workspace_id, windows, TOLERANCE
             )
-            for idx, dev in candidates:
-                if dev > TOLERANCE:
-                    if try_resize(workspace_id, col_addresses[idx], target, STEP):
-                        break
 
     # Final output
-    widths = []
-    for addr in col_addresses:
-        w = get_window(workspace_id, addr)
-        widths.append(w.width if w else 0)
+    widths = [windows[addr].width if addr in windows else 0 for addr in col_addresses]
 
     print(f"\n{'=' * 50}")
     print(f"Target: {target}")
@@ -235,9 +517,6 @@ def main():
     else:
         print("⚠ Tree constraints prevented full balance")
 
-    if original_focus:
-        hyprctl(["dispatch", "focuswindow", f"address:{original_focus}"])
-
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,167 @@
+"""Offline tests for the dwindle solver in hypr-balance-all.py.
+
+Fixtures under fixtures/hypr-balance/ are recorded `hyprctl -j` outputs
+(`activeworkspace`, `monitors`, `clients`) with gaps_in=5, gaps_out=10.
+"""
+
+import importlib.util
+import json
+import socket
+import tempfile
+from pathlib import Path
+
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parents[1]
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "hypr-balance"
+GAPS_IN, GAPS_OUT = 5, 10
+
+_spec = importlib.util.spec_from_file_location(
+    "hypr_balance_all", SCRIPTS / "hypr-balance-all.py"
+)
+balance = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(balance)
+
+
+def _load(name: str):
+    data = json.loads((FIXTURES / f"{name}.json").read_text())
+    workspace_id = data["activeworkspace"]["id"]
+    windows = balance.parse_clients(data["clients"], workspace_id)
+    box = balance.layout_box(data["monitors"][0])
+    tree = balance.build_tree(list(windows.values()), box)
+    assert tree is not None
+    return windows, tree
+
+
+def _parents(node, parents=None):
+    parents = {} if parents is None else parents
+    for child in node.children or ():
+        if child.window is not None:
+            parents[child.window.address] = node
+        _parents(child, parents)
+    return parents
+
+
+def _apply(tree, ops):
+    """Lay the tree out like dwindle would after ``splitratio exact`` ops."""
+    parents = _parents(tree)
+    ratios = {id(parents[address]): ratio for address, ratio in ops}
+    root = tree.box
+    widths = {}
+
+    def visit(node, box):
+        x0, y0, x1, y1 = box
+        if node.children is None:
+            left = GAPS_OUT if x0 == root[0] else GAPS_IN
+            right = GAPS_OUT if x1 == root[2] else GAPS_IN
+            widths[node.window.address] = x1 - x0 - left - right
+            return
+        ratio = ratios.get(id(node), node.ratio)
+        if node.side_by_side:
+            cut = x0 + (x1 - x0) * ratio / 2
+            boxes = (x0, y0, cut, y1), (cut, y0, x1, y1)
+        else:
+            cut = y0 + (y1 - y0) * ratio / 2
+            boxes = (x0, y0, x1, cut), (x0, cut, x1, y1)
+        visit(node.children[0], boxes[0])
+        visit(node.children[1], boxes[1])
+
+    visit(tree, root)
+    return widths
+
+
+def test_parse_clients_skips_floating_and_other_workspaces() -> None:
+    windows, _ = _load("three-columns")
+    assert sorted(windows) == ["0x5a1", "0x5a2", "0x5a3"]
+
+
+def test_three_column_spiral_solves_in_two_ratios() -> None:
+    _, tree = _load("three-columns")
+
+    assert tree.side_by_side and tree.children[0].window.address == "0x5a1"
+    assert tree.columns() == 3
+    ops, fixed = balance.solve(tree)
+
+    assert fixed == 0
+    assert ops == [("0x5a1", 0.6684), ("0x5a2", 0.9961)]
+    assert balance.batch_commands(ops, "0x5a3") == [
+        "dispatch focuswindow address:0x5a1",
+        "dispatch splitratio exact 0.6684",
+        "dispatch focuswindow address:0x5a2",
+        "dispatch splitratio exact 0.9961",
+        "dispatch focuswindow address:0x5a3",
+    ]
+
+
+@pytest.mark.parametrize("name", ["three-columns", "ultrawide-stack", "six-columns"])
+def test_solution_equalizes_top_row(name: str) -> None:
+    windows, tree = _load(name)
+    columns = balance.top_row(windows)
+    before = [window.width for window in columns]
+    assert max(before) - min(before) > 100
+
+    ops, fixed = balance.solve(tree)
+    widths = _apply(tree, ops)
+    after = [widths[window.address] for window in columns]
+
+    assert fixed == 0
+    assert max(after) - min(after) < 2
+    assert abs(after[0] - balance.column_target(columns)) < 2
+
+
+def test_stacked_column_counts_once() -> None:
+    _, tree = _load("ultrawide-stack")
+
+    assert tree.columns() == 4
+    ops, _ = balance.solve(tree)
+    widths = _apply(tree, ops)
+    # Both windows of the stacked column share its width.
+    assert widths["0x7a4"] == pytest.approx(widths["0x7a5"])
+
+
+def test_node_without_window_child_is_kept() -> None:
+    _, tree = _load("grid")
+
+    assert tree.side_by_side
+    assert all(child.window is None for child in tree.children)
+    assert balance.solve(tree) == ([], 1)
+
+
+class _FakeHyprland:
+    def __init__(self, replies):
+        self.replies = replies
+
+    def json(self, command: str):
+        reply = self.replies[command]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+@pytest.mark.parametrize("broken", [False, True])
+def test_main_closes_event_socket(monkeypatch, broken: bool) -> None:
+    # AF_UNIX paths are limited to ~104 bytes, so avoid pytest's deep tmp_path.
+    with tempfile.TemporaryDirectory(prefix="hypr-") as tmp:
+        directory = Path(tmp)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(directory / ".socket2.sock"))
+            server.listen(1)
+            replies = {
+                "activeworkspace": {"id": 1},
+                "monitors": [{"width": 1920, "height": 1080}],
+                # No tiled windows: main returns early ("Need ≥2 columns").
+                "clients": RuntimeError("socket gone") if broken else [],
+            }
+            monkeypatch.setattr(balance, "instance_dir", lambda: directory)
+            monkeypatch.setattr(balance, "Hyprland", lambda _: _FakeHyprland(replies))
+
+            if broken:
+                with pytest.raises(RuntimeError):
+                    balance.main()
+            else:
+                balance.main()
+
+            connection, _ = server.accept()
+            with connection:
+                connection.settimeout(2)
+                assert connection.recv(1) == b""  # the client end was closed
@@ -0,0 +1,95 @@
+"""Time the color engine on 10k generated theme palettes.
+
+    python benchmarks/palettes.py [--themes N] [--repeat R]
+
+Each theme has 20 colors (16 ANSI plus foreground/background/cursor/accent),
+so the default run pushes 200k colors through every batch operation, then
+compiles 10k full theme palettes the way `load_theme_metadata` does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from themectl import color
+from themectl.palette import compile_palettes
+from themectl.themes import Theme
+
+KEYS = ("foreground", "background", "cursor", "accent") + tuple(
+    f"color{index}" for index in range(16)
+)
+
+
+def generate(count: int, seed: int = 1) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    return [
+        {key: f"#{rng.randrange(1 << 24):06x}" for key in KEYS} for _ in range(count)
+    ]
+
+
+def best_of(repeat: int, run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--themes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    palettes = generate(args.themes)
+    values = [value for palette in palettes for value in palette.values()]
+    # Parse once untimed for the format benchmarks; "parse" below is cold.
+    colors = [c for c in color.parse(values) if c is not None]
+    foregrounds = colors[0::2]
+    backgrounds = colors[1::2]
+    themes = [
+        Theme(
+            name=f"Theme {index}",
+            slug=f"bench-{index}",
+            display_name=f"Theme {index}",
+            wallpapers=[],
+            raw={"kitty": palette, "hyprland": {"activeBorder": palette["accent"]}},
+        )
+        for index, palette in enumerate(palettes)
+    ]
+
+    def cold_parse() -> object:
+        color._parse.cache_clear()
+        return color.parse(values)
+
+    def cold_oklab_variants() -> object:
+        color._oklab.cache_clear()
+        return color.adjust_lightness(colors, 0.08)
+
+    cases: list[tuple[str, Callable[[], object]]] = [
+        ("parse (cold)", cold_parse),
+        ("parse (memoized)", lambda: color.parse(values)),
+        ("to_hex", lambda: color.to_hex(colors)),
+        ("to_hyprland", lambda: color.to_hyprland(colors)),
+        ("to_css", lambda: color.to_css(colors)),
+        ("contrast", lambda: color.contrast(foregrounds, backgrounds)),
+        ("composite", lambda: color.composite(foregrounds, backgrounds)),
+        ("adjust_lightness (cold)", cold_oklab_variants),
+        ("compile_palettes", lambda: compile_palettes(themes)),
+    ]
+    print(f"{args.themes} themes, {len(colors)} colors, best of {args.repeat}")
+    for name, run in cases:
+        seconds = best_of(args.repeat, run)
+        print(f"  {name:<24} {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
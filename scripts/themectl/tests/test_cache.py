@@ -0,0 +1,64 @@
+import json
+import os
+from pathlib import Path
+
+from themectl import themes
+from themectl.cache import cache_dir
+from themectl.themes import ThemeRepository, load_theme_metadata
+
+
+def _write_metadata(path: Path, names: list[str]) -> None:
+    path.write_text(json.dumps({"themes": [{"name": name} for name in names]}))
+
+
+def test_theme_metadata_snapshot_skips_json_on_hit(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("THEMECTL_HOME", str(tmp_path))
+    metadata = tmp_path / "themes.json"
+    _write_metadata(metadata, ["Tokyo Night", "Nord"])
+
+    first = load_theme_metadata(metadata)
+    assert (cache_dir() / "themes.pickle").exists()
+
+    def fail_parse(path: Path) -> ThemeRepository:
+        raise AssertionError("metadata should come from the snapshot")
+
+    monkeypatch.setattr(themes, "_parse_theme_metadata", fail_parse)
+    second = load_theme_metadata(metadata)
+
+    assert [theme.slug for theme in second] == [theme.slug for theme in first]
+    assert second.get("tokyo night") is not None
+    assert second.get("nord").display_name == "Nord"
+
+
+def test_theme_metadata_snapshot_invalidates_on_change(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("THEMECTL_HOME", str(tmp_path))
+    metadata = tmp_path / "themes.json"
+    _write_metadata(metadata, ["Nord"])
+    assert [theme.slug for theme in load_theme_metadata(metadata)] == ["nord"]
+
+    _write_metadata(metadata, ["Nord", "Kanagawa"])
+    stat = metadata.stat()
+    os.utime(metadata, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert [theme.slug for theme in load_theme_metadata(metadata)] == [
+        "kanagawa",
+        "nord",
+    ]
+
+
+def test_theme_metadata_snapshot_ignores_corrupt_cache(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("THEMECTL_HOME", str(tmp_path))
+    metadata = tmp_path / "themes.json"
+    _write_metadata(metadata, ["Nord"])
+    snapshot = cache_dir() / "themes.pickle"
+    snapshot.parent.mkdir(parents=True)
+    snapshot.write_bytes(b"not a pickle")
+
+    repo = load_theme_metadata(metadata)
+
+    assert repo.get("nord") is not None
+    assert snapshot.read_bytes() != b"not a pickle"
@@ -1,6 +1,8 @@
 import json
+import shutil
 import textwrap
 from pathlib import Path
+from types import SimpleNamespace
 
 from typer.testing import CliRunner
 
@@ -524,6 +526,8 @@ def test_doctor_linux_passes_with_walker_assets(tmp_path: Path, monkeypatch) ->
     doctor_result = runner.invoke(app, ["doctor", "--config", str(cfg)])
     assert doctor_result.exit_code == 0
     assert "All checks passed" in doctor_result.output
+    assert "Wallpaper materialization" in doctor_result.output
+    assert "hyprctl" in doctor_result.output
 
 
 def test_hotkeys_command_linux_platform(tmp_path: Path, monkeypatch) -> None:
@@ -600,3 +604,264 @@ def test_sync_assets_preserves_symlink_targets(tmp_path: Path, monkeypatch) -> N
     new_dest = themes_root / "symlink-theme"
     assert new_dest.is_dir()
     assert not new_dest.is_symlink()
+
+
+def test_sync_assets_is_incremental(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    first = tmp_path / "first.png"
+    first.write_text("first")
+    second = tmp_path / "second.png"
+    second.write_text("second")
+    entry = _basic_theme_entry(slug="inc-theme", wallpaper=first)
+    entry["wallpapers"] = [str(first), str(second)]
+    metadata = _write_metadata_file(home, entry)
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg = _write_config(home, metadata, state)
+    theme_dir = home / ".config" / "omarchy" / "themes" / "inc-theme"
+
+    result = runner.invoke(app, ["sync-assets", "--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "0 unchanged" in result.output
+    stray = theme_dir / "leftover.conf"
+    stray.write_text("stale")
+    kitty_mtime = (theme_dir / "kitty.conf").stat().st_mtime_ns
+
+    result = runner.invoke(app, ["sync-assets", "--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "0 changed" in result.output
+    assert "1 removed" in result.output
+    assert not stray.exists()
+    assert (theme_dir / "kitty.conf").stat().st_mtime_ns == kitty_mtime
+
+    entry["hyprland"]["activeBorder"] = "rgba(ff0000ff)"
+    entry["wallpapers"] = [str(first)]
+    _write_metadata_file(home, entry)
+    result = runner.invoke(app, ["sync-assets", "--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "1 changed" in result.output
+    assert "1 removed" in result.output
+    assert "ff0000ff" in (theme_dir / "hyprland.conf").read_text()
+    assert not (theme_dir / "backgrounds" / "second.png").exists()
+    assert (theme_dir / "kitty.conf").stat().st_mtime_ns == kitty_mtime
+
+    result = runner.invoke(app, ["sync-assets", "--config", str(cfg), "--force"])
+    assert result.exit_code == 0
+    assert "0 unchanged" in result.output
+
+
+def test_sync_assets_prunes_dropped_themes(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    metadata = _write_metadata_file(home, _basic_theme_entry(slug="old-theme"))
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg = _write_config(home, metadata, state)
+    themes_root = home / ".config" / "omarchy" / "themes"
+    handmade = themes_root / "handmade"
+    handmade.mkdir(parents=True)
+
+    assert runner.invoke(app, ["sync-assets", "--config", str(cfg)]).exit_code == 0
+    _write_metadata_file(home, _basic_theme_entry(slug="new-theme"))
+    assert runner.invoke(app, ["sync-assets", "--config", str(cfg)]).exit_code == 0
+
+    assert not (themes_root / "old-theme").exists()
+    assert (themes_root / "new-theme" / "kitty.conf").exists()
+    assert handmade.is_dir()
+
+
+def test_sync_assets_parallel_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    entries = []
+    for idx in range(6):
+        wallpaper = tmp_path / f"wall-{idx}.png"
+        wallpaper.write_text(f"wallpaper {idx}")
+        entry = _basic_theme_entry(slug=f"theme-{idx}", wallpaper=wallpaper)
+        entry["wallpapers"] = [str(wallpaper), str(tmp_path / f"missing-{idx}.png")]
+        entries.append(entry)
+    metadata = home / "themes.json"
+    metadata.write_text(json.dumps({"themes": entries}))
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg = _write_config(home, metadata, state)
+    themes_root = home / ".config" / "omarchy" / "themes"
+
+    def snapshot() -> dict[str, bytes]:
+        return {
+            path.relative_to(themes_root).as_posix(): path.read_bytes()
+            for path in sorted(themes_root.rglob("*"))
+            # Manifests record write mtimes, so only outputs are compared.
+            if path.is_file() and path.name != ".themectl-manifest.json"
+        }
+
+    serial = runner.invoke(app, ["sync-assets", "--config", str(cfg), "--jobs", "1"])
+    assert serial.exit_code == 0
+    serial_files = snapshot()
+
+    shutil.rmtree(themes_root)
+    parallel = runner.invoke(app, ["sync-assets", "--config", str(cfg), "-j", "4"])
+    assert parallel.exit_code == 0
+
+    assert parallel.output == serial.output
+    assert snapshot() == serial_files
+
+
+def test_sync_assets_targets_and_platform(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    wallpaper = tmp_path / "wall.png"
+    wallpaper.write_text("png")
+    entry = _basic_theme_entry(slug="target-theme", wallpaper=wallpaper)
+    entry["wallpapers"] = [str(wallpaper)]
+    metadata = _write_metadata_file(home, entry)
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg = _write_config(home, metadata, state)
+    theme_dir = home / ".config" / "omarchy" / "themes" / "target-theme"
+
+    result = runner.invoke(
+        app, ["sync-assets", "--config", str(cfg), "--targets", "kitty,ghostty"]
+    )
+    assert result.exit_code == 0
+    assert sorted(
+        p.name for p in theme_dir.iterdir() if not p.name.startswith(".")
+    ) == [
+        "ghostty.conf",
+        "kitty.conf",
+    ]
+
+    assert runner.invoke(app, ["sync-assets", "--config", str(cfg)]).exit_code == 0
+    assert (theme_dir / "walker.css").exists()
+
+    entry["kitty"]["background"] = "#222222"
+    _write_metadata_file(home, entry)
+    result = runner.invoke(app, ["sync-assets", "--config", str(cfg), "-t", "kitty"])
+    assert result.exit_code == 0
+    assert "1 changed, 0 unchanged, 0 removed" in result.output
+    assert (theme_dir / "walker.css").exists()
+
+    result = runner.invoke(
+        app, ["sync-assets", "--config", str(cfg), "--platform", "darwin"]
+    )
+    assert result.exit_code == 0
+    for linux_only in ("hyprland.conf", "waybar.css", "walker.css", "hyprlock.conf"):
+        assert not (theme_dir / linux_only).exists()
+    assert (theme_dir / "kitty.conf").exists()
+    assert (theme_dir / "backgrounds" / "wall.png").exists()
+
+
+def test_sync_assets_rejects_unknown_target(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    metadata = _write_metadata_file(home, _basic_theme_entry())
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg = _write_config(home, metadata, state)
+
+    result = runner.invoke(app, ["sync-assets", "--config", str(cfg), "-t", "emacs"])
+    assert result.exit_code == 1
+    assert "Unknown sync target" in result.output
+
+
+def test_sync_assets_uses_registered_renderers(tmp_path: Path, monkeypatch) -> None:
+    from themectl import assets
+
+    monkeypatch.setattr(assets, "RENDERERS", dict(assets.RENDERERS))
+    assets.register_renderer("foot", "foot.ini", sections=("kitty",))(
+        lambda theme: f"background={theme.section('kitty')['background']}"
+    )
+    home = _setup_home(tmp_path, monkeypatch)
+    metadata = _write_metadata_file(home, _basic_theme_entry(slug="foot-theme"))
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg = _write_config(home, metadata, state)
+
+    result = runner.invoke(app, ["sync-assets", "--config", str(cfg), "-t", "foot"])
+    assert result.exit_code == 0
+    foot = home / ".config" / "omarchy" / "themes" / "foot-theme" / "foot.ini"
+    assert foot.read_text() == "background=#000000\n"
+
+
+def test_config_explain_reports_sources(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    metadata = _write_metadata_file(home, _basic_theme_entry())
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg = _write_config(home, metadata, state, platform="linux")
+    automation = _write_automation_yaml(
+        home,
+        """
+        editor:
+          vscode: false
+        """,
+    )
+
+    result = runner.invoke(
+        app, ["config", "--config", str(cfg), "--explain"], env={"COLUMNS": "400"}
+    )
+    assert result.exit_code == 0
+    lines = {
+        line.split()[0]: line for line in result.output.splitlines() if line.strip()
+    }
+    assert str(automation) in lines["editor.vscode"]
+    assert "False" in lines["editor.vscode"]
+    assert str(cfg) in lines["platform"]
+    assert "default" in lines["editor.neovim"]
+
+
+def test_config_snapshot_skips_yaml_on_hit(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    metadata = _write_metadata_file(home, _basic_theme_entry())
+    state = home / ".config" / "themes" / ".current-theme"
+    cfg_path = _write_config(home, metadata, state)
+    automation = _write_automation_yaml(home, "editor:\n  cursor: false\n")
+
+    assert load_config(cfg_path).editor_automation.cursor is False
+
+    def fail(*args, **kwargs):
+        raise AssertionError("automation.yaml should come from the snapshot")
+
+    monkeypatch.setattr("themectl.config._load_automation_overrides", fail)
+    assert load_config(cfg_path).editor_automation.cursor is False
+
+    monkeypatch.undo()
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+    automation.write_text("editor:\n  cursor: true\n  neovim: false\n")
+    reloaded = load_config(cfg_path)
+    assert reloaded.editor_automation.cursor is True
+    assert reloaded.editor_automation.neovim is False
+
+
+def test_pick_feeds_walker_and_applies_choice(tmp_path: Path, monkeypatch) -> None:
+    home = _setup_home(tmp_path, monkeypatch)
+    metadata = home / "themes.json"
+    metadata.write_text(
+        json.dumps(
+            {
+                "themes": [
+                    {"name": "Nord", "slug": "nord"},
+                    {"name": "Rose Pine", "slug": "rose-pine"},
+                    {"name": "Tokyo Night", "slug": "tokyo-night"},
+                ]
+            }
+        )
+    )
+    for slug in ("nord", "tokyo-night"):  # rose-pine was never synced
+        (home / ".config" / "omarchy" / "themes" / slug).mkdir(parents=True)
+    state = home / ".config" / "themes" / ".current-theme"
+    state.parent.mkdir(parents=True)
+    state.write_text("tokyo-night\n")
+    cfg = _write_config(home, metadata, state, platform="linux")
+
+    monkeypatch.setattr("themectl.cli.run_reload_hooks", lambda *args, **kwargs: None)
+    monkeypatch.setattr("themectl.tools.which", lambda name: f"/usr/bin/{name}")
+    calls = []
+    picks = iter(["", "Nord\n"])
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs.get("input")))
+        return SimpleNamespace(returncode=0, stdout=next(picks), stderr="")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+
+    cancelled = runner.invoke(app, ["pick", "--config", str(cfg)])
+    assert cancelled.exit_code == 0, cancelled.output
+    assert state.read_text().strip() == "tokyo-night"
+
+    result = runner.invoke(app, ["pick", "--config", str(cfg)])
+    assert result.exit_code == 0, result.output
+    assert calls[-1] == (
+        ["/usr/bin/walker", "--dmenu", "-p", "Theme", "-c", "1"],
+        "Nord\nTokyo Night\n",
+    )
+    assert state.read_text().strip() == "nord"
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from themectl import color
+from themectl.color import Color, parse_color
+from themectl.palette import compile_palette, compile_palettes
+from themectl.themes import Theme
+
+
+def _random_themes(count: int, seed: int = 7) -> list[Theme]:
+    rng = random.Random(seed)
+
+    def hex_color() -> str:
+        return f"#{rng.randrange(1 << 24):06x}"
+
+    themes = []
+    for index in range(count):
+        raw = {
+            "name": f"Theme {index}",
+            "hyprland": {"activeBorder": f"rgba({rng.randrange(1 << 32):08x})"},
+            "alacritty": {
+                "primary": {"background": hex_color(), "foreground": hex_color()},
+                "normal": {name: hex_color() for name in ("red", "green", "blue")},
+            },
+            "kitty": {f"color{slot}": hex_color() for slot in range(16)},
+        }
+        themes.append(
+            Theme(
+                name=raw["name"],
+                slug=f"theme-{index}",
+                display_name=raw["name"],
+                wallpapers=[],
+                raw=raw,
+            )
+        )
+    return themes
+
+
+def test_batch_formats() -> None:
+    colors = color.parse(["#ff8000", "rgba(33ccffee)", "0x80102030", "nope"])
+    assert colors[3] is None
+    parsed = [c for c in colors if c is not None]
+
+    assert color.to_hex(parsed) == ["#ff8000", "#33ccff", "#102030"]
+    assert color.to_hyprland(parsed) == [
+        "rgba(ff8000ff)",
+        "rgba(33ccffee)",
+        "rgba(10203080)",
+    ]
+    assert color.to_argb(parsed) == ["0xffff8000", "0xee33ccff", "0x80102030"]
+    assert color.to_css(parsed[:1]) == ["rgba(255,128,0,1.0)"]
+    assert color.to_hsl(parsed[:1])[0] == pytest.approx((30.117, 1.0, 0.5), 1e-3)
+
+
+def test_oklab_round_trip_and_variants() -> None:
+    samples = color.parse(["#000000", "#ffffff", "#7aa2f7", "#d20f39", "#40a02b"])
+
+    assert color.from_oklab(color.to_oklab(samples)) == [
+        Color(c.hex, c.rgb) for c in samples
+    ]
+    white_lab = color.to_oklab(samples[1:2])[0]
+    assert white_lab == pytest.approx((1.0, 0.0, 0.0), abs=1e-4)
+
+    dim = color.adjust_lightness(samples[2:], -0.1)
+    bright = color.adjust_lightness(samples[2:], 0.1)
+    for lum_dim, lum, lum_bright in zip(
+        color.luminance(dim), color.luminance(samples[2:]), color.luminance(bright)
+    ):
+        assert lum_dim < lum < lum_bright
+
+    assert color.most_chromatic(samples) == samples[3]
+
+
+def test_composite_and_contrast() -> None:
+    half_white = parse_color("#ffffff80")
+    black = parse_color("#000000")
+
+    blended = color.composite([half_white], [black])[0]
+    assert blended.rgb == (128, 128, 128)
+    assert blended.alpha == 1.0
+    assert color.contrast([black, half_white], [half_white, black]) == pytest.approx(
+        [21.0, 21.0]
+    )
+    with pytest.raises(ValueError):
+        color.contrast([black], [])
+
+
+def test_batch_compile_matches_per_theme_compile() -> None:
+    themes = _random_themes(200)
+
+    batched = compile_palettes(themes)
+
+    for theme, palette in zip(themes[::37], batched[::37]):
+        single = compile_palette(theme)
+        assert palette == single
+        assert palette.colors["kitty.color4"].source == theme.raw["kitty"]["color4"]
@@ -0,0 +1,263 @@
+import json
+import os
+import tempfile
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+from themectl import client, environment
+from themectl.daemon import ThemectlDaemon
+from themectl.executor import Job, run_jobs
+
+
+def _setup(tmp_path: Path, monkeypatch) -> tuple[Path, Path]:
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+    metadata = home / "themes.json"
+    metadata.write_text(
+        json.dumps(
+            {
+                "themes": [
+                    {"name": "Nord", "slug": "nord"},
+                    {"name": "Tokyo Night", "slug": "tokyo-night"},
+                ]
+            }
+        )
+    )
+    for slug in ("nord", "tokyo-night"):
+        (home / ".config" / "omarchy" / "themes" / slug).mkdir(parents=True)
+    state = home / ".config" / "themes" / ".current-theme"
+    config = home / ".config" / "themectl" / "config.toml"
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text(
+        textwrap.dedent(
+            f"""
+            platform = "linux"
+            theme_metadata = "{metadata}"
+            state_file = "{state}"
+            """
+        ).strip()
+    )
+    monkeypatch.setattr("themectl.cli.run_reload_hooks", lambda *args, **kwargs: None)
+    return home, state
+
+
+@pytest.fixture
+def daemon_socket():
+    # AF_UNIX paths are limited to ~104 bytes, so avoid pytest's deep tmp_path.
+    with tempfile.TemporaryDirectory(prefix="themectl-") as tmp:
+        yield Path(tmp) / "themectl.sock"
+
+
+def _start(path: Path) -> tuple[ThemectlDaemon, threading.Thread]:
+    server = ThemectlDaemon(path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def _stop(server: ThemectlDaemon, thread: threading.Thread) -> None:
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def test_parse_request_forwards_supported_commands() -> None:
+    assert client.parse_request(["cycle", "-d", "prev"]) == {
+        "command": "cycle",
+        "args": {"direction": "prev"},
+        "config": None,
+    }
+    assert client.parse_request(["apply", "nord"])["args"] == {"theme": "nord"}
+    assert client.parse_request(["cycle-background", "--direction=next"])["args"] == {
+        "direction": "next"
+    }
+
+
+def test_parse_request_rejects_unsupported_arguments() -> None:
+    assert client.parse_request(["status"]) is None
+    assert client.parse_request(["apply"]) is None
+    assert client.parse_request(["cycle", "--help"]) is None
+    assert client.parse_request(["cycle", "--direction"]) is None
+
+
+def test_daemon_cycles_and_applies(tmp_path: Path, monkeypatch, daemon_socket) -> None:
+    home, state = _setup(tmp_path, monkeypatch)
+    server, thread = _start(daemon_socket)
+    try:
+        response = client.send_request(
+            {"command": "cycle", "args": {"direction": "next"}}, daemon_socket
+        )
+        assert response is not None
+        assert response["exit_code"] == 0
+        assert "Cycled" in response["output"]
+        assert state.read_text() == "tokyo-night"
+
+        response = client.send_request(
+            {"command": "apply", "args": {"theme": "nord"}}, daemon_socket
+        )
+        assert response is not None
+        assert response["exit_code"] == 0
+        assert state.read_text() == "nord"
+        assert (home / ".config" / "omarchy" / "current" / "theme").is_symlink()
+
+        response = client.send_request(
+            {"command": "apply", "args": {"theme": "missing"}}, daemon_socket
+        )
+        assert response is not None
+        assert response["exit_code"] == 1
+        assert "not found" in response["output"]
+    finally:
+        _stop(server, thread)
+    assert not daemon_socket.exists()
+
+
+def test_daemon_reloads_when_metadata_changes(
+    tmp_path: Path, monkeypatch, daemon_socket
+) -> None:
+    home, state = _setup(tmp_path, monkeypatch)
+    server, thread = _start(daemon_socket)
+    try:
+        metadata = home / "themes.json"
+        metadata.write_text(json.dumps({"themes": [{"name": "Kanagawa"}]}))
+        (home / ".config" / "omarchy" / "themes" / "kanagawa").mkdir()
+        response = client.send_request(
+            {"command": "apply", "args": {"theme": "kanagawa"}}, daemon_socket
+        )
+        assert response is not None
+        assert response["exit_code"] == 0
+        assert state.read_text() == "kanagawa"
+    finally:
+        _stop(server, thread)
+
+
+def test_client_main_prints_daemon_output(
+    tmp_path: Path, monkeypatch, daemon_socket, capsys
+) -> None:
+    _setup(tmp_path, monkeypatch)
+    monkeypatch.setenv("THEMECTL_SOCKET", str(daemon_socket))
+    server, thread = _start(daemon_socket)
+    try:
+        assert client.main(["cycle"]) == 0
+    finally:
+        _stop(server, thread)
+    assert "Cycled" in capsys.readouterr().out
+
+
+def test_daemon_runs_hooks_in_the_callers_environment(
+    tmp_path: Path, monkeypatch, daemon_socket
+) -> None:
+    _setup(tmp_path, monkeypatch)
+    monkeypatch.setenv("TMUX", "/tmp/daemon-tmux,1,0")
+    monkeypatch.delenv("HYPRLAND_INSTANCE_SIGNATURE", raising=False)
+    seen: list[tuple[str | None, str | None]] = []
+    monkeypatch.setattr(
+        "themectl.cli.run_reload_hooks",
+        lambda *args: seen.append(
+            (environment.get("TMUX"), environment.get("HYPRLAND_INSTANCE_SIGNATURE"))
+        ),
+    )
+    server, thread = _start(daemon_socket)
+    try:
+        # The caller's session: its own Hyprland instance and no tmux.
+        request = {"command": "apply", "args": {"theme": "nord"}}
+        caller = {**request, "env": {"HYPRLAND_INSTANCE_SIGNATURE": "caller"}}
+        assert client.send_request(caller, daemon_socket)["exit_code"] == 0
+        # Requests from older clients keep the daemon's environment.
+        assert client.send_request(request, daemon_socket)["exit_code"] == 0
+    finally:
+        _stop(server, thread)
+
+    assert seen == [(None, "caller"), ("/tmp/daemon-tmux,1,0", None)]
+    assert os.environ.get("TMUX") == "/tmp/daemon-tmux,1,0"
+    assert "HYPRLAND_INSTANCE_SIGNATURE" not in os.environ
+
+
+def test_timed_out_hook_keeps_the_callers_environment(
+    tmp_path: Path, monkeypatch, daemon_socket
+) -> None:
+    _setup(tmp_path, monkeypatch)
+    monkeypatch.setenv("TMUX", "/tmp/daemon-tmux,1,0")
+    release, recorded = threading.Event(), threading.Event()
+    seen: list[str | None] = []
+
+    def slow_hook(out) -> None:
+        release.wait(30)
+        env = environment.subprocess_env() or {}
+        seen.append(env.get("TMUX"))
+        recorded.set()
+
+    def run_reload_hooks(*args) -> None:
+        run_jobs([Job("slow", slow_hook)], args[-1], timeout=0.05)
+
+    monkeypatch.setattr("themectl.cli.run_reload_hooks", run_reload_hooks)
+    server, thread = _start(daemon_socket)
+    try:
+        request = {"command": "apply", "args": {"theme": "nord"}}
+        caller = {**request, "env": {"TMUX": "/tmp/caller-tmux,1,0"}}
+        response = client.send_request(caller, daemon_socket)
+        assert "timed out" in response["output"]
+        # The next request runs under another caller's environment.
+        other = {**request, "env": {"TMUX": "/tmp/other-tmux,1,0"}}
+        client.send_request(other, daemon_socket)
+        release.set()
+        assert recorded.wait(10)
+    finally:
+        release.set()
+        _stop(server, thread)
+
+    assert seen[0] == "/tmp/caller-tmux,1,0"
+    assert os.environ["TMUX"] == "/tmp/daemon-tmux,1,0"
+
+
+def test_client_sends_its_environment(monkeypatch) -> None:
+    sent: list[dict] = []
+    monkeypatch.setattr(
+        client, "send_request", lambda request: sent.append(request) or {}
+    )
+    monkeypatch.setenv("TMUX", "/tmp/tmux-1000/default,1,0")
+    monkeypatch.setenv("EDITOR", "x")
+
+    client.main(["cycle"])
+
+    assert sent[0]["env"]["TMUX"] == "/tmp/tmux-1000/default,1,0"
+    assert set(sent[0]["env"]) <= set(client.FORWARDED_ENV)
+
+
+def test_client_runs_traced_commands_in_process(
+    tmp_path: Path, monkeypatch, daemon_socket
+) -> None:
+    _setup(tmp_path, monkeypatch)
+    monkeypatch.setenv("THEMECTL_SOCKET", str(daemon_socket))
+    monkeypatch.setenv("THEMECTL_TRACE", str(tmp_path / "trace.json"))
+    monkeypatch.setattr(client, "send_request", lambda *args: pytest.fail("sent"))
+
+    assert client.main(["cycle"]) == 0
+    assert (tmp_path / "trace.json").exists()
+
+
+def test_client_falls_back_without_daemon(
+    tmp_path: Path, monkeypatch, daemon_socket, capsys
+) -> None:
+    _, state = _setup(tmp_path, monkeypatch)
+    monkeypatch.setenv("THEMECTL_SOCKET", str(daemon_socket))
+
+    assert client.main(["apply", "nord"]) == 0
+    assert state.read_text() == "nord"
+    assert "Applied" in capsys.readouterr().out
+
+
+def test_daemon_refuses_to_replace_live_socket(
+    tmp_path: Path, monkeypatch, daemon_socket
+) -> None:
+    _setup(tmp_path, monkeypatch)
+    server, thread = _start(daemon_socket)
+    try:
+        with pytest.raises(RuntimeError):
+            ThemectlDaemon(daemon_socket)
+    finally:
+        _stop(server, thread)
@@ -0,0 +1,136 @@
+import threading
+import time
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from themectl.executor import Job, run_jobs
+
+
+def _console() -> Console:
+    return Console(file=StringIO(), record=True, width=120)
+
+
+def test_run_jobs_overlaps_independent_hooks() -> None:
+    # Every job waits for all four to be running at once; without overlap the
+    # barrier times out and the job fails instead of printing.
+    barrier = threading.Barrier(4)
+    timed_out: list[str] = []
+
+    def meet(label: str):
+        def action(out: Console) -> None:
+            try:
+                barrier.wait(timeout=10)
+            except threading.BrokenBarrierError:
+                timed_out.append(label)
+                raise
+            out.print(f"{label} done")
+
+        return action
+
+    jobs = [Job(label, meet(label)) for label in ("a", "b", "c", "d")]
+    console = _console()
+
+    states = run_jobs(jobs, console, workers=4, timeout=30)
+
+    assert timed_out == []
+    assert set(states.values()) == {"done"}
+    assert console.export_text().split() == [
+        "a",
+        "done",
+        "b",
+        "done",
+        "c",
+        "done",
+        "d",
+        "done",
+    ]
+
+
+def test_run_jobs_prints_in_declaration_order() -> None:
+    release = threading.Event()
+
+    def first(out: Console) -> None:
+        release.wait(2)
+        out.print("first")
+
+    def second(out: Console) -> None:
+        out.print("second")
+        release.set()
+
+    console = _console()
+    run_jobs([Job("first", first), Job("second", second)], console, timeout=5)
+
+    assert console.export_text().splitlines() == ["first", "second"]
+
+
+def test_run_jobs_respects_ordering_edges() -> None:
+    events: list[str] = []
+
+    def update(out: Console) -> None:
+        time.sleep(0.1)
+        events.append("update")
+
+    def reload(out: Console) -> None:
+        events.append("reload")
+
+    run_jobs(
+        [Job("update", update), Job("reload", reload, after=("update",))],
+        _console(),
+        timeout=5,
+    )
+
+    assert events == ["update", "reload"]
+
+
+def test_run_jobs_times_out_and_skips_dependents() -> None:
+    stuck, finished = threading.Event(), threading.Event()
+
+    def hang(out: Console) -> None:
+        stuck.wait(30)
+        finished.set()
+
+    def dependent(out: Console) -> None:
+        raise AssertionError("dependent of a timed out hook must not run")
+
+    console = _console()
+    states = run_jobs(
+        [
+            Job("hang", hang),
+            Job("after-hang", dependent, after=("hang",)),
+            Job("quick", lambda out: out.print("quick ran")),
+        ],
+        console,
+        timeout=0.2,
+    )
+    # run_jobs returned while the hung hook was still blocked.
+    assert not finished.is_set()
+    stuck.set()
+
+    assert states == {"hang": "timeout", "after-hang": "skipped", "quick": "done"}
+    output = console.export_text()
+    assert "hang automation timed out" in output
+    assert "after-hang skipped" in output
+    assert output.index("timed out") < output.index("quick ran")
+
+
+def test_run_jobs_reports_failures() -> None:
+    def broken(out: Console) -> None:
+        raise RuntimeError("boom")
+
+    console = _console()
+    states = run_jobs([Job("broken", broken)], console, timeout=5)
+
+    assert states == {"broken": "failed"}
+    output = console.export_text()
+    assert "broken automation failed" in output
+    assert "boom" in output
+
+
+def test_run_jobs_rejects_forward_edges() -> None:
+    with pytest.raises(ValueError):
+        run_jobs(
+            [Job("reload", lambda out: None, after=("update",)), Job("update", print)],
+            _console(),
+        )
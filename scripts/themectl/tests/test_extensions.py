@@ -0,0 +1,143 @@
+import json
+import os
+import textwrap
+from io import StringIO
+from pathlib import Path
+
+from rich.console import Console
+from typer.testing import CliRunner
+
+from themectl import extensions
+from themectl.cli import app
+from themectl.hooks import _ensure_extension_installed
+
+runner = CliRunner()
+
+
+class Result:
+    returncode = 0
+    stdout = ""
+    stderr = ""
+
+
+def _inventory(home: Path, editor: str, ids: list[str]) -> Path:
+    path = home / extensions.EXTENSION_DIRS[editor] / "extensions.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            [
+                {"identifier": {"id": ext, "uuid": "x"}, "version": "1.0.0"}
+                for ext in ids
+            ]
+        )
+    )
+    return path
+
+
+def _setup(tmp_path: Path, monkeypatch) -> tuple[Path, list[list[str]]]:
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        assert "--list-extensions" not in cmd, "inventory should come from disk"
+        calls.append(cmd)
+        return Result()
+
+    monkeypatch.setattr("themectl.extensions.subprocess.run", fake_run)
+    monkeypatch.setattr("themectl.extensions.which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr("themectl.tools.which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr("themectl.hooks.which", lambda name: f"/usr/bin/{name}")
+    return home, calls
+
+
+def test_inventory_is_cached_until_extensions_json_changes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    home, _ = _setup(tmp_path, monkeypatch)
+    inventory = _inventory(
+        home, "code", ["enkia.tokyo-night", "arcticicestudio.nord-visual-studio-code"]
+    )
+
+    assert extensions.missing_extensions("code", ["Enkia.Tokyo-Night"]) == []
+
+    parse = extensions._parse_inventory
+
+    def no_parse(path: Path):
+        raise AssertionError("unchanged extensions.json should not be re-read")
+
+    monkeypatch.setattr(extensions, "_parse_inventory", no_parse)
+    assert extensions.missing_extensions("code", ["catppuccin.catppuccin-vsc"]) == [
+        "catppuccin.catppuccin-vsc"
+    ]
+
+    monkeypatch.setattr(extensions, "_parse_inventory", parse)
+    _inventory(home, "code", ["catppuccin.catppuccin-vsc"])
+    os.utime(inventory, ns=(1, 1))
+    assert extensions.missing_extensions("code", ["catppuccin.catppuccin-vsc"]) == []
+
+
+def test_hook_installs_only_missing_extension(tmp_path: Path, monkeypatch) -> None:
+    home, calls = _setup(tmp_path, monkeypatch)
+    _inventory(home, "cursor", ["enkia.tokyo-night"])
+    console = Console(file=StringIO(), record=True)
+
+    _ensure_extension_installed("cursor", "enkia.tokyo-night", console, "Cursor")
+    assert calls == []
+
+    _ensure_extension_installed("cursor", "sainnhe.everforest", console, "Cursor")
+    assert calls == [["/usr/bin/cursor", "--install-extension", "sainnhe.everforest"]]
+    assert "Installed Cursor extension" in console.export_text()
+
+
+def test_install_extensions_batches_missing_ids(tmp_path: Path, monkeypatch) -> None:
+    home, calls = _setup(tmp_path, monkeypatch)
+    _inventory(home, "code", ["enkia.tokyo-night"])
+    _inventory(home, "cursor", [])
+    themes = [
+        {"name": "Tokyo Night", "vscode": {"extension": "enkia.tokyo-night"}},
+        {
+            "name": "Nord",
+            "vscode": {"extension": "arcticicestudio.nord-visual-studio-code"},
+        },
+        {
+            "name": "Everforest",
+            "vscode": {"extension": "sainnhe.everforest"},
+            "cursor": {"extension": ""},
+        },
+    ]
+    metadata = home / "themes.json"
+    metadata.write_text(json.dumps({"themes": themes}))
+    config = home / ".config" / "themectl" / "config.toml"
+    config.parent.mkdir(parents=True)
+    config.write_text(
+        textwrap.dedent(
+            f"""
+            platform = "linux"
+            theme_metadata = "{metadata}"
+            state_file = "{home / ".current-theme"}"
+            """
+        ).strip()
+    )
+
+    result = runner.invoke(app, ["install-extensions", "--config", str(config)])
+
+    assert result.exit_code == 0, result.output
+    assert calls == [
+        [
+            "/usr/bin/code",
+            "--install-extension",
+            "sainnhe.everforest",
+            "--install-extension",
+            "arcticicestudio.nord-visual-studio-code",
+        ],
+        [
+            "/usr/bin/cursor",
+            "--install-extension",
+            "arcticicestudio.nord-visual-studio-code",
+            "--install-extension",
+            "enkia.tokyo-night",
+        ],
+    ]
@@ -1,7 +1,10 @@
-import json
+import socket
+import tempfile
+import threading
 from io import StringIO
 from pathlib import Path
 
+import pytest
 from rich.console import Console
 
 from themectl.hooks import (
@@ -26,8 +29,9 @@ def test_update_editor_settings_handles_comments(tmp_path: Path) -> None:
     changed = _update_editor_settings([settings], "Tokyo Night", _console(), "VSCode")
 
     assert changed is True
-    data = json.loads(settings.read_text())
-    assert data["workbench.colorTheme"] == "Tokyo Night"
+    assert settings.read_text() == (
+        '// comment\n{"someKey": true,\n  "workbench.colorTheme": "Tokyo Night"}'
+    )
 
 
 def test_update_neovim_theme_file_rewrites_colorscheme(
@@ -67,7 +71,7 @@ def test_update_tmux_config_generates_file(tmp_path: Path, monkeypatch) -> None:
         },
     )
 
-    monkeypatch.setattr("themectl.hooks.shutil.which", lambda _: None)
+    monkeypatch.setattr("themectl.hooks.which", lambda _: None)
 
     _update_tmux_config(theme, _console())
 
@@ -91,7 +95,7 @@ def test_reload_alacritty_touches_config(tmp_path: Path, monkeypatch) -> None:
             return f"/usr/bin/{name}"
         return None
 
-    monkeypatch.setattr("themectl.hooks.shutil.which", fake_which)
+    monkeypatch.setattr("themectl.hooks.which", fake_which)
 
     calls: list[list[str]] = []
 
@@ -112,6 +116,34 @@ def test_reload_alacritty_touches_config(tmp_path: Path, monkeypatch) -> None:
     assert "Reloaded Alacritty config" in console.export_text()
 
 
+def test_desktop_automation_runs_one_at_a_time(tmp_path: Path, monkeypatch) -> None:
+    from themectl import hooks
+
+    config = tmp_path / ".config" / "alacritty" / "alacritty.toml"
+    config.parent.mkdir(parents=True)
+    config.write_text("# test config")
+    monkeypatch.setattr("themectl.hooks.get_home", lambda: tmp_path)
+    monkeypatch.setattr("themectl.hooks.which", lambda name: f"/usr/bin/{name}")
+    held: list[tuple[str, bool]] = []
+
+    class Result:
+        returncode = 0
+        stderr = ""
+
+    def fake_run(cmd, **kwargs):
+        held.append((Path(cmd[0]).name, hooks._desktop_lock.locked()))
+        return Result()
+
+    monkeypatch.setattr("themectl.hooks.subprocess.run", fake_run)
+
+    # Alacritty's sudo touch and the AppleScript hooks share one lock, so
+    # they never overlap even though their jobs run concurrently.
+    reload_alacritty(_console())
+    assert hooks._run_osascript(hooks.GHOSTTY_SCRIPT, [])
+    assert held == [("sudo", True), ("osascript", True)]
+    assert not hooks._desktop_lock.locked()
+
+
 def test_reload_alacritty_skips_when_no_config(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setattr("themectl.hooks.get_home", lambda: tmp_path)
 
@@ -129,7 +161,7 @@ def test_reload_hyprland_discovers_signature(tmp_path: Path, monkeypatch) -> Non
     monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
     monkeypatch.setenv("HYPRLAND_INSTANCE_SIGNATURE", "")
     monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Linux")
-    monkeypatch.setattr("themectl.hooks.shutil.which", lambda _: "/usr/bin/hyprctl")
+    monkeypatch.setattr("themectl.hooks.which", lambda _: "/usr/bin/hyprctl")
 
     calls: list[list[str]] = []
 
@@ -156,7 +188,7 @@ def test_reload_hyprland_skips_when_unavailable(monkeypatch) -> None:
     monkeypatch.delenv("HYPRLAND_INSTANCE_SIGNATURE", raising=False)
     monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
     monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Linux")
-    monkeypatch.setattr("themectl.hooks.shutil.which", lambda _: "/usr/bin/hyprctl")
+    monkeypatch.setattr("themectl.hooks.which", lambda _: "/usr/bin/hyprctl")
 
     console = _console()
     reload_hyprland(console)
@@ -165,6 +197,98 @@ def test_reload_hyprland_skips_when_unavailable(monkeypatch) -> None:
     assert "signature unavailable" in output
 
 
+def _hypr_stub(runtime: Path, signature: str, reply: bytes) -> tuple:
+    instance = runtime / "hypr" / signature
+    instance.mkdir(parents=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(instance / ".socket.sock"))
+    server.listen(1)
+    received: list[bytes] = []
+
+    def serve() -> None:
+        conn, _ = server.accept()
+        with conn:
+            received.append(conn.recv(65536))
+            conn.sendall(reply)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return server, thread, received
+
+
+def _border_theme() -> Theme:
+    return Theme(
+        name="Tokyo Night",
+        slug="tokyo-night",
+        display_name="Tokyo Night",
+        wallpapers=[],
+        raw={
+            "hyprland": {
+                "activeBorder": "rgba(33ccffee) rgba(00ff99ee) 45deg",
+                "inactiveBorder": "rgba(595959aa)",
+            }
+        },
+    )
+
+
+@pytest.mark.parametrize("reply", [b"ok\n\nok", b"okok", b"okok\n"])
+def test_reload_hyprland_batches_keywords_over_ipc(reply: bytes, monkeypatch) -> None:
+    # AF_UNIX paths are limited to ~104 bytes, so avoid pytest's deep tmp_path.
+    with tempfile.TemporaryDirectory(prefix="hy-") as tmp:
+        runtime = Path(tmp)
+        server, thread, received = _hypr_stub(runtime, "sig", reply)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+        monkeypatch.setenv("HYPRLAND_INSTANCE_SIGNATURE", "sig")
+        monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Linux")
+
+        def no_hyprctl(cmd, **kwargs):
+            raise AssertionError("hyprctl reload should not run")
+
+        monkeypatch.setattr("themectl.hooks.subprocess.run", no_hyprctl)
+
+        console = _console()
+        reload_hyprland(console, _border_theme())
+        thread.join(5)
+        server.close()
+
+    assert received == [
+        b"[[BATCH]]keyword general:col.active_border "
+        b"rgba(33ccffee) rgba(00ff99ee) 45deg;"
+        b"keyword general:col.inactive_border rgba(595959aa)"
+    ]
+    assert "via IPC (2 keyword(s))" in console.export_text()
+
+
+def test_reload_hyprland_falls_back_when_keyword_rejected(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory(prefix="hy-") as tmp:
+        runtime = Path(tmp)
+        server, thread, _ = _hypr_stub(runtime, "sig", b"ok\n\ninvalid value")
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+        monkeypatch.setenv("HYPRLAND_INSTANCE_SIGNATURE", "sig")
+        monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Linux")
+        monkeypatch.setattr("themectl.hooks.which", lambda _: "/bin/hyprctl")
+        calls: list[list[str]] = []
+
+        class Result:
+            returncode = 0
+            stderr = ""
+
+        monkeypatch.setattr(
+            "themectl.hooks.subprocess.run",
+            lambda cmd, **kwargs: calls.append(cmd) or Result(),
+        )
+
+        console = _console()
+        reload_hyprland(console, _border_theme())
+        thread.join(5)
+        server.close()
+
+    assert calls == [["/bin/hyprctl", "-i", "sig", "reload"]]
+    output = console.export_text()
+    assert "invalid value" in output
+    assert "Reloaded Hyprland config" in output
+
+
 def test_update_wallpaper_runs_swww(tmp_path: Path, monkeypatch) -> None:
     home = tmp_path / "home"
     background = home / ".config" / "omarchy" / "current" / "background"
@@ -173,7 +297,7 @@ def test_update_wallpaper_runs_swww(tmp_path: Path, monkeypatch) -> None:
 
     monkeypatch.setenv("THEMECTL_HOME", str(home))
     monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Linux")
-    monkeypatch.setattr("themectl.hooks.shutil.which", lambda _: "/usr/bin/swww")
+    monkeypatch.setattr("themectl.hooks.which", lambda _: "/usr/bin/swww")
 
     calls: list[list[str]] = []
 
@@ -207,7 +331,7 @@ def test_update_wallpaper_macos_prefers_desktoppr(tmp_path: Path, monkeypatch) -
     monkeypatch.setenv("THEMECTL_HOME", str(home))
     monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Darwin")
     monkeypatch.setattr(
-        "themectl.hooks.shutil.which",
+        "themectl.hooks.which",
         lambda name: "/usr/local/bin/desktoppr" if name == "desktoppr" else None,
     )
 
@@ -246,7 +370,7 @@ def test_update_wallpaper_macos_uses_osascript(tmp_path: Path, monkeypatch) -> N
 
     monkeypatch.setenv("THEMECTL_HOME", str(home))
     monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Darwin")
-    monkeypatch.setattr("themectl.hooks.shutil.which", lambda name: None)
+    monkeypatch.setattr("themectl.hooks.which", lambda name: None)
 
     captured: dict[str, list[str]] = {}
 
@@ -287,7 +411,7 @@ def test_update_wallpaper_macos_fallback_defaults(tmp_path: Path, monkeypatch) -
             return "/usr/bin/defaults"
         return None
 
-    monkeypatch.setattr("themectl.hooks.shutil.which", fake_which)
+    monkeypatch.setattr("themectl.hooks.which", fake_which)
 
     calls: list[list[str]] = []
 
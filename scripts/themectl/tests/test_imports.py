@@ -0,0 +1,118 @@
+"""Cold-start import budget for hotkey-driven commands."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Everything `themectl cycle` may import before and while it runs. Growing this
+# set slows every keypress; justify additions in review.
+CYCLE_THEMECTL_MODULES = {
+    "themectl",
+    "themectl.cache",
+    "themectl.cli",
+    # Theme metadata snapshots carry compiled palettes (ThemePalette, Color).
+    "themectl.color",
+    "themectl.config",
+    # The caller's environment for hooks served by the daemon.
+    "themectl.environment",
+    "themectl.executor",
+    "themectl.hooks",
+    "themectl.palette",
+    # run_reload_hooks resets both before any hook runs.
+    "themectl.processes",
+    "themectl.state",
+    "themectl.themes",
+    "themectl.tools",
+    "themectl.trace",
+}
+
+NEVER_ON_HOT_PATH = {
+    "yaml",
+    "rich.table",
+    "themectl.assets",
+    "themectl.daemon",
+    "themectl.hotkeys",
+    "themectl.macos",
+}
+
+
+def _imported_modules(code: str, env: dict[str, str] | None = None) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT), **(env or {})},
+    )
+    assert result.returncode == 0, result.stderr
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        name = line.rsplit("|", 1)[-1].strip()
+        if name and name != "package":
+            modules.add(name)
+    return modules
+
+
+def _themectl_modules(modules: set[str]) -> set[str]:
+    return {name for name in modules if name.split(".")[0] == "themectl"}
+
+
+def test_cli_module_import_is_minimal() -> None:
+    modules = _imported_modules("import themectl.cli")
+
+    assert _themectl_modules(modules) == CYCLE_THEMECTL_MODULES - {
+        "themectl.environment",
+        "themectl.executor",
+        "themectl.hooks",
+        "themectl.processes",
+        "themectl.tools",
+    }
+    assert not modules & NEVER_ON_HOT_PATH
+
+
+def _cycle_fixture(home: Path) -> str:
+    (home / ".config" / "omarchy" / "themes" / "nord").mkdir(parents=True)
+    metadata = home / "themes.json"
+    metadata.write_text(json.dumps({"themes": [{"name": "Nord", "slug": "nord"}]}))
+    config = home / "config.toml"
+    config.write_text(
+        f'platform = "linux"\ntheme_metadata = "{metadata}"\n'
+        f'state_file = "{home / ".current-theme"}"\n'
+    )
+    # Hooks are stubbed after import so the run never touches the live desktop.
+    return textwrap.dedent(
+        f"""
+        import themectl.hooks as hooks
+        hooks.run_reload_hooks = lambda *args, **kwargs: None
+        from themectl.cli import app
+        app(["cycle", "--config", {str(config)!r}], standalone_mode=False)
+        """
+    )
+
+
+def test_cycle_cold_start_import_budget(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    code = _cycle_fixture(home)
+    modules = _imported_modules(code, {"THEMECTL_HOME": str(home)})
+
+    assert _themectl_modules(modules) == CYCLE_THEMECTL_MODULES
+    assert not modules & NEVER_ON_HOT_PATH
+
+
+def test_cycle_steady_state_skips_yaml(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    code = _cycle_fixture(home)
+    automation = home / ".config" / "themectl" / "automation.yaml"
+    automation.parent.mkdir(parents=True, exist_ok=True)
+    automation.write_text("editor:\n  vscode: false\n")
+    env = {"THEMECTL_HOME": str(home)}
+
+    assert "yaml" in _imported_modules(code, env)
+    assert "yaml" not in _imported_modules(code, env)
@@ -0,0 +1,84 @@
+import os
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from themectl.hooks import _update_editor_settings
+from themectl.jsonc import root_members, set_member
+
+SETTINGS = """\
+/* Managed by hand; keep the comments. */
+{
+    // Fonts
+    "editor.fontFamily": "JetBrains Mono, monospace",
+    "editor.rulers": [80, /* soft */ 100],
+    "workbench.colorTheme": "Nord", // set by themectl
+    "files.exclude": {"**/.git": true, "url": "http://example.com//x"},
+}
+"""
+
+
+def test_replaces_only_the_value_bytes() -> None:
+    updated = set_member(SETTINGS, "workbench.colorTheme", "Tokyo Night")
+
+    assert updated == SETTINGS.replace('"Nord"', '"Tokyo Night"')
+
+
+def test_unchanged_value_returns_same_text() -> None:
+    assert set_member(SETTINGS, "workbench.colorTheme", "Nord") is SETTINGS
+
+
+def test_members_skip_comments_and_nested_values() -> None:
+    members = root_members(SETTINGS)
+
+    assert [member.key for member in members] == [
+        "editor.fontFamily",
+        "editor.rulers",
+        "workbench.colorTheme",
+        "files.exclude",
+    ]
+    assert members[-1].comma_end is not None
+
+
+def test_appends_missing_key_after_trailing_comma() -> None:
+    text = '{\n\t"a": 1,\n}\n'
+
+    assert set_member(text, "workbench.colorTheme", "Nord") == (
+        '{\n\t"a": 1,\n\t"workbench.colorTheme": "Nord",\n}\n'
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", '{\n  "k": "v"\n}\n'),
+        ("// only a comment", '// only a comment\n{\n  "k": "v"\n}\n'),
+        ("{}", '{\n  "k": "v"\n}'),
+    ],
+)
+def test_empty_documents(text: str, expected: str) -> None:
+    assert set_member(text, "k", "v") == expected
+
+
+@pytest.mark.parametrize("text", ["[1, 2]", '{"a": 1 "b": 2}', '{"a": "x', "{/* x"])
+def test_malformed_documents_raise(text: str) -> None:
+    with pytest.raises(ValueError):
+        set_member(text, "k", "v")
+
+
+def test_editor_settings_skip_write_when_current(tmp_path: Path) -> None:
+    settings = tmp_path / "settings.json"
+    settings.write_text(SETTINGS)
+    os.utime(settings, ns=(1, 1))
+    console = Console(file=StringIO(), record=True)
+
+    assert not _update_editor_settings([settings], "Nord", console, "VSCode")
+    assert settings.stat().st_mtime_ns == 1
+
+    broken = tmp_path / "broken.json"
+    broken.write_text('{"a": ')
+    assert not _update_editor_settings([broken], "Nord", console, "VSCode")
+    assert broken.read_text() == '{"a": '
+    assert "Skipped VSCode settings" in console.export_text()
@@ -0,0 +1,79 @@
+import errno
+from pathlib import Path
+
+import pytest
+
+from themectl import materialize
+from themectl.materialize import Materializer, probe
+
+
+def _source(tmp_path: Path) -> Path:
+    source = tmp_path / "src" / "wall.png"
+    source.parent.mkdir()
+    source.write_bytes(b"png" * 1024)
+    return source
+
+
+def _refuse(source: Path, target: Path) -> None:
+    raise OSError(errno.EOPNOTSUPP, "refused")
+
+
+def test_same_filesystem_avoids_copying(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    target = tmp_path / "dest" / "wall.png"
+
+    strategy = Materializer().materialize(source, target)
+
+    assert strategy in ("reflink", "hardlink")
+    assert target.read_bytes() == source.read_bytes()
+    if strategy == "hardlink":
+        assert target.stat().st_ino == source.stat().st_ino
+    assert not list(target.parent.glob(".*"))
+
+
+def test_falls_back_to_copy_and_remembers_choice(tmp_path: Path, monkeypatch) -> None:
+    calls: list[str] = []
+
+    def refuse(name: str):
+        def strategy(source: Path, target: Path) -> None:
+            calls.append(name)
+            _refuse(source, target)
+
+        return strategy
+
+    monkeypatch.setitem(materialize._STRATEGY_FUNCS, "reflink", refuse("reflink"))
+    monkeypatch.setitem(materialize._STRATEGY_FUNCS, "hardlink", refuse("hardlink"))
+    source = _source(tmp_path)
+    materializer = Materializer()
+
+    # Not a store path, so the symlink strategy declines as well.
+    assert materializer.materialize(source, tmp_path / "a.png") == "copy"
+    assert materializer.materialize(source, tmp_path / "b.png") == "copy"
+
+    assert calls == ["reflink", "hardlink"]
+    assert (tmp_path / "b.png").read_bytes() == source.read_bytes()
+    assert (tmp_path / "b.png").stat().st_ino != source.stat().st_ino
+    assert materializer.used == {"copy"}
+
+
+def test_replaces_existing_target(tmp_path: Path) -> None:
+    source = _source(tmp_path)
+    target = tmp_path / "wall.png"
+    target.write_text("old")
+
+    Materializer("copy").materialize(source, target)
+
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_env_pins_strategy(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("THEMECTL_MATERIALIZE", "copy")
+    source = _source(tmp_path)
+
+    assert probe(source, tmp_path) == "copy"
+    assert not (tmp_path / ".themectl-probe").exists()
+
+
+def test_symlink_only_targets_store_paths(tmp_path: Path) -> None:
+    with pytest.raises(OSError):
+        Materializer("symlink").materialize(_source(tmp_path), tmp_path / "x.png")
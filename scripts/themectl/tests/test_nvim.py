@@ -0,0 +1,125 @@
+import socket
+import tempfile
+import threading
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from themectl import nvim
+from themectl.hooks import _reload_neovim_instances
+
+# [0, 1, "nvim_command", ["set background=dark | colorscheme nord"]]
+REQUEST = (
+    b"\x94\x00\x01\xacnvim_command\x91\xd9\x26set background=dark | colorscheme nord"
+)
+OK = b"\x94\x01\x01\xc0\xc0"
+# A notification ([2, "redraw", []]) arriving before the response is skipped.
+NOTIFY = b"\x93\x02\xa6redraw\x90"
+# [1, 1, [0, "E185: Cannot find color scheme"], nil]
+ERROR = b"\x94\x01\x01\x92\x00\xbeE185: Cannot find color scheme\xc0"
+
+
+@pytest.fixture
+def runtime_dir():
+    # AF_UNIX paths are limited to ~104 bytes, so avoid pytest's deep tmp_path.
+    with tempfile.TemporaryDirectory(prefix="nv-") as tmp:
+        yield Path(tmp)
+
+
+class FakeNvim:
+    """Accept one connection, record the request and answer with ``reply``."""
+
+    def __init__(self, path: Path, reply: bytes | None) -> None:
+        self.path = path
+        self.reply = reply
+        self.received = b""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(str(path))
+        self.sock.listen(1)
+        self.release = threading.Event()
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        conn, _ = self.sock.accept()
+        with conn:
+            while len(self.received) < len(REQUEST):
+                chunk = conn.recv(4096)
+                if not chunk:
+                    break
+                self.received += chunk
+            if self.reply is None:
+                self.release.wait(5)  # hang until the client gives up
+            else:
+                conn.sendall(self.reply)
+
+    def close(self) -> None:
+        self.release.set()
+        self.thread.join(5)
+        self.sock.close()
+
+
+def _stale_socket(path: Path) -> Path:
+    # Left behind by an exited instance: the file exists, nothing listens.
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(path))
+    sock.close()
+    return path
+
+
+def test_discover_sockets_linux_and_macos_layouts(runtime_dir: Path) -> None:
+    runtime, tmp = runtime_dir / "run", runtime_dir / "tmp"
+    nested = tmp / "nvim.me" / "Xa1"
+    nested.mkdir(parents=True)
+    runtime.mkdir()
+    linux = _stale_socket(runtime / "nvim.123.0")
+    macos = _stale_socket(nested / "nvim.456.0")
+    (runtime / "nvim.999.0").write_text("not a socket")
+    _stale_socket(runtime / "other.sock")
+
+    assert nvim.discover_sockets([runtime, tmp]) == [linux, macos]
+
+
+def test_reload_reports_each_outcome(runtime_dir: Path, monkeypatch) -> None:
+    servers = [
+        FakeNvim(runtime_dir / "nvim.1.0", NOTIFY + OK),
+        FakeNvim(runtime_dir / "nvim.2.0", ERROR),
+        FakeNvim(runtime_dir / "nvim.3.0", None),
+    ]
+    _stale_socket(runtime_dir / "nvim.4.0")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+    monkeypatch.setenv("TMPDIR", str(runtime_dir / "missing"))
+    monkeypatch.setattr(nvim, "RPC_TIMEOUT", 0.3)
+
+    def no_nvr(name):
+        raise AssertionError("nvr must not be used when sockets exist")
+
+    monkeypatch.setattr("themectl.hooks.which", no_nvr)
+    console = Console(file=StringIO(), record=True, width=200)
+    try:
+        _reload_neovim_instances("nord", console)
+    finally:
+        for server in servers:
+            server.close()
+
+    assert [server.received for server in servers] == [REQUEST] * 3
+    output = console.export_text()
+    assert "Reloaded Neovim theme on 1 instance(s)" in output
+    assert "Skipped 1 stale Neovim socket(s)" in output
+    assert "nvim.2.0: E185: Cannot find color scheme" in output
+    assert "nvim.3.0: no reply within 0.3s" in output
+
+
+def test_reload_falls_back_to_nvr_without_sockets(
+    runtime_dir: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+    monkeypatch.setenv("TMPDIR", str(runtime_dir))
+    monkeypatch.setattr("themectl.hooks.which", lambda name: None)
+    console = Console(file=StringIO(), record=True, width=200)
+
+    _reload_neovim_instances("nord", console)
+
+    assert "No Neovim sockets found" in console.export_text()
@@ -0,0 +1,123 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from themectl import palette, themes
+from themectl.color import contrast_ratio, parse_color
+
+
+def test_parse_color_forms() -> None:
+    assert parse_color("#fff").rgb == (255, 255, 255)
+    assert parse_color("#33ccff").hyprland == "rgba(33ccffff)"
+    hypr = parse_color("rgba(33ccffee)")
+    assert hypr.rgb == (0x33, 0xCC, 0xFF)
+    assert hypr.alpha == pytest.approx(0xEE / 255)
+    assert parse_color("0xee33ccff").hex == "#33ccff"
+    assert parse_color("#112233").css(0.8) == "rgba(17,34,51,0.8)"
+    assert parse_color("rgba(33ccffee) rgba(00ff99ee) 45deg") is None
+    assert parse_color("tokyonight_night") is None
+
+
+def test_contrast_ratio_matches_wcag() -> None:
+    black, white = parse_color("#000000"), parse_color("#ffffff")
+    assert contrast_ratio(black, white) == pytest.approx(21.0)
+    assert contrast_ratio(white, white) == pytest.approx(1.0)
+    assert contrast_ratio(parse_color("#777777"), white) == pytest.approx(4.48, 0.01)
+
+
+def test_metadata_snapshot_carries_palettes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("THEMECTL_HOME", str(tmp_path / "home"))
+    colors = tmp_path / "colors"
+    colors.mkdir()
+    toml = colors / "nord.toml"
+    toml.write_text('foreground = "#d8dee9"\nbackground = "#2e3440"\n')
+    monkeypatch.setattr(palette, "COLOR_DIRS", (colors,))
+    metadata = tmp_path / "themes.json"
+    metadata.write_text(
+        json.dumps(
+            {
+                "themes": [
+                    {
+                        "name": "Nord",
+                        "slug": "nord",
+                        "hyprland": {"activeBorder": "rgba(88c0d0ff)"},
+                        "alacritty": {"primary": {"background": "#2e3440"}},
+                    }
+                ]
+            }
+        )
+    )
+
+    nord = themes.load_theme_metadata(metadata).get("nord").palette
+    assert nord.value("hyprland.activeBorder", "") == "rgba(88c0d0ff)"
+    assert nord.color("alacritty.primary.background").rgb == (0x2E, 0x34, 0x40)
+    assert nord.toml() == {"foreground": "#d8dee9", "background": "#2e3440"}
+    assert nord.contrast[("foreground", "background")] == pytest.approx(9.25, 0.01)
+
+    compile_palettes = themes.compile_palettes
+
+    def no_compile(themes):
+        raise AssertionError("a current snapshot should not recompile palettes")
+
+    monkeypatch.setattr(themes, "compile_palettes", no_compile)
+    assert themes.load_theme_metadata(metadata).get("nord").palette == nord
+
+    monkeypatch.setattr(themes, "compile_palettes", compile_palettes)
+    toml.write_text('foreground = "#eceff4"\nbackground = "#2e3440"\n')
+    os.utime(toml, ns=(1, 1))
+    refreshed = themes.load_theme_metadata(metadata).get("nord").palette
+    assert refreshed.value("foreground", "") == "#eceff4"
+
+
+def test_hyprlock_skips_themes_with_alpha_colors() -> None:
+    from themectl.assets import _render_hyprlock
+
+    # The bundled Nord definition: innerColor carries an alpha byte.
+    hyprlock = {
+        "innerColor": "#2e3440cc",
+        "outerColor": "#d8dee9",
+        "fontColor": "#d8dee9",
+        "checkColor": "#88c0d0",
+    }
+    alacritty = {"primary": {"background": "#2e3440"}}
+    nord = themes.Theme(
+        name="Nord",
+        slug="nord",
+        display_name="Nord",
+        wallpapers=[],
+        raw={"hyprlock": hyprlock, "alacritty": alacritty},
+    )
+    assert _render_hyprlock(nord) == ""
+
+    opaque = themes.Theme(
+        name="Nord",
+        slug="nord",
+        display_name="Nord",
+        wallpapers=[],
+        raw={"hyprlock": {**hyprlock, "innerColor": "#2e3440"}, "alacritty": alacritty},
+    )
+    assert _render_hyprlock(opaque).splitlines()[1:3] == [
+        "$color = rgba(46,52,64,1.0)",
+        "$inner_color = rgba(46,52,64,0.8)",
+    ]
+
+
+def test_hyprlock_skips_themes_with_empty_colors() -> None:
+    from themectl.assets import _render_hyprlock
+
+    def theme(hyprlock: dict[str, str]) -> themes.Theme:
+        return themes.Theme(
+            name="Nord",
+            slug="nord",
+            display_name="Nord",
+            wallpapers=[],
+            raw={"hyprlock": hyprlock, "alacritty": {"primary": {"background": ""}}},
+        )
+
+    # An empty value is not a color; only a missing key falls back to the base.
+    assert _render_hyprlock(theme({"outerColor": "", "fontColor": "#d8dee9"})) == ""
+    assert _render_hyprlock(theme({"fontColor": "#d8dee9"})).splitlines()[1] == (
+        "$color = rgba(0,0,0,1.0)"
+    )
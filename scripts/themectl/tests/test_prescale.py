@@ -0,0 +1,215 @@
+import json
+import subprocess
+import textwrap
+from io import StringIO
+from pathlib import Path
+
+from rich.console import Console
+from typer.testing import CliRunner
+
+from themectl.cache import stat_signature
+from themectl.cli import app
+from themectl.hooks import _update_wallpaper_linux, update_wallpaper
+from themectl.prescale import Display, PrescaleIndex
+
+runner = CliRunner()
+
+
+class Result:
+    returncode = 0
+    stdout = ""
+    stderr = ""
+
+
+def _console() -> Console:
+    return Console(file=StringIO(), record=True, width=120)
+
+
+def _setup(tmp_path: Path, monkeypatch) -> tuple[Path, Path, list[list[str]]]:
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+    monkeypatch.setenv("THEMECTL_WALLPAPER_SIZES", "1280x800")
+    wall = tmp_path / "src" / "wall.png"
+    wall.parent.mkdir()
+    wall.write_text("full-size")
+    metadata = home / "themes.json"
+    metadata.write_text(
+        json.dumps({"themes": [{"name": "Nord", "wallpapers": [str(wall)]}]})
+    )
+    config = home / ".config" / "themectl" / "config.toml"
+    config.parent.mkdir(parents=True)
+    state = home / ".config" / "themes" / ".current-theme"
+    config.write_text(
+        textwrap.dedent(
+            f"""
+            platform = "linux"
+            theme_metadata = "{metadata}"
+            state_file = "{state}"
+            """
+        ).strip()
+    )
+
+    scaled: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        scaled.append(cmd)
+        Path(cmd[-1]).write_text("scaled")
+        return Result()
+
+    monkeypatch.setattr(
+        "themectl.prescale.which",
+        lambda name: "/usr/bin/magick" if name == "magick" else None,
+    )
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return home, config, scaled
+
+
+def test_sync_prescales_and_reuses_variants(tmp_path: Path, monkeypatch) -> None:
+    home, config, scaled = _setup(tmp_path, monkeypatch)
+
+    result = runner.invoke(app, ["sync-assets", "--config", str(config), "--prescale"])
+    assert result.exit_code == 0, result.output
+    assert "1280x800: 1 created, 0 reused" in result.output
+    assert "1280x800^" in scaled[0]
+    variants = list((home / ".cache" / "themectl" / "wallpapers").glob("*.png"))
+    assert [path.name.split("-")[-1] for path in variants] == ["1280x800.png"]
+
+    result = runner.invoke(app, ["sync-assets", "--config", str(config), "--prescale"])
+    assert "0 created, 1 reused" in result.output
+    assert len(scaled) == 1
+
+
+def test_update_wallpaper_uses_prescaled_variant(tmp_path: Path, monkeypatch) -> None:
+    home, config, _ = _setup(tmp_path, monkeypatch)
+    assert (
+        runner.invoke(
+            app, ["sync-assets", "--config", str(config), "--prescale"]
+        ).exit_code
+        == 0
+    )
+    current = home / ".config" / "omarchy" / "current" / "background"
+    current.parent.mkdir(parents=True)
+    current.symlink_to(
+        home / ".config" / "omarchy" / "themes" / "nord" / "backgrounds" / "wall.png"
+    )
+
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return Result()
+
+    monkeypatch.setattr("themectl.hooks.platform.system", lambda: "Linux")
+    monkeypatch.setattr("themectl.hooks.which", lambda _: "/usr/bin/swww")
+    monkeypatch.setattr("themectl.hooks.subprocess.run", fake_run)
+
+    console = _console()
+    update_wallpaper(console)
+
+    assert len(calls) == 1
+    assert calls[0][2].endswith("-1280x800.png")
+    assert "--outputs" not in calls[0]
+    assert "pre-scaled" in console.export_text()
+
+
+def test_named_displays_get_their_own_variant(tmp_path: Path, monkeypatch) -> None:
+    wall = tmp_path / "wall.png"
+    wall.write_text("full-size")
+    small, large = tmp_path / "small.png", tmp_path / "large.png"
+    small.write_text("s")
+    large.write_text("l")
+    laptop, external = Display("eDP-1", 1920, 1200), Display("DP-1", 3840, 2160)
+    index = PrescaleIndex(displays=[laptop, external])
+
+    index.sources[stat_signature(wall)] = "abc"
+    index.variants["abc"] = {laptop.size: str(small)}
+    assert index.lookup(wall) == {laptop: small}  # DP-1 gets the original
+
+    index.variants["abc"][external.size] = str(large)
+    variants = index.lookup(wall)
+    assert variants == {laptop: small, external: large}
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr("themectl.hooks.which", lambda _: "/usr/bin/swww")
+    monkeypatch.setattr(
+        "themectl.hooks.subprocess.run", lambda cmd, **kw: calls.append(cmd) or Result()
+    )
+    _update_wallpaper_linux(wall, _console(), variants, [laptop, external])
+
+    assert [(cmd[2], cmd[-1]) for cmd in calls] == [
+        (str(small), "eDP-1"),
+        (str(large), "DP-1"),
+    ]
+
+
+def test_disconnected_outputs_fall_back_to_the_original(
+    tmp_path: Path, monkeypatch
+) -> None:
+    wall, small = tmp_path / "wall.png", tmp_path / "small.png"
+    wall.write_text("full-size")
+    small.write_text("s")
+    laptop = Display("eDP-1", 1920, 1200)
+    index = PrescaleIndex(displays=[laptop, Display("DP-1", 3840, 2160)])
+    index.sources[stat_signature(wall)] = "abc"
+    index.variants["abc"] = {laptop.size: str(small)}
+
+    # DP-1 was unplugged and a new monitor with an unseen size is connected.
+    connected = [laptop, Display("HDMI-A-1", 2560, 1440)]
+    calls: list[list[str]] = []
+    monkeypatch.setattr("themectl.hooks.which", lambda _: "/usr/bin/swww")
+    monkeypatch.setattr(
+        "themectl.hooks.subprocess.run", lambda cmd, **kw: calls.append(cmd) or Result()
+    )
+    _update_wallpaper_linux(wall, _console(), index.lookup(wall, connected), connected)
+    assert [(cmd[2], cmd[-1]) for cmd in calls] == [
+        (str(small), "eDP-1"),
+        (str(wall), "HDMI-A-1"),
+    ]
+
+    # A stale output name makes swww fail: the original goes on every output.
+    class Failed(Result):
+        returncode = 1
+        stderr = "unknown output"
+
+    calls.clear()
+    monkeypatch.setattr(
+        "themectl.hooks.subprocess.run",
+        lambda cmd, **kw: (
+            calls.append(cmd) or (Failed() if len(calls) == 1 else Result())
+        ),
+    )
+    console = _console()
+    _update_wallpaper_linux(wall, console, {laptop: small}, [laptop])
+    assert calls[-1][2] == str(wall) and "--outputs" not in calls[-1]
+    assert "using the original wallpaper" in console.export_text()
+    assert "pre-scaled" not in console.export_text()
+
+
+def test_variants_for_recent_sizes_survive_undocking(
+    tmp_path: Path, monkeypatch
+) -> None:
+    home, config, scaled = _setup(tmp_path, monkeypatch)
+    sync = ["sync-assets", "--config", str(config), "--prescale"]
+    variants = home / ".cache" / "themectl" / "wallpapers"
+
+    monkeypatch.setenv("THEMECTL_WALLPAPER_SIZES", "1280x800,3840x2160")
+    assert runner.invoke(app, sync).exit_code == 0
+    assert len(scaled) == 2
+
+    monkeypatch.setenv("THEMECTL_WALLPAPER_SIZES", "1280x800")
+    assert runner.invoke(app, sync).exit_code == 0
+    assert len(list(variants.glob("*.png"))) == 2
+
+    monkeypatch.setenv("THEMECTL_WALLPAPER_SIZES", "1280x800,3840x2160")
+    result = runner.invoke(app, sync)
+    assert "0 created, 2 reused" in result.output
+    assert len(scaled) == 2
+
+    monkeypatch.setattr("themectl.prescale.SIZE_RETENTION", 0)
+    monkeypatch.setenv("THEMECTL_WALLPAPER_SIZES", "1280x800")
+    assert runner.invoke(app, sync).exit_code == 0
+    assert [path.name.split("-")[-1] for path in variants.glob("*.png")] == [
+        "1280x800.png"
+    ]
@@ -0,0 +1,87 @@
+import json
+import os
+import textwrap
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from themectl import client, preview
+from themectl.cli import app
+from themectl.palette import load_colors
+
+runner = CliRunner()
+
+
+def _pty(monkeypatch) -> int:
+    master, slave = os.openpty()
+    path = Path(os.ttyname(slave))
+    os.close(slave)
+    monkeypatch.setattr(preview, "terminals", lambda: [path])
+    return master
+
+
+def _config(tmp_path: Path, monkeypatch) -> tuple[Path, Path]:
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+    metadata = home / "themes.json"
+    metadata.write_text(json.dumps({"themes": [{"name": "Nord", "slug": "nord"}]}))
+    state = home / ".current-theme"
+    config = home / "config.toml"
+    config.write_text(
+        textwrap.dedent(
+            f"""
+            platform = "linux"
+            theme_metadata = "{metadata}"
+            state_file = "{state}"
+            """
+        ).strip()
+    )
+    return config, state
+
+
+def test_sequences_cover_ansi_and_dynamic_colors() -> None:
+    payload = preview.sequences(
+        {
+            "color0": "#000000",
+            "color1": "#FF0000",
+            "color2": "red",  # not a hex color: left to the terminal
+            "foreground": "#eeeeee",
+            "background": "#111111",
+            "accent": "#123456",
+        }
+    )
+
+    assert payload == (
+        b"\x1b]4;0;#000000;1;#FF0000\x1b\\\x1b]10;#eeeeee\x1b\\\x1b]11;#111111\x1b\\"
+    )
+    assert preview.sequences({}) == b""
+
+
+def test_preview_writes_palette_to_terminals_only(tmp_path: Path, monkeypatch) -> None:
+    config, state = _config(tmp_path, monkeypatch)
+    master = _pty(monkeypatch)
+    try:
+        result = runner.invoke(app, ["preview", "nord", "--config", str(config)])
+        pushed = os.read(master, 4096)
+
+        assert result.exit_code == 0, result.output
+        assert "Previewing Nord in 1 terminal(s)" in result.output
+        assert pushed == preview.sequences(load_colors("nord"))
+        assert f"\x1b]11;{load_colors('nord')['background']}".encode() in pushed
+        assert not state.exists()
+
+        result = runner.invoke(app, ["preview", "--reset"])
+        assert result.exit_code == 0, result.output
+        assert os.read(master, 4096) == preview.RESET
+    finally:
+        os.close(master)
+
+
+def test_client_forwards_only_preview_reset() -> None:
+    # The interactive Enter/Ctrl-C flow needs the caller's TTY: run in-process.
+    assert client.parse_request(["preview", "nord"]) is None
+    assert client.parse_request(["preview", "--reset"])["args"] == {"reset": True}
+    assert client.parse_request(["preview", "--reset", "nord"]) is None
+    assert client.parse_request(["preview"]) is None
+    assert client.parse_request(["cycle", "--reset"]) is None
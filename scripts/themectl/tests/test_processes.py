@@ -0,0 +1,94 @@
+import signal
+from io import StringIO
+from pathlib import Path
+
+from rich.console import Console
+
+from themectl import processes
+from themectl.hooks import update_btop
+from themectl.processes import ProcessTable, read_proc
+from themectl.themes import Theme
+
+
+class Result:
+    returncode = 0
+    stderr = ""
+
+    def __init__(self, stdout: str = "") -> None:
+        self.stdout = stdout
+
+
+def _fake_proc(root: Path, entries: dict[str, str | None]) -> Path:
+    for pid, comm in entries.items():
+        (root / pid).mkdir(parents=True)
+        if comm is not None:
+            (root / pid / "comm").write_text(comm + "\n")
+    return root
+
+
+def test_read_proc_matches_like_pgrep(tmp_path: Path) -> None:
+    root = _fake_proc(
+        tmp_path / "proc",
+        {
+            "1": "systemd",
+            "42": "btop",
+            "43": "btop",
+            "77": "gnome-shell-cal",  # comm is cut to 15 characters
+            "99": None,  # exited mid-scan
+        },
+    )
+    (root / "self").mkdir()
+
+    table = ProcessTable(read_proc(root))
+
+    assert table.pids("btop") == [42, 43]
+    assert table.running("ghostty", "systemd")
+    assert not table.running("ghostty")
+    assert table.pids("gnome-shell-calendar-server") == [77]
+
+
+def test_read_ps_uses_executable_basename(monkeypatch) -> None:
+    output = (
+        "  1 /sbin/launchd\n"
+        "501 /Applications/Ghostty.app/Contents/MacOS/ghostty\n"
+        "502 /Applications/Visual Studio Code.app/Contents/MacOS/Code\n"
+    )
+    calls = []
+    monkeypatch.setattr(
+        "subprocess.run", lambda cmd, **kwargs: calls.append(cmd) or Result(output)
+    )
+
+    table = ProcessTable(processes.read_ps())
+
+    assert calls == [["ps", "-axo", "pid=,comm="]]
+    assert table.pids("ghostty") == [501]
+    assert table.pids("Code") == [502]
+
+
+def test_update_btop_signals_only_btop_pids(tmp_path: Path, monkeypatch) -> None:
+    home = tmp_path / "home"
+    btop = home / ".config" / "btop"
+    (btop / "themes").mkdir(parents=True)
+    (btop / "themes" / "nord.theme").write_text("theme")
+    (btop / "btop.conf").write_text('color_theme = "old"\n')
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+
+    def no_spawn(*args, **kwargs):
+        raise AssertionError("btop reload should not spawn pkill")
+
+    monkeypatch.setattr("themectl.hooks.subprocess.run", no_spawn)
+    monkeypatch.setattr(
+        processes, "snapshot", lambda: ProcessTable({7: "btop", 8: "bash"})
+    )
+    killed = []
+    monkeypatch.setattr(
+        processes.os, "kill", lambda pid, sig: killed.append((pid, sig))
+    )
+    processes.reset_process_table()
+
+    theme = Theme(name="Nord", slug="nord", display_name="Nord", wallpapers=[], raw={})
+    update_btop(theme, Console(file=StringIO()))
+    processes.reset_process_table()
+
+    assert killed == [(7, signal.SIGUSR2)]
+    assert (btop / "btop.conf").read_text() == 'color_theme = "nord"\n'
@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+
+from themectl import tools
+
+
+def _executable(directory: Path, name: str) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+    return path
+
+
+def _setup(tmp_path: Path, monkeypatch) -> tuple[Path, list[str]]:
+    monkeypatch.setenv("THEMECTL_HOME", str(tmp_path / "home"))
+    bin_dir = tmp_path / "profile" / "bin"
+    _executable(bin_dir, "hyprctl")
+    monkeypatch.setenv("PATH", str(bin_dir))
+    lookups: list[str] = []
+    real_which = tools.shutil.which
+
+    def counting_which(name, path=None):
+        lookups.append(name)
+        return real_which(name, path=path)
+
+    monkeypatch.setattr(tools.shutil, "which", counting_which)
+    tools.reset()
+    return bin_dir, lookups
+
+
+def test_each_name_is_looked_up_once(tmp_path: Path, monkeypatch) -> None:
+    bin_dir, lookups = _setup(tmp_path, monkeypatch)
+
+    assert tools.which("hyprctl") == str(bin_dir / "hyprctl")
+    assert tools.which("hyprctl") == str(bin_dir / "hyprctl")
+    assert tools.which("swww") is None
+    assert tools.which("swww") is None
+    assert lookups == ["hyprctl", "swww"]
+
+    # A new process reads the snapshot instead of walking PATH.
+    tools.reset()
+    assert tools.inventory(["hyprctl", "swww"]) == {
+        "hyprctl": str(bin_dir / "hyprctl"),
+        "swww": None,
+    }
+    assert lookups == ["hyprctl", "swww"]
+    tools.reset()
+
+
+def test_profile_change_invalidates_snapshot(tmp_path: Path, monkeypatch) -> None:
+    bin_dir, lookups = _setup(tmp_path, monkeypatch)
+    assert tools.which("swww") is None
+
+    _executable(bin_dir, "swww")
+    os.utime(bin_dir, ns=(1, 1))
+    tools.reset()
+
+    assert tools.which("swww") == str(bin_dir / "swww")
+    assert lookups == ["swww", "swww"]
+
+    # Changing PATH in-process starts over as well.
+    other = tmp_path / "other" / "bin"
+    _executable(other, "swww")
+    monkeypatch.setenv("PATH", str(other))
+    assert tools.which("swww") == str(other / "swww")
+    tools.reset()
+
+
+def test_lookups_are_persisted_once_per_command(tmp_path: Path, monkeypatch) -> None:
+    bin_dir, lookups = _setup(tmp_path, monkeypatch)
+    writes: list[object] = []
+    store = tools.store_snapshot
+    monkeypatch.setattr(
+        tools, "store_snapshot", lambda *args: writes.append(args) or store(*args)
+    )
+
+    tools.which("hyprctl")
+    tools.which("swww")
+    assert writes == []
+    tools.flush()
+    tools.flush()
+    assert len(writes) == 1
+
+    # A long-lived process notices a binary installed after its first lookup.
+    _executable(bin_dir, "swww")
+    os.utime(bin_dir, ns=(2, 2))
+    assert tools.which("swww") is None
+    tools.reset()
+    assert tools.which("swww") == str(bin_dir / "swww")
+    tools.reset()
@@ -0,0 +1,96 @@
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from rich.console import Console
+from typer.testing import CliRunner
+
+from themectl import trace
+from themectl.cli import app
+from themectl.executor import Job
+
+runner = CliRunner()
+
+
+def _setup(tmp_path: Path, monkeypatch) -> Path:
+    home = tmp_path / "home"
+    (home / ".config" / "omarchy" / "themes" / "nord").mkdir(parents=True)
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+    metadata = home / "themes.json"
+    metadata.write_text(json.dumps({"themes": [{"name": "Nord", "slug": "nord"}]}))
+    config = home / "config.toml"
+    config.write_text(
+        textwrap.dedent(
+            f"""
+            platform = "linux"
+            theme_metadata = "{metadata}"
+            state_file = "{home / ".current-theme"}"
+            """
+        ).strip()
+    )
+
+    def child(out: Console) -> None:
+        subprocess.run([sys.executable, "-c", "pass"], check=False)
+        out.print("child ran")
+
+    monkeypatch.setattr(
+        "themectl.hooks.reload_jobs", lambda theme, cfg: (Job("Child", child),)
+    )
+    return config
+
+
+def _events(path: Path) -> list[dict]:
+    data = json.loads(path.read_text())
+    return [event for event in data["traceEvents"] if event["ph"] == "X"]
+
+
+def test_trace_option_writes_chrome_trace(tmp_path: Path, monkeypatch) -> None:
+    config = _setup(tmp_path, monkeypatch)
+    output = tmp_path / "trace.json"
+
+    result = runner.invoke(
+        app, ["--trace", str(output), "apply", "nord", "--config", str(config)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert not trace.enabled()
+    assert subprocess.run is not trace._traced_run
+    events = _events(output)
+    names = {event["name"] for event in events}
+    assert {
+        "themectl apply",
+        "load_config",
+        "load_theme_metadata",
+        "symlink",
+        "reload_hooks",
+        "Child",
+    } <= names
+    process = next(event for event in events if event["cat"] == "process")
+    assert process["args"]["argv"][0] == sys.executable
+    assert process["args"]["exit_code"] == 0
+    assert process["dur"] >= 0
+    hook = next(event for event in events if event["name"] == "Child")
+    assert hook["cat"] == "hook"
+    assert hook["ts"] <= process["ts"]
+
+
+def test_trace_env_var_enables_tracing(tmp_path: Path, monkeypatch) -> None:
+    config = _setup(tmp_path, monkeypatch)
+    output = tmp_path / "env-trace.json"
+
+    result = runner.invoke(
+        app,
+        ["cycle", "--config", str(config)],
+        env={"THEMECTL_TRACE": str(output)},
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "themectl cycle" in {event["name"] for event in _events(output)}
+
+
+def test_span_is_noop_when_disabled() -> None:
+    with trace.span("ignored", detail=1) as args:
+        args["extra"] = True
+    assert not trace.enabled()
@@ -0,0 +1,102 @@
+import json
+import textwrap
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from themectl import wallpapers
+from themectl.cli import app
+
+runner = CliRunner()
+
+
+def _setup(tmp_path: Path, monkeypatch) -> tuple[Path, Path, Path]:
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("THEMECTL_HOME", str(home))
+    monkeypatch.setattr("themectl.cli.update_wallpaper", lambda console: None)
+    themes = []
+    for slug in ("alpha", "beta"):
+        walls = []
+        for name in ("1.png", "2.jpg"):
+            wall = tmp_path / "src" / slug / name
+            wall.parent.mkdir(parents=True, exist_ok=True)
+            wall.write_text(f"{slug}-{name}")
+            walls.append(str(wall))
+        themes.append({"name": slug.title(), "slug": slug, "wallpapers": walls})
+    metadata = home / "themes.json"
+    metadata.write_text(json.dumps({"themes": themes}))
+    state = home / ".config" / "themes" / ".current-theme"
+    config = home / ".config" / "themectl" / "config.toml"
+    config.parent.mkdir(parents=True)
+    config.write_text(
+        textwrap.dedent(
+            f"""
+            platform = "linux"
+            theme_metadata = "{metadata}"
+            state_file = "{state}"
+            """
+        ).strip()
+    )
+    assert runner.invoke(app, ["sync-assets", "--config", str(config)]).exit_code == 0
+    return home, config, state.parent / ".current-background-path"
+
+
+def _cycle(config: Path, direction: str = "next") -> str:
+    result = runner.invoke(
+        app, ["cycle-background", "--config", str(config), "-d", direction]
+    )
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_cycle_background_uses_index_from_sync(tmp_path: Path, monkeypatch) -> None:
+    _, config, background_state = _setup(tmp_path, monkeypatch)
+
+    def no_rescan(root: Path):
+        raise AssertionError("index written by sync-assets should be reused")
+
+    monkeypatch.setattr(wallpapers, "scan", no_rescan)
+
+    seen = []
+    for _ in range(4):
+        _cycle(config)
+        seen.append(Path(background_state.read_text()).relative_to(config.parents[2]))
+    assert [path.as_posix() for path in seen] == [
+        ".config/omarchy/themes/alpha/backgrounds/2.jpg",
+        ".config/omarchy/themes/beta/backgrounds/1.png",
+        ".config/omarchy/themes/beta/backgrounds/2.jpg",
+        ".config/omarchy/themes/alpha/backgrounds/1.png",
+    ]
+
+    _cycle(config, "prev")
+    assert background_state.read_text().endswith("beta/backgrounds/2.jpg")
+
+
+def test_cycle_background_rescans_stale_index(tmp_path: Path, monkeypatch) -> None:
+    home, config, background_state = _setup(tmp_path, monkeypatch)
+    _cycle(config)
+    assert background_state.read_text().endswith("alpha/backgrounds/2.jpg")
+
+    extra = home / ".config" / "omarchy" / "themes" / "alpha" / "backgrounds" / "3.webp"
+    extra.write_text("new")
+
+    output = _cycle(config)
+    assert background_state.read_text() == str(extra)
+    assert "3/5" in output
+
+
+def test_find_falls_back_to_inode(tmp_path: Path) -> None:
+    root = tmp_path / "themes"
+    (root / "alpha" / "backgrounds").mkdir(parents=True)
+    wall = root / "alpha" / "backgrounds" / "1.png"
+    wall.write_text("png")
+    alias = tmp_path / "alias.png"
+    alias.symlink_to(wall)
+
+    index = wallpapers.scan(root)
+
+    assert index.find(str(wall)) == 0
+    assert index.find(str(alias)) == 0
+    assert index.find(str(tmp_path / "missing.png")) is None
@@ -0,0 +1,62 @@
+import os
+import shutil
+from pathlib import Path
+
+from themectl.writer import AtomicWriter, write_if_changed
+
+
+def test_identical_content_is_not_rewritten(tmp_path: Path) -> None:
+    target = tmp_path / "kitty.conf"
+    assert write_if_changed(target, "background #000000\n")
+    before = target.stat()
+
+    assert not write_if_changed(target, "background #000000\n")
+
+    after = target.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+
+def test_changed_content_replaces_file_atomically(tmp_path: Path) -> None:
+    target = tmp_path / "waybar.css"
+    target.write_text("old")
+    target.chmod(0o640)
+    inode = target.stat().st_ino
+
+    assert write_if_changed(target, b"new")
+
+    assert target.read_text() == "new"
+    assert target.stat().st_ino != inode
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert [path.name for path in tmp_path.iterdir()] == ["waybar.css"]
+
+
+def test_symlinks_are_written_through(tmp_path: Path) -> None:
+    real = tmp_path / "real" / "config"
+    real.parent.mkdir()
+    real.write_text("theme = a")
+    link = tmp_path / "config"
+    link.symlink_to(real)
+
+    assert write_if_changed(link, "theme = b")
+
+    assert link.is_symlink()
+    assert real.read_text() == "theme = b"
+
+
+def test_writer_recreates_directories_removed_mid_run(tmp_path: Path) -> None:
+    writer = AtomicWriter()
+    target = tmp_path / "theme" / "backgrounds" / "notes.txt"
+    assert writer.write(target, "one")
+
+    shutil.rmtree(tmp_path / "theme")
+    assert writer.write(target, "two")
+    assert target.read_text() == "two"
+
+
+def test_force_rewrites_identical_content(tmp_path: Path) -> None:
+    target = tmp_path / "mako.ini"
+    target.write_text("same")
+    inode = os.stat(target).st_ino
+
+    assert AtomicWriter().write(target, "same", force=True)
+    assert os.stat(target).st_ino != inode
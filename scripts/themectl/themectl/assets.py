@@ -2,71 +2,120 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import hashlib
 import json
+import os
 from pathlib import Path
 import shutil
-import tomllib
-from typing import Mapping
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping, Sequence
 
 from rich.console import Console
 
+from .cache import stat_signature
 from .config import get_home
+from .materialize import STRATEGIES, Materializer
+from .color import BLACK, Color
+from .palette import ThemePalette, theme_palette
+from .wallpapers import rebuild_index
+from .writer import AtomicWriter
 from .themes import Theme, ThemeRepository
 
 console = Console()
 
+# Per-theme record of output hashes; lets sync skip outputs that are current.
+MANIFEST_NAME = ".themectl-manifest.json"
+MANIFEST_FORMAT = 1
+
 
 def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def _write_text(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content.rstrip() + "\n")
+ALL_PLATFORMS = frozenset({"linux", "darwin"})
+LINUX = frozenset({"linux"})
+# Pseudo-target for the theme's wallpapers, mirrored into backgrounds/.
+WALLPAPERS = "wallpapers"
 
 
-def _load_colors_toml(theme: Theme) -> Mapping[str, str]:
-    """Load colors from bundled colors/{slug}.toml file."""
-    # Try bundled location first (package install)
-    colors_file = Path(__file__).parent / "colors" / f"{theme.slug}.toml"
+@dataclass(frozen=True, slots=True)
+class Renderer:
+    """A sync-assets target: the file it writes, what it reads, where it applies.
 
-    # Fall back to repo location (development)
-    if not colors_file.exists():
-        repo_root = Path(__file__).parent.parent.parent.parent
-        colors_file = repo_root / "modules" / "themes" / "colors" / f"{theme.slug}.toml"
+    ``render`` returns the file's text, a source ``Path`` to materialize, or a
+    falsy value when the theme has nothing for this target.
+    """
 
-    if not colors_file.exists():
-        return {}
+    name: str
+    output: str
+    render: Callable[[Theme], str | Path | None]
+    sections: tuple[str, ...] = ()
+    platforms: frozenset[str] = ALL_PLATFORMS
 
-    try:
-        with open(colors_file, "rb") as f:
-            return tomllib.load(f)
-    except Exception:
-        return {}
 
+RENDERERS: dict[str, Renderer] = {}
 
-def _hex_to_rgb(color: str) -> tuple[int, int, int] | None:
-    if not isinstance(color, str):
-        return None
-    value = color.strip()
-    if not value.startswith("#") or len(value) not in (4, 7):
-        return None
-    value = value.lstrip("#")
-    if len(value) == 3:
-        value = "".join(ch * 2 for ch in value)
-    try:
-        r = int(value[0:2], 16)
-        g = int(value[2:4], 16)
-        b = int(value[4:6], 16)
-    except ValueError:
-        return None
-    return (r, g, b)
+
+def register_renderer(
+    name: str,
+    output: str,
+    *,
+    sections: Sequence[str] = (),
+    platforms: Iterable[str] = ALL_PLATFORMS,
+) -> Callable[[Callable[[Theme], Any]], Callable[[Theme], Any]]:
+    """Register ``render`` as the producer of ``output`` for target ``name``."""
+
+    def decorator(render: Callable[[Theme], Any]) -> Callable[[Theme], Any]:
+        RENDERERS[name] = Renderer(
+            name, output, render, tuple(sections), frozenset(platforms)
+        )
+        return render
+
+    return decorator
+
+
+def select_targets(
+    targets: Iterable[str] | None = None, platform: str | None = None
+) -> tuple[str, ...]:
+    """Resolve ``--targets``/``--platform`` into target names in sync order."""
+    names = [*RENDERERS, WALLPAPERS]
+    if targets is not None:
+        wanted = set(targets)
+        unknown = sorted(wanted.difference(names))
+        if unknown:
+            raise ValueError(
+                f"Unknown sync target(s): {', '.join(unknown)}. "
+                f"Choose from: {', '.join(names)}"
+            )
+        names = [name for name in names if name in wanted]
+    if platform is not None:
+        if platform not in ALL_PLATFORMS:
+            raise ValueError(
+                f"Unknown platform {platform!r}; expected one of "
+                + ", ".join(sorted(ALL_PLATFORMS))
+            )
+        names = [
+            name
+            for name in names
+            if name == WALLPAPERS or platform in RENDERERS[name].platforms
+        ]
+    return tuple(names)
+
+
+def _target_for(rel: str) -> str | None:
+    if rel.startswith("backgrounds/"):
+        return WALLPAPERS
+    for renderer in RENDERERS.values():
+        if renderer.output == rel:
+            return renderer.name
+    return None
 
 
+@register_renderer("hyprland", "hyprland.conf", sections=("hyprland",), platforms=LINUX)
 def _render_hyprland(theme: Theme) -> str:
-    hypr = theme.section("hyprland")
-    active = hypr.get("activeBorder", "rgba(ffffffff)")
-    inactive = hypr.get("inactiveBorder", "rgba(000000ff)")
+    palette = theme_palette(theme)
+    active = palette.value("hyprland.activeBorder", "rgba(ffffffff)")
+    inactive = palette.value("hyprland.inactiveBorder", "rgba(000000ff)")
     return (
         f"# Hyprland border colors for {theme.display_name}\n"
         "general {\n"
@@ -76,10 +125,11 @@ def _render_hyprland(theme: Theme) -> str:
     )
 
 
+@register_renderer("waybar", "waybar.css", sections=("waybar",), platforms=LINUX)
 def _render_waybar(theme: Theme) -> str:
-    waybar = theme.section("waybar")
-    fg = waybar.get("foreground", "#ffffff")
-    bg = waybar.get("background", "#000000")
+    palette = theme_palette(theme)
+    fg = palette.value("waybar.foreground", "#ffffff")
+    bg = palette.value("waybar.background", "#000000")
     return (
         f"/* Waybar colors for {theme.display_name} */\n"
         f"@define-color foreground {fg};\n"
@@ -87,6 +137,7 @@ def _render_waybar(theme: Theme) -> str:
     )
 
 
+@register_renderer("alacritty", "alacritty.toml", sections=("alacritty",))
 def _render_alacritty(theme: Theme) -> str:
     alacritty = theme.section("alacritty")
     if not alacritty:
@@ -110,6 +161,7 @@ def _render_alacritty(theme: Theme) -> str:
     return "\n\n".join(filter(None, pieces))
 
 
+@register_renderer("kitty", "kitty.conf", sections=("kitty",))
 def _render_kitty(theme: Theme) -> str:
     kitty = theme.section("kitty")
     if not kitty:
@@ -148,6 +200,7 @@ def _render_kitty(theme: Theme) -> str:
     return "\n".join(lines)
 
 
+@register_renderer("ghostty", "ghostty.conf", sections=("ghostty",))
 def _render_ghostty(theme: Theme) -> str:
     ghostty = theme.section("ghostty")
     if not ghostty:
@@ -166,14 +219,15 @@ def _render_ghostty(theme: Theme) -> str:
     return "\n".join(lines)
 
 
+@register_renderer("walker", "walker.css", sections=("walker",), platforms=LINUX)
 def _render_walker(theme: Theme) -> str:
-    walker = theme.section("walker")
-    if not walker:
+    if not theme.section("walker"):
         return ""
-    selected = walker.get("selectedText", "#ffffff")
-    text = walker.get("text", "#ffffff")
-    base = walker.get("base", "#000000")
-    border = walker.get("border", "#ffffff")
+    palette = theme_palette(theme)
+    selected = palette.value("walker.selectedText", "#ffffff")
+    text = palette.value("walker.text", "#ffffff")
+    base = palette.value("walker.base", "#000000")
+    border = palette.value("walker.border", "#ffffff")
     return (
         f"/* Walker launcher colors for {theme.display_name} */\n"
         f"@define-color selected-text {selected};\n"
@@ -185,14 +239,15 @@ def _render_walker(theme: Theme) -> str:
     )
 
 
+@register_renderer("mako", "mako.ini", sections=("mako",), platforms=LINUX)
 def _render_mako(theme: Theme) -> str:
-    mako = theme.section("mako")
-    if not mako:
+    if not theme.section("mako"):
         return ""
-    text = mako.get("textColor", "#ffffff")
-    border = mako.get("borderColor", "#ffffff")
-    background = mako.get("backgroundColor", "#000000")
-    progress = mako.get("progressColor", text)
+    palette = theme_palette(theme)
+    text = palette.value("mako.textColor", "#ffffff")
+    border = palette.value("mako.borderColor", "#ffffff")
+    background = palette.value("mako.backgroundColor", "#000000")
+    progress = palette.value("mako.progressColor", text)
     return (
         f"# Mako notification config for {theme.display_name}\n"
         "include=$HOME/.config/mako/core.ini\n\n"
@@ -203,13 +258,14 @@ def _render_mako(theme: Theme) -> str:
     )
 
 
+@register_renderer("swayosd", "swayosd.css", sections=("swayosd",), platforms=LINUX)
 def _render_swayosd(theme: Theme) -> str:
-    swayosd = theme.section("swayosd")
-    if not swayosd:
+    if not theme.section("swayosd"):
         return ""
-    bg = swayosd.get("backgroundColor", "#000000")
-    border = swayosd.get("borderColor", "#ffffff")
-    text = swayosd.get("textColor", "#ffffff")
+    palette = theme_palette(theme)
+    bg = palette.value("swayosd.backgroundColor", "#000000")
+    border = palette.value("swayosd.borderColor", "#ffffff")
+    text = palette.value("swayosd.textColor", "#ffffff")
     return f"""/* SwayOSD theme for {theme.display_name} */
 window {{
   background-color: {bg};
@@ -235,12 +291,14 @@ progress {{
 """
 
 
+@register_renderer("vscode", "vscode.json", sections=("vscode",))
 def _render_vscode(theme: Theme) -> str:
     if not theme.vscode_theme:
         return ""
     return json.dumps({"workbench.colorTheme": theme.vscode_theme}, indent=2)
 
 
+@register_renderer("chromium", "chromium.theme", sections=("browser",))
 def _render_chromium(theme: Theme) -> str:
     browser = theme.section("browser")
     theme_color = browser.get("themeColor")
@@ -249,21 +307,23 @@ def _render_chromium(theme: Theme) -> str:
     return str(theme_color)
 
 
+@register_renderer("neovim", "neovim.lua", sections=("nvim",))
 def _render_neovim(theme: Theme) -> str:
     colorscheme = theme.nvim_colorscheme or "tokyonight"
     return f'return "{colorscheme}"\n'
 
 
+@register_renderer("starship", "starship.toml")
 def _render_starship(theme: Theme) -> str:
     """Generate Starship prompt config using theme colors from colors.toml.
 
     Preserves the user's comprehensive format from Nix config, only theming colors.
     """
-    colors = _load_colors_toml(theme)
-    if not colors:
+    palette = theme_palette(theme)
+    if not palette.toml():
         return ""
 
-    accent = colors.get("accent", "#7aa2f7")
+    accent = palette.accent.source if palette.accent else "#7aa2f7"
 
     return f"""# Starship colors for {theme.display_name}
 # Full format preserved from Nix config, only colors themed
@@ -361,37 +421,57 @@ pure_msg = "[pure](bold {accent})"
 """
 
 
-def _render_hyprlock(theme: Theme, fallback_hex: str) -> str:
-    hyprlock = theme.section("hyprlock")
-    if not hyprlock:
+def _hyprlock_color(
+    palette: ThemePalette, key: str, default: Color | None
+) -> Color | None:
+    """``default`` when ``key`` is unset; None unless it is opaque #rgb/#rrggbb."""
+    if key not in palette.values:
+        return default
+    value = palette.value(key, "").strip()
+    if not value.startswith("#") or len(value) not in (4, 7):
+        return None
+    return palette.color(key)
+
+
+@register_renderer(
+    "hyprlock", "hyprlock.conf", sections=("hyprlock", "alacritty"), platforms=LINUX
+)
+def _render_hyprlock(theme: Theme) -> str:
+    if not theme.section("hyprlock"):
         return ""
-    outer = _hex_to_rgb(hyprlock.get("outerColor", fallback_hex))
-    inner = _hex_to_rgb(hyprlock.get("innerColor", fallback_hex))
-    font = _hex_to_rgb(hyprlock.get("fontColor", fallback_hex))
-    check = _hex_to_rgb(hyprlock.get("checkColor", fallback_hex))
-    base = _hex_to_rgb(fallback_hex)
+    palette = theme_palette(theme)
+    background = "alacritty.primary.background"
+    # Unlike the hyprlock keys, an empty background still means black.
+    base = (
+        _hyprlock_color(palette, background, BLACK)
+        if palette.value(background, "")
+        else BLACK
+    )
+    outer, inner, font, check = (
+        _hyprlock_color(palette, f"hyprlock.{key}", base)
+        for key in ("outerColor", "innerColor", "fontColor", "checkColor")
+    )
+    # hyprlock.conf is only written when every color is opaque #rgb/#rrggbb;
+    # themes with #rrggbbaa input colors keep hyprlock's own defaults.
     if any(value is None for value in (outer, inner, font, check, base)):
         return ""
     assert outer and inner and font and check and base
-
-    def rgba(values: tuple[int, int, int], alpha: float = 1.0) -> str:
-        return f"rgba({values[0]},{values[1]},{values[2]},{alpha})"
-
     return "\n".join(
         [
             f"# hyprlock colors for {theme.display_name}",
-            f"$color = {rgba(base)}",
-            f"$inner_color = {rgba(inner, 0.8)}",
-            f"$outer_color = {rgba(outer)}",
-            f"$font_color = {rgba(font)}",
-            f"$check_color = {rgba(check)}",
+            f"$color = {base.css()}",
+            f"$inner_color = {inner.css(0.8)}",
+            f"$outer_color = {outer.css()}",
+            f"$font_color = {font.css()}",
+            f"$check_color = {check.css()}",
             "",
         ]
     )
 
 
-def _copy_btop_theme(theme: Theme, dest_dir: Path) -> None:
-    """Copy btop theme file from bundled assets to theme directory."""
+@register_renderer("btop", "btop.theme")
+def _btop_source(theme: Theme) -> Path | None:
+    """Locate the bundled btop theme file for ``theme``."""
     # Try bundled location first (package install)
     btop_asset = Path(__file__).parent / "assets" / "btop" / f"{theme.slug}.theme"
 
@@ -402,97 +482,382 @@ def _copy_btop_theme(theme: Theme, dest_dir: Path) -> None:
             repo_root / "modules" / "themes" / "assets" / "btop" / f"{theme.slug}.theme"
         )
 
-    if btop_asset.exists():
-        dest_file = dest_dir / "btop.theme"
-        _ensure_dir(dest_dir)
-        shutil.copy2(btop_asset, dest_file)
+    return btop_asset if btop_asset.exists() else None
+
+
+def _theme_outputs(
+    theme: Theme, console: Console, targets: Sequence[str]
+) -> dict[str, str | Path]:
+    """Map each output path (relative to the theme dir) to text or a source file."""
+    outputs: dict[str, str | Path] = {}
+    for name in targets:
+        if name == WALLPAPERS:
+            for src in theme.wallpapers:
+                if not src or not src.exists():
+                    console.print(f"[yellow]Skipping missing wallpaper {src}")
+                    continue
+                outputs[f"backgrounds/{src.name}"] = src
+            continue
+        renderer = RENDERERS[name]
+        content = renderer.render(theme)
+        if isinstance(content, Path):
+            outputs[renderer.output] = content
+        elif content:
+            outputs[renderer.output] = content.rstrip() + "\n"
+    return outputs
+
+
+@dataclass(slots=True)
+class SyncSummary:
+    """File counts for one or more synced theme directories."""
+
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def merge(self, other: SyncSummary) -> None:
+        self.changed += other.changed
+        self.unchanged += other.unchanged
+        self.removed += other.removed
+
+    def describe(self) -> str:
+        return (
+            f"{self.changed} changed, {self.unchanged} unchanged, "
+            f"{self.removed} removed"
+        )
 
 
-def _copy_wallpapers(theme: Theme, dest_dir: Path, console: Console) -> None:
-    if not theme.wallpapers:
-        return
-    _ensure_dir(dest_dir)
-    for src in theme.wallpapers:
-        if not src or not src.exists():
-            console.print(f"[yellow]Skipping missing wallpaper {src}")
-            continue
-        target = dest_dir / src.name
-        shutil.copy2(src, target)
+def _file_state(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
 
 
-def sync_assets(repo: ThemeRepository, console: Console | None = None) -> None:
-    active_console = console or Console()
-    base = get_home() / ".config" / "omarchy"
-    themes_root = base / "themes"
-    _ensure_dir(themes_root)
+def _sha256_file(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
-    for theme in repo:
-        dest = themes_root / theme.slug
-        if dest.is_symlink():
-            dest.unlink()
-        elif dest.exists():
-            shutil.rmtree(dest)
-        dest.mkdir(parents=True)
 
-        hyprland = _render_hyprland(theme)
-        if hyprland:
-            _write_text(dest / "hyprland.conf", hyprland)
+def _load_manifest(dest: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads((dest / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+        return {}
+    outputs = data.get("outputs")
+    return outputs if isinstance(outputs, dict) else {}
+
+
+def _store_manifest(
+    dest: Path, outputs: Mapping[str, Mapping[str, Any]], writer: AtomicWriter
+) -> None:
+    writer.write(
+        dest / MANIFEST_NAME,
+        json.dumps({"format": MANIFEST_FORMAT, "outputs": outputs}, sort_keys=True),
+    )
 
-        waybar = _render_waybar(theme)
-        if waybar:
-            _write_text(dest / "waybar.css", waybar)
 
-        alacritty = _render_alacritty(theme)
-        if alacritty:
-            _write_text(dest / "alacritty.toml", alacritty)
+def _sync_text(
+    target: Path,
+    content: str,
+    entry: Mapping[str, Any] | None,
+    force: bool,
+    writer: AtomicWriter,
+) -> tuple[dict[str, Any], bool]:
+    data = content.encode()
+    digest = hashlib.sha256(data).hexdigest()
+    if not force and entry and entry.get("sha256") == digest:
+        if entry.get("state") == _file_state(target):
+            return dict(entry), False
+    # Untracked or touched by hand: the writer adopts it if the bytes match.
+    changed = writer.write(target, data, force=force)
+    return {"sha256": digest, "state": _file_state(target)}, changed
+
+
+def _sync_copy(
+    target: Path,
+    source: Path,
+    entry: Mapping[str, Any] | None,
+    force: bool,
+    materializer: Materializer,
+) -> tuple[dict[str, Any], bool]:
+    source_sig = list(stat_signature(source) or ())
+    state = _file_state(target)
+    digest: str | None = None
+    if not force and entry and state is not None and entry.get("state") == state:
+        if entry.get("source") == source_sig:
+            return dict(entry), False
+        # Source was touched or repointed; only copy if its content moved.
+        digest = _sha256_file(source)
+        if entry.get("sha256") == digest:
+            return {**entry, "source": source_sig}, False
+    digest = digest or _sha256_file(source)
+    materializer.materialize(source, target)
+    return {"sha256": digest, "source": source_sig, "state": _file_state(target)}, True
+
+
+def _prune(dest: Path, keep: set[str], scope: Collection[str] | None = None) -> int:
+    """Delete files under ``dest`` that no longer correspond to an output.
+
+    With ``scope`` only files owned by those targets are candidates, so a
+    ``--targets`` sync leaves every other target's files alone.
+    """
+    removed = 0
+    for root, dirs, files in os.walk(dest, topdown=False):
+        root_path = Path(root)
+        for name in files:
+            path = root_path / name
+            rel = path.relative_to(dest).as_posix()
+            if rel in keep or rel == MANIFEST_NAME:
+                continue
+            if scope is not None and _target_for(rel) not in scope:
+                continue
+            path.unlink()
+            removed += 1
+        for name in dirs:
+            path = root_path / name
+            if path.is_symlink():
+                rel = path.relative_to(dest).as_posix()
+                if scope is not None and _target_for(f"{rel}/") not in scope:
+                    continue
+                path.unlink()
+                removed += 1
+                continue
+            try:
+                path.rmdir()  # only succeeds once the directory is empty
+            except OSError:
+                pass
+    return removed
+
+
+def _sync_theme(
+    dest: Path,
+    outputs: Mapping[str, str | Path],
+    materializer: Materializer,
+    writer: AtomicWriter,
+    force: bool = False,
+    scope: Collection[str] | None = None,
+) -> SyncSummary:
+    summary = SyncSummary()
+    if dest.is_symlink():
+        dest.unlink()
+    writer.ensure_dir(dest)
+
+    manifest = _load_manifest(dest)
+    known = {} if force else manifest
+    entries: dict[str, dict[str, Any]] = {}
+    for rel, value in outputs.items():
+        target = dest / rel
+        entry = known.get(rel)
+        if isinstance(value, Path):
+            entries[rel], changed = _sync_copy(
+                target, value, entry, force, materializer
+            )
+        else:
+            entries[rel], changed = _sync_text(target, value, entry, force, writer)
+        if changed:
+            summary.changed += 1
+        else:
+            summary.unchanged += 1
 
-        kitty = _render_kitty(theme)
-        if kitty:
-            _write_text(dest / "kitty.conf", kitty)
+    if scope is not None:
+        # Keep the records of targets this sync did not touch.
+        for rel, entry in manifest.items():
+            if rel not in entries and _target_for(rel) not in scope:
+                entries[rel] = entry
+    summary.removed = _prune(dest, set(entries), scope)
+    if entries != manifest or not (dest / MANIFEST_NAME).exists():
+        _store_manifest(dest, entries, writer)
+    return summary
 
-        ghostty = _render_ghostty(theme)
-        if ghostty:
-            _write_text(dest / "ghostty.conf", ghostty)
 
-        walker = _render_walker(theme)
-        if walker:
-            _write_text(dest / "walker.css", walker)
+def default_jobs() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
 
-        mako = _render_mako(theme)
-        if mako:
-            _write_text(dest / "mako.ini", mako)
 
-        swayosd = _render_swayosd(theme)
-        if swayosd:
-            _write_text(dest / "swayosd.css", swayosd)
+RenderStep = Callable[[Theme, Console], Mapping[str, str | Path]]
+WriteStep = Callable[[Theme, Mapping[str, str | Path]], SyncSummary]
 
-        vscode = _render_vscode(theme)
-        if vscode:
-            _write_text(dest / "vscode.json", vscode)
 
-        chromium = _render_chromium(theme)
-        if chromium:
-            _write_text(dest / "chromium.theme", chromium)
+def _sync_serial(
+    themes: Sequence[Theme], console: Console, render: RenderStep, write: WriteStep
+) -> Iterator[tuple[Theme, SyncSummary]]:
+    for theme in themes:
+        yield theme, write(theme, render(theme, console))
 
-        neovim = _render_neovim(theme)
-        if neovim:
-            _write_text(dest / "neovim.lua", neovim)
 
-        starship = _render_starship(theme)
-        if starship:
-            _write_text(dest / "starship.toml", starship)
+def _sync_pipelined(
+    themes: Sequence[Theme],
+    console: Console,
+    render: RenderStep,
+    write: WriteStep,
+    jobs: int,
+) -> Iterator[tuple[Theme, SyncSummary]]:
+    """Render and write themes concurrently, yielding results in input order.
 
-        alacritty_section = theme.section("alacritty")
-        primary_bg = ""
-        primary = alacritty_section.get("primary")
-        if isinstance(primary, Mapping):
-            primary_bg = primary.get("background", "#000000")
+    Rendering runs in one pool and each rendered theme is handed straight to
+    an I/O pool, so a slow wallpaper copy never stalls the next render.
+    Theme directories are disjoint and per-theme output is buffered and
+    replayed in order, so the result matches the serial path byte for byte.
+    """
+    from concurrent.futures import Future, ThreadPoolExecutor
 
-        hyprlock = _render_hyprlock(theme, primary_bg or "#000000")
-        if hyprlock:
-            _write_text(dest / "hyprlock.conf", hyprlock)
+    from rich.progress import Progress
 
-        _copy_wallpapers(theme, dest / "backgrounds", active_console)
-        _copy_btop_theme(theme, dest)
+    from .executor import BufferedConsole
 
-        active_console.print(f"[green]•[/green] Synced {theme.display_name}")
+    with (
+        ThreadPoolExecutor(jobs, thread_name_prefix="themectl-render") as render_pool,
+        ThreadPoolExecutor(jobs, thread_name_prefix="themectl-io") as io_pool,
+        Progress(
+            console=console, transient=True, disable=not console.is_terminal
+        ) as progress,
+    ):
+
+        def stage(theme: Theme, buffer: Console) -> Future[SyncSummary]:
+            return io_pool.submit(write, theme, render(theme, buffer))
+
+        task = progress.add_task("Syncing themes", total=len(themes))
+        buffers = [BufferedConsole(console) for _ in themes]
+        pending = [
+            render_pool.submit(stage, theme, buffer)
+            for theme, buffer in zip(themes, buffers)
+        ]
+        for theme, buffer, future in zip(themes, buffers, pending):
+            summary = future.result().result()
+            buffer.replay()
+            progress.update(task, advance=1, description=theme.display_name)
+            yield theme, summary
+
+
+def _prune_stale_themes(themes_root: Path, slugs: set[str]) -> int:
+    """Remove theme directories that themectl synced but the metadata dropped."""
+    removed = 0
+    for entry in themes_root.iterdir():
+        if entry.name in slugs or entry.is_symlink() or not entry.is_dir():
+            continue
+        if not (entry / MANIFEST_NAME).exists():
+            continue  # not ours; leave hand-made themes alone
+        removed += sum(1 for path in entry.rglob("*") if not path.is_dir())
+        removed -= 1  # the manifest itself is bookkeeping, not an output
+        shutil.rmtree(entry)
+    return removed
+
+
+def _prescale_wallpapers(
+    themes: Sequence[Theme],
+    themes_root: Path,
+    console: Console,
+    platform: str | None,
+    jobs: int,
+) -> None:
+    from .prescale import build_index, detect_displays, scaler_available
+
+    if not scaler_available():
+        console.print(
+            "[yellow]![/yellow] No image scaler (vipsthumbnail or ImageMagick) found; "
+            "skipping wallpaper pre-scaling"
+        )
+        return
+    displays = detect_displays(platform or _host_platform())
+    if not displays:
+        console.print("[yellow]![/yellow] No displays detected; skipping pre-scaling")
+        return
+    wallpapers = [
+        (themes_root / theme.slug / rel, entry["sha256"])
+        for theme in themes
+        for rel, entry in _load_manifest(themes_root / theme.slug).items()
+        if _target_for(rel) == WALLPAPERS and "sha256" in entry
+    ]
+    _, result = build_index(wallpapers, displays, jobs)
+    sizes = ", ".join(
+        sorted({f"{display.width}x{display.height}" for display in displays})
+    )
+    console.print(
+        f"[cyan]→[/cyan] Pre-scaled wallpapers for {sizes}: {result.created} created, "
+        f"{result.reused} reused, {result.failed} failed"
+    )
+
+
+def _host_platform() -> str:
+    import sys
+
+    return "darwin" if sys.platform == "darwin" else "linux"
+
+
+def sync_assets(
+    repo: ThemeRepository,
+    console: Console | None = None,
+    force: bool = False,
+    jobs: int | None = None,
+    targets: Iterable[str] | None = None,
+    platform: str | None = None,
+    prescale: bool = False,
+) -> SyncSummary:
+    """Bring ``~/.config/omarchy/themes`` up to date with the theme metadata.
+
+    Each theme directory carries a manifest of output hashes and the stat
+    state they were written with, so unchanged outputs cost a stat call,
+    only outputs whose content moved are rewritten, and stale files are
+    pruned individually. Copied files go through :class:`Materializer`, so
+    wallpapers are reflinked, hardlinked or symlinked rather than duplicated
+    where the filesystem allows. ``force`` ignores the manifests and rewrites
+    everything. ``jobs`` greater than one pipelines rendering and file I/O
+    across thread pools; ``jobs=1`` keeps the plain serial loop.
+
+    ``targets`` limits the sync to those registered renderers (plus
+    ``wallpapers``) and leaves other targets' files untouched; ``platform``
+    drops targets that platform never reads and prunes their old files.
+    Raises ``ValueError`` for unknown targets or platforms. ``prescale``
+    also caches every wallpaper at each connected display's resolution (see
+    :mod:`themectl.prescale`).
+    """
+    selected = select_targets(targets, platform)
+    scope = selected if targets is not None else None
+    active_console = console or Console()
+    base = get_home() / ".config" / "omarchy"
+    themes_root = base / "themes"
+    _ensure_dir(themes_root)
+
+    themes = list(repo)
+    materializer = Materializer()
+    writer = AtomicWriter()
+    workers = jobs or default_jobs()
+
+    def render(theme: Theme, out: Console) -> dict[str, str | Path]:
+        return _theme_outputs(theme, out, selected)
+
+    def write(theme: Theme, outputs: Mapping[str, str | Path]) -> SyncSummary:
+        return _sync_theme(
+            themes_root / theme.slug, outputs, materializer, writer, force, scope
+        )
+
+    if workers > 1 and len(themes) > 1:
+        results = _sync_pipelined(themes, active_console, render, write, workers)
+    else:
+        results = _sync_serial(themes, active_console, render, write)
+
+    total = SyncSummary()
+    for theme, summary in results:
+        total.merge(summary)
+        active_console.print(
+            f"[green]•[/green] Synced {theme.display_name} ({summary.describe()})"
+        )
+
+    if scope is None:
+        total.removed += _prune_stale_themes(
+            themes_root, {theme.slug for theme in themes}
+        )
+    # Leave a fresh wallpaper index so cycle-background never has to rescan.
+    rebuild_index(themes_root)
+    if prescale:
+        _prescale_wallpapers(themes, themes_root, active_console, platform, workers)
+    if materializer.used:
+        active_console.print(
+            "[cyan]→[/cyan] Wallpapers materialized via "
+            + ", ".join(name for name in STRATEGIES if name in materializer.used)
+        )
+    return total
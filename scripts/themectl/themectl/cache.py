@@ -0,0 +1,63 @@
+"""On-disk snapshot cache keyed by source file stat signatures."""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Sequence
+
+# Bump when the pickled shape of cached objects changes.
+CACHE_FORMAT = 3
+
+StatSignature = tuple[int, int, int, int] | None
+
+
+def cache_dir() -> Path:
+    # Imported lazily: config itself snapshots through this module.
+    from .config import get_home
+
+    return get_home() / ".cache" / "themectl"
+
+
+def stat_signature(path: Path) -> StatSignature:
+    """Identify a file revision without reading it.
+
+    Nix store files all carry mtime 1, so device and inode are included to
+    notice a symlink being repointed at a new store path of the same size.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def snapshot_key(*paths: Path) -> tuple[Any, ...]:
+    return (CACHE_FORMAT,) + tuple((str(path), stat_signature(path)) for path in paths)
+
+
+def load_snapshot(name: str, key: Sequence[Any]) -> Any | None:
+    """Return the cached value for ``name`` if it was stored under ``key``."""
+    try:
+        with (cache_dir() / f"{name}.pickle").open("rb") as handle:
+            stored_key, value = pickle.load(handle)
+    except Exception:
+        return None
+    if stored_key != tuple(key):
+        return None
+    return value
+
+
+def store_snapshot(name: str, key: Sequence[Any], value: Any) -> None:
+    """Persist ``value`` atomically; cache write failures are never fatal."""
+    directory = cache_dir()
+    target = directory / f"{name}.pickle"
+    tmp = directory / f".{name}.{os.getpid()}.tmp"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as handle:
+            pickle.dump((tuple(key), value), handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except Exception:
+        tmp.unlink(missing_ok=True)
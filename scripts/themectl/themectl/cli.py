@@ -3,43 +3,77 @@
 from __future__ import annotations
 
 import shutil
+import sys
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import typer
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from typer import Exit
 
 from . import __version__
-from .assets import sync_assets
-from .config import ThemectlConfig, get_home, load_config
-from .hotkeys import flatten_bindings, load_manifest
-from .hooks import run_reload_hooks, update_wallpaper
-from .macos import (
-    MacOSModeController,
-    ensure_tcc_permissions,
-    ensure_yabai_sa,
-)
+from .config import ThemectlConfig, get_home, load_config, load_config_with_sources
 from .state import (
     read_current_background_path,
     read_current_theme,
     write_background_path,
 )
 from .themes import Theme, ThemeRepository, load_theme_metadata
+from .trace import span
+
+if TYPE_CHECKING:
+    from .assets import SyncSummary
+
+# Keep module-level imports to what `cycle`/`apply`/`version` execute. Hooks,
+# asset renderers, macOS helpers and Rich tables are imported by the commands
+# that use them (tests/test_imports.py enforces the budget).
 
 console = Console()
 app = typer.Typer(no_args_is_help=True, help="Unified theme automation CLI.")
 
 
+def run_reload_hooks(theme: Theme, cfg: ThemectlConfig, console: Console) -> None:
+    from .hooks import run_reload_hooks as _run_reload_hooks
+
+    _run_reload_hooks(theme, cfg, console)
+
+
+def update_wallpaper(console: Console) -> None:
+    from .hooks import update_wallpaper as _update_wallpaper
+
+    _update_wallpaper(console)
+
+
+def sync_assets(
+    repo: ThemeRepository,
+    console: Console,
+    force: bool = False,
+    jobs: Optional[int] = None,
+    targets: Optional[list[str]] = None,
+    platform: Optional[str] = None,
+    prescale: bool = False,
+) -> SyncSummary:
+    from .assets import sync_assets as _sync_assets
+
+    return _sync_assets(
+        repo,
+        console,
+        force=force,
+        jobs=jobs,
+        targets=targets,
+        platform=platform,
+        prescale=prescale,
+    )
+
+
 def _load(cfg_path: Optional[Path] = None) -> ThemectlConfig:
-    return load_config(cfg_path)
+    with span("load_config", path=str(cfg_path or "")):
+        return load_config(cfg_path)
 
 
 def _load_repo(cfg: ThemectlConfig) -> ThemeRepository:
-    return load_theme_metadata(cfg.metadata_path)
+    with span("load_theme_metadata", path=str(cfg.metadata_path)):
+        return load_theme_metadata(cfg.metadata_path)
 
 
 def _write_state(cfg: ThemectlConfig, slug: str) -> None:
@@ -49,18 +83,21 @@ def _write_state(cfg: ThemectlConfig, slug: str) -> None:
 
 
 def _safe_symlink(target: Path, link: Path) -> None:
-    if link.is_symlink():
-        link.unlink()
-    elif link.exists():
-        if link.is_dir():
-            shutil.rmtree(link)
-        else:
+    with span("symlink", link=str(link), target=str(target)):
+        if link.is_symlink():
             link.unlink()
-    link.parent.mkdir(parents=True, exist_ok=True)
-    link.symlink_to(target)
+        elif link.exists():
+            if link.is_dir():
+                shutil.rmtree(link)
+            else:
+                link.unlink()
+        link.parent.mkdir(parents=True, exist_ok=True)
+        link.symlink_to(target)
 
 
 def _walker_assets_ok(cfg: ThemectlConfig, console: Console) -> bool:
+    from rich.panel import Panel
+
     if cfg.platform != "linux":
         return True
 
@@ -116,7 +153,48 @@ def _walker_assets_ok(cfg: ThemectlConfig, console: Console) -> bool:
     return ok
 
 
-def _apply_theme(theme: Theme, cfg: ThemectlConfig) -> None:
+def _report_materialization(repo: ThemeRepository, console: Console) -> None:
+    from .materialize import forced_strategy, probe
+
+    themes_root = get_home() / ".config" / "omarchy" / "themes"
+    sample = next(
+        (src for theme in repo for src in theme.wallpapers if src and src.exists()),
+        None,
+    )
+    if sample is None or not themes_root.is_dir():
+        console.print("[yellow]![/yellow] Wallpaper materialization not probed")
+        return
+    try:
+        strategy = probe(sample, themes_root)
+    except OSError as exc:
+        console.print(f"[yellow]![/yellow] Wallpaper materialization failed: {exc}")
+        return
+    pinned = " (THEMECTL_MATERIALIZE)" if forced_strategy() else ""
+    console.print(
+        f"[green]✓[/green] Wallpaper materialization: {strategy}{pinned} "
+        f"into {themes_root}"
+    )
+
+
+def _report_tools(cfg: ThemectlConfig, console: Console) -> None:
+    from rich import box
+    from rich.table import Table
+
+    from .tools import TOOLS, flush, inventory
+
+    names = TOOLS.get(cfg.platform, ())
+    if not names:
+        return
+    table = Table(title="Tools", box=box.MINIMAL_DOUBLE_HEAD, header_style="bold cyan")
+    table.add_column("Tool")
+    table.add_column("Path")
+    for name, path in inventory(names).items():
+        table.add_row(name, path or "[yellow]not found[/yellow]")
+    flush()
+    console.print(table)
+
+
+def _apply_theme(theme: Theme, cfg: ThemectlConfig, console: Console) -> None:
     home = get_home()
     themes_root = home / ".config" / "omarchy" / "themes"
     theme_dir = themes_root / theme.slug
@@ -192,10 +270,247 @@ def _manifest_bindings(
     return None, bindings
 
 
+def _apply_named(
+    cfg: ThemectlConfig, repo: ThemeRepository, query: str, console: Console
+) -> None:
+    from rich.panel import Panel
+
+    match = repo.get(query)
+    if not match:
+        console.print(f"[red]Theme '{query}' not found in {cfg.metadata_path}[/red]")
+        raise Exit(1)
+    _apply_theme(match, cfg, console)
+    run_reload_hooks(match, cfg, console)
+    console.print(
+        Panel(
+            f"[cyan]Applied[/cyan] {match.display_name} on {cfg.platform}",
+            title="themectl",
+            border_style="green",
+        )
+    )
+
+
+def _preview_named(
+    cfg: ThemectlConfig, repo: ThemeRepository, query: str, console: Console
+) -> Theme:
+    from .palette import theme_palette
+    from .preview import broadcast, sequences
+
+    match = repo.get(query)
+    if not match:
+        console.print(f"[red]Theme '{query}' not found in {cfg.metadata_path}[/red]")
+        raise Exit(1)
+    payload = sequences(theme_palette(match).toml())
+    if not payload:
+        console.print(
+            f"[yellow]![/yellow] No colors/{match.slug}.toml palette to preview"
+        )
+        raise Exit(1)
+    count = broadcast(payload)
+    console.print(
+        f"[green]✓[/green] Previewing {match.display_name} in {count} terminal(s)"
+    )
+    return match
+
+
+def _reset_preview(console: Console) -> None:
+    from .preview import RESET, broadcast
+
+    count = broadcast(RESET)
+    console.print(f"[green]✓[/green] Restored colors in {count} terminal(s)")
+
+
+def _notify(summary: str, body: str) -> None:
+    """Desktop notification for hotkey-launched commands that have no terminal."""
+    import subprocess
+
+    from .tools import which
+
+    notify_send = which("notify-send")
+    if notify_send:
+        subprocess.run([notify_send, summary, body, "-t", "3000"], check=False)
+
+
+def _pick(cfg: ThemectlConfig, repo: ThemeRepository, console: Console) -> None:
+    import subprocess
+
+    from .tools import which
+
+    themes_root = get_home() / ".config" / "omarchy" / "themes"
+    choices = [theme for theme in repo if (themes_root / theme.slug).is_dir()]
+    if not choices:
+        console.print(
+            "[yellow]No themes found; run `themectl sync-assets` first[/yellow]"
+        )
+        _notify("No themes found", "Run themectl sync-assets first")
+        raise Exit(1)
+    walker = which("walker")
+    if not walker:
+        console.print(
+            "[red]walker not found; `themectl pick` needs walker --dmenu[/red]"
+        )
+        raise Exit(1)
+    current = (read_current_theme(cfg.state_path) or "").lower()
+    index = next((i for i, theme in enumerate(choices) if theme.slug == current), 0)
+    # Walker 2.x marks the current entry with -c <index> (0.13 used -a).
+    result = subprocess.run(
+        [walker, "--dmenu", "-p", "Theme", "-c", str(index)],
+        input="\n".join(theme.display_name for theme in choices) + "\n",
+        capture_output=True,
+        text=True,
+    )
+    selected = result.stdout.strip()
+    if not selected or selected == "CNCLD":
+        return
+    match = repo.get(selected)
+    if not match:
+        console.print(f"[red]Theme '{selected}' not found in {cfg.metadata_path}[/red]")
+        _notify("Failed to apply theme", selected)
+        raise Exit(1)
+    try:
+        _apply_named(cfg, repo, match.slug, console)
+    except Exit:
+        _notify("Failed to apply theme", match.display_name)
+        raise
+
+
+def _cycle(
+    cfg: ThemectlConfig, repo: ThemeRepository, direction: str, console: Console
+) -> None:
+    from rich.panel import Panel
+
+    target = _cycle_theme(cfg, repo, direction)
+    if not target:
+        console.print("[yellow]No themes available to cycle[/yellow]")
+        raise Exit(1)
+    _apply_theme(target, cfg, console)
+    run_reload_hooks(target, cfg, console)
+    console.print(
+        Panel(
+            f"[cyan]Cycled[/cyan] to {target.display_name} ({direction})",
+            title="themectl",
+            border_style="green",
+        )
+    )
+
+
+def _cycle_background(cfg: ThemectlConfig, direction: str, console: Console) -> None:
+    from rich.panel import Panel
+
+    home = get_home()
+    themes_dir = home / ".config" / "omarchy" / "themes"
+
+    if not themes_dir.exists():
+        console.print(
+            "[yellow]No themes directory found. Run `themectl sync-assets` first.[/yellow]"
+        )
+        raise Exit(1)
+
+    from .state import read_current_background_index, write_background_index
+    from .wallpapers import load_index
+
+    # Every wallpaper from every theme, in the order sync-assets indexed them
+    index = load_index(themes_dir)
+    if not len(index):
+        console.print("[yellow]No wallpapers found in any theme[/yellow]")
+        raise Exit(1)
+
+    if len(index) == 1:
+        console.print("[cyan]Only one wallpaper available across all themes[/cyan]")
+        return
+
+    # Read current background path and its last known position
+    background_state = cfg.state_path.parent / ".current-background-path"
+    position_state = cfg.state_path.parent / ".current-background-index"
+    current_idx = index.find(
+        read_current_background_path(background_state),
+        read_current_background_index(position_state),
+    )
+    current_idx = current_idx or 0
+
+    # Calculate next index
+    if direction == "prev":
+        new_idx = (current_idx - 1) % len(index)
+    else:
+        new_idx = (current_idx + 1) % len(index)
+
+    # Update symlink to new background
+    new_background = index.path(new_idx)
+    current_root = home / ".config" / "omarchy" / "current"
+    _safe_symlink(new_background, current_root / "background")
+
+    # Save new background path and position
+    write_background_path(background_state, str(new_background))
+    write_background_index(position_state, new_idx)
+
+    # Update wallpaper
+    update_wallpaper(console)
+
+    # Extract theme name from path for display
+    theme_name = new_background.parent.parent.name
+
+    console.print(
+        Panel(
+            f"[cyan]Cycled[/cyan] to wallpaper {new_idx + 1}/{len(index)} ({theme_name}/{new_background.name})",
+            title="themectl",
+            border_style="green",
+        )
+    )
+
+
+def _show_hotkeys(
+    cfg: ThemectlConfig,
+    manifest: Mapping[str, Any],
+    platform: str | None,
+    console: Console,
+) -> None:
+    from rich import box
+    from rich.table import Table
+
+    from .hotkeys import flatten_bindings
+
+    target = platform or _platform_manifest_key(cfg.platform)
+    try:
+        mode, bindings = _manifest_bindings(manifest, target)
+    except KeyError:
+        console.print(f"[red]No hotkey bindings defined for {target}[/red]")
+        raise Exit(1)
+
+    rows = flatten_bindings(bindings)
+    if not rows:
+        console.print(f"[yellow]No bindings declared for {target}[/yellow]")
+        raise Exit(1)
+
+    subtitle = f"{target}{f'/{mode}' if mode else ''}"
+    table = Table(
+        title=f"Hotkeys ({subtitle})",
+        box=box.MINIMAL_DOUBLE_HEAD,
+        header_style="bold cyan",
+    )
+    table.add_column("Action")
+    table.add_column("Chord")
+    for action, chord in rows:
+        table.add_row(action, chord)
+    console.print(table)
+
+
 @app.callback()
-def main() -> None:  # pragma: no cover - Typer callback for --version
+def main(
+    ctx: typer.Context,
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        envvar="THEMECTL_TRACE",
+        help="Write a Chrome trace-event JSON timeline (open in Perfetto).",
+    ),
+) -> None:
     """themectl root command."""
 
+    if trace is not None:
+        from .trace import session
+
+        ctx.with_resource(session(trace, f"themectl {ctx.invoked_subcommand}"))
+
 
 @app.command()
 def version() -> None:
@@ -208,6 +523,9 @@ def version() -> None:
 def status(config: Optional[Path] = typer.Option(None, "--config", "-c")) -> None:
     """Show theme status."""
 
+    from rich import box
+    from rich.table import Table
+
     cfg = _load(config)
     repo = _load_repo(cfg)
     current = read_current_theme(cfg.state_path)
@@ -262,19 +580,53 @@ def apply(
 
     cfg = _load(config)
     repo = _load_repo(cfg)
-    match = repo.get(theme)
-    if not match:
-        console.print(f"[red]Theme '{theme}' not found in {cfg.metadata_path}[/red]")
+    _apply_named(cfg, repo, theme, console)
+
+
+@app.command()
+def preview(
+    theme: Optional[str] = typer.Argument(None, help="Theme to preview."),
+    reset: bool = typer.Option(
+        False, "--reset", help="Give every terminal back its configured colors."
+    ),
+    config: Optional[Path] = typer.Option(None, "--config", "-c"),
+) -> None:
+    """Preview a theme's palette in open terminals without applying it."""
+
+    if reset:
+        _reset_preview(console)
+        return
+    if theme is None:
+        console.print("[red]Pass a theme to preview, or --reset[/red]")
         raise Exit(1)
-    _apply_theme(match, cfg)
-    run_reload_hooks(match, cfg, console)
-    console.print(
-        Panel(
-            f"[cyan]Applied[/cyan] {match.display_name} on {cfg.platform}",
-            title="themectl",
-            border_style="green",
-        )
-    )
+    cfg = _load(config)
+    repo = _load_repo(cfg)
+    match = _preview_named(cfg, repo, theme, console)
+    if not sys.stdin.isatty():
+        return
+    try:
+        console.input("[cyan]Enter[/cyan] applies, [cyan]Ctrl-C[/cyan] reverts: ")
+    except (KeyboardInterrupt, EOFError):
+        console.print()
+        _reset_preview(console)
+        return
+
+    from .preview import RESET, broadcast
+
+    # Drop the overrides so terminals pick up the applied theme's config.
+    broadcast(RESET)
+    _apply_named(cfg, repo, match.slug, console)
+
+
+@app.command()
+def pick(
+    config: Optional[Path] = typer.Option(None, "--config", "-c"),
+) -> None:
+    """Choose a theme in `walker --dmenu` and apply it."""
+
+    cfg = _load(config)
+    repo = _load_repo(cfg)
+    _pick(cfg, repo, console)
 
 
 @app.command()
@@ -286,19 +638,7 @@ def cycle(
 
     cfg = _load(config)
     repo = _load_repo(cfg)
-    target = _cycle_theme(cfg, repo, direction)
-    if not target:
-        console.print("[yellow]No themes available to cycle[/yellow]")
-        raise Exit(1)
-    _apply_theme(target, cfg)
-    run_reload_hooks(target, cfg, console)
-    console.print(
-        Panel(
-            f"[cyan]Cycled[/cyan] to {target.display_name} ({direction})",
-            title="themectl",
-            border_style="green",
-        )
-    )
+    _cycle(cfg, repo, direction, console)
 
 
 @app.command("cycle-background")
@@ -309,99 +649,120 @@ def cycle_background(
     """Cycle through wallpapers from ALL themes."""
 
     cfg = _load(config)
-
-    home = get_home()
-    themes_dir = home / ".config" / "omarchy" / "themes"
-
-    if not themes_dir.exists():
-        console.print(
-            "[yellow]No themes directory found. Run `themectl sync-assets` first.[/yellow]"
-        )
-        raise Exit(1)
-
-    # Collect ALL wallpapers from ALL themes
-    all_backgrounds: list[Path] = []
-    for theme_dir in sorted(themes_dir.iterdir()):
-        if not theme_dir.is_dir():
-            continue
-        backgrounds_dir = theme_dir / "backgrounds"
-        if not backgrounds_dir.exists():
-            continue
-        for bg in sorted(backgrounds_dir.iterdir()):
-            if bg.is_file() and bg.suffix.lower() in (".png", ".jpg", ".jpeg", ".webp"):
-                all_backgrounds.append(bg)
-
-    if not all_backgrounds:
-        console.print("[yellow]No wallpapers found in any theme[/yellow]")
-        raise Exit(1)
-
-    if len(all_backgrounds) == 1:
-        console.print("[cyan]Only one wallpaper available across all themes[/cyan]")
-        return
-
-    # Read current background path
-    background_state = cfg.state_path.parent / ".current-background-path"
-    current_path_str = read_current_background_path(background_state)
-
-    # Find current index in the global list
-    current_idx = 0
-    if current_path_str:
-        current_path = Path(current_path_str)
-        for i, bg in enumerate(all_backgrounds):
-            if bg == current_path or bg.resolve() == current_path.resolve():
-                current_idx = i
-                break
-
-    # Calculate next index
-    if direction == "prev":
-        new_idx = (current_idx - 1) % len(all_backgrounds)
-    else:
-        new_idx = (current_idx + 1) % len(all_backgrounds)
-
-    # Update symlink to new background
-    new_background = all_backgrounds[new_idx]
-    current_root = home / ".config" / "omarchy" / "current"
-    _safe_symlink(new_background, current_root / "background")
-
-    # Save new background path
-    write_background_path(background_state, str(new_background))
-
-    # Update wallpaper
-    update_wallpaper(console)
-
-    # Extract theme name from path for display
-    theme_name = new_background.parent.parent.name
-
-    console.print(
-        Panel(
-            f"[cyan]Cycled[/cyan] to wallpaper {new_idx + 1}/{len(all_backgrounds)} ({theme_name}/{new_background.name})",
-            title="themectl",
-            border_style="green",
-        )
-    )
+    _cycle_background(cfg, direction, console)
 
 
 @app.command("sync-assets")
 def sync_assets_cmd(
     config: Optional[Path] = typer.Option(None, "--config", "-c"),
+    force: bool = typer.Option(
+        False, "--force", help="Rewrite every output, ignoring sync manifests."
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Themes to render and write concurrently (default: CPU count, max 8).",
+    ),
+    targets: Optional[str] = typer.Option(
+        None,
+        "--targets",
+        "-t",
+        help="Comma-separated targets to sync (e.g. kitty,ghostty,wallpapers).",
+    ),
+    platform: Optional[str] = typer.Option(
+        None,
+        "--platform",
+        "-p",
+        help="Only sync targets used on this platform (darwin or linux).",
+    ),
+    prescale: bool = typer.Option(
+        False,
+        "--prescale",
+        help="Cache wallpapers scaled to each connected display's resolution.",
+    ),
 ) -> None:
     """Synchronize Omarchy assets locally."""
 
+    from rich.panel import Panel
+
     cfg = _load(config)
     repo = _load_repo(cfg)
     if not repo.themes:
         console.print("[yellow]No themes found; cannot sync assets[/yellow]")
         raise Exit(1)
-    sync_assets(repo, console)
+    selected = (
+        [name.strip() for name in targets.split(",") if name.strip()]
+        if targets is not None
+        else None
+    )
+    try:
+        summary = sync_assets(
+            repo,
+            console,
+            force=force,
+            jobs=jobs,
+            targets=selected,
+            platform=platform,
+            prescale=prescale,
+        )
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise Exit(1)
     console.print(
         Panel(
-            "Assets synchronized under ~/.config/omarchy/themes",
+            f"Assets synchronized under ~/.config/omarchy/themes\n{summary.describe()}",
             title="themectl",
             border_style="green",
         )
     )
 
 
+@app.command("install-extensions")
+def install_extensions_cmd(
+    config: Optional[Path] = typer.Option(None, "--config", "-c"),
+) -> None:
+    """Install every theme's VSCode/Cursor extension in one call per editor."""
+
+    from .extensions import install_extensions, missing_extensions, theme_extension
+    from .tools import which
+
+    cfg = _load(config)
+    repo = _load_repo(cfg)
+    editors = [
+        (editor, label)
+        for editor, label, enabled in (
+            ("code", "VSCode", cfg.editor_automation.vscode),
+            ("cursor", "Cursor", cfg.editor_automation.cursor),
+        )
+        if enabled and which(editor)
+    ]
+    if not editors:
+        console.print("[cyan]-[/cyan] No VSCode/Cursor CLI found; nothing to install")
+        return
+    failed = False
+    for editor, label in editors:
+        wanted = [theme_extension(theme, editor) for theme in repo.themes]
+        missing = missing_extensions(editor, [ext for ext in wanted if ext])
+        if not missing:
+            console.print(
+                f"[green]✓[/green] {label} theme extensions already installed"
+            )
+            continue
+        console.print(
+            f"[cyan]...[/cyan] Installing {len(missing)} {label} extension(s): "
+            + ", ".join(missing)
+        )
+        if install_extensions(editor, missing):
+            console.print(f"[green]✓[/green] Installed {label} extensions")
+        else:
+            console.print(f"[yellow]![/yellow] Failed to install {label} extensions")
+            failed = True
+    if failed:
+        raise Exit(1)
+
+
 @app.command("macos-mode")
 def macos_mode(
     mode: str = typer.Argument(..., help="bsp or native"),
@@ -409,6 +770,8 @@ def macos_mode(
 ) -> None:
     """Toggle macOS BSP/native mode."""
 
+    from .macos import MacOSModeController
+
     cfg = _load(config)
     if cfg.platform != "darwin":
         console.print("[red]macos-mode is only available on macOS[/red]")
@@ -427,6 +790,8 @@ def doctor(
 ) -> None:
     """Run health checks."""
 
+    from rich.panel import Panel
+
     cfg = _load(config)
     repo = _load_repo(cfg)
     ok = True
@@ -439,10 +804,14 @@ def doctor(
         )
         ok = False
     if cfg.platform == "darwin":
+        from .macos import ensure_tcc_permissions, ensure_yabai_sa
+
         ok = ensure_yabai_sa(console) and ok
         ok = ensure_tcc_permissions(console) and ok
     if cfg.platform == "linux":
         ok = _walker_assets_ok(cfg, console) and ok
+    _report_materialization(repo, console)
+    _report_tools(cfg, console)
     if ok:
         console.print(
             Panel("All checks passed", title="themectl", border_style="green")
@@ -463,28 +832,70 @@ def hotkeys(
 ) -> None:
     """Show hotkey bindings from the manifest."""
 
+    from .hotkeys import load_manifest
+
     cfg = _load(config)
     manifest = load_manifest(cfg.hotkeys_path)
-    target = platform or _platform_manifest_key(cfg.platform)
-    try:
-        mode, bindings = _manifest_bindings(manifest, target)
-    except KeyError:
-        console.print(f"[red]No hotkey bindings defined for {target}[/red]")
-        raise Exit(1)
+    _show_hotkeys(cfg, manifest, platform, console)
 
-    rows = flatten_bindings(bindings)
-    if not rows:
-        console.print(f"[yellow]No bindings declared for {target}[/yellow]")
-        raise Exit(1)
 
-    subtitle = f"{target}{f'/{mode}' if mode else ''}"
+@app.command("config")
+def config_cmd(
+    config: Optional[Path] = typer.Option(None, "--config", "-c"),
+    explain: bool = typer.Option(
+        False, "--explain", help="Show which file each effective value came from."
+    ),
+) -> None:
+    """Print the effective configuration."""
+
+    from .config import effective_settings
+
+    cfg, sources = load_config_with_sources(config)
+    rows = [
+        (name, ", ".join(value) if isinstance(value, list) else str(value))
+        for name, value in effective_settings(cfg)
+    ]
+    if not explain:
+        for name, value in rows:
+            console.print(f"{name} = {value}", highlight=False, markup=False)
+        return
+
+    from rich import box
+    from rich.table import Table
+
     table = Table(
-        title=f"Hotkeys ({subtitle})",
+        title="Effective configuration",
         box=box.MINIMAL_DOUBLE_HEAD,
         header_style="bold cyan",
     )
-    table.add_column("Action")
-    table.add_column("Chord")
-    for action, chord in rows:
-        table.add_row(action, chord)
+    table.add_column("Setting")
+    table.add_column("Value")
+    table.add_column("Source")
+    for name, value in rows:
+        table.add_row(name, value or "—", sources.get(name, "default"))
     console.print(table)
+
+
+@app.command()
+def daemon(
+    config: Optional[Path] = typer.Option(None, "--config", "-c"),
+    socket: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="UNIX socket path (defaults to $XDG_RUNTIME_DIR/themectl.sock).",
+    ),
+) -> None:
+    """Keep config and theme metadata resident for `themectl-client`."""
+
+    from .client import socket_path
+    from .daemon import serve
+
+    path = socket or socket_path()
+    console.print(f"[cyan]→[/cyan] themectl daemon listening on {path}")
+    try:
+        serve(config.expanduser().resolve() if config else None, path)
+    except RuntimeError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise Exit(1)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,184 @@
+"""Thin socket client for a resident `themectl daemon`.
+
+Hotkeys call this instead of the full CLI so a keypress costs one socket
+round-trip rather than an interpreter start plus Typer/Rich/YAML imports.
+Only the standard library is imported here; anything the daemon cannot
+serve falls back to the regular Typer app in-process.
+
+Hooks depend on the caller's session (``TMUX``, the Hyprland instance,
+``PATH``), so each request carries the `FORWARDED_ENV` variables and the
+daemon runs it under them. Traced runs (``THEMECTL_TRACE``) always run
+in-process so the trace covers the caller's own command.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+FORWARDED_COMMANDS = ("apply", "cycle", "cycle-background", "preview")
+
+# Environment the reload hooks read; sent with every request and applied by
+# the daemon for its duration (unset variables are unset there too).
+FORWARDED_ENV = (
+    "PATH",
+    "TMPDIR",
+    "XDG_RUNTIME_DIR",
+    "WAYLAND_DISPLAY",
+    "DISPLAY",
+    "HYPRLAND_INSTANCE_SIGNATURE",
+    "TMUX",
+    "THEME_DISABLE_EDITOR_AUTOMATION",
+    "THEMECTL_HOOK_TIMEOUT",
+    "THEMECTL_HOOK_WORKERS",
+    "THEMECTL_WALLPAPER_SIZES",
+)
+
+_OPTION_NAMES = {
+    "--direction": "direction",
+    "-d": "direction",
+    "--config": "config",
+    "-c": "config",
+}
+
+
+def socket_path() -> Path:
+    override = os.environ.get("THEMECTL_SOCKET")
+    if override:
+        return Path(override).expanduser()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "themectl.sock"
+    tmp_dir = os.environ.get("TMPDIR") or "/tmp"
+    return Path(tmp_dir) / f"themectl-{os.getuid()}.sock"
+
+
+def write_message(handle: Any, payload: Mapping[str, Any]) -> None:
+    handle.write(json.dumps(payload).encode() + b"\n")
+    handle.flush()
+
+
+def read_message(handle: Any) -> dict[str, Any] | None:
+    line = handle.readline()
+    if not line:
+        return None
+    data = json.loads(line)
+    if isinstance(data, dict):
+        return data
+    return None
+
+
+def parse_request(argv: Sequence[str]) -> dict[str, Any] | None:
+    """Translate CLI arguments into a daemon request, or None if unsupported."""
+    if not argv or argv[0] not in FORWARDED_COMMANDS:
+        return None
+    command, rest = argv[0], list(argv[1:])
+    args: dict[str, Any] = {}
+    config: str | None = None
+    positional: list[str] = []
+    while rest:
+        token = rest.pop(0)
+        name, _, inline = token.partition("=")
+        if name in _OPTION_NAMES:
+            value = inline if inline else (rest.pop(0) if rest else None)
+            if value is None:
+                return None
+            if _OPTION_NAMES[name] == "config":
+                config = str(Path(value).expanduser().resolve())
+            else:
+                args[_OPTION_NAMES[name]] = value
+        elif token == "--reset" and command == "preview":
+            args["reset"] = True
+        elif token.startswith("-"):
+            return None
+        else:
+            positional.append(token)
+    if command == "apply":
+        if len(positional) != 1:
+            return None
+        args["theme"] = positional[0]
+    elif command == "preview":
+        # Only --reset: a preview needs the caller's TTY for Enter/Ctrl-C.
+        if not args.get("reset") or positional:
+            return None
+    elif positional:
+        return None
+    return {"command": command, "args": args, "config": config}
+
+
+def send_request(
+    request: Mapping[str, Any], path: Path | None = None, timeout: float = 120.0
+) -> dict[str, Any] | None:
+    """Send a request to the daemon; returns None when it is not reachable.
+
+    Once connected the command is never retried in-process, so a failure
+    mid-request is reported rather than applied twice.
+    """
+    target = path or socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(0.5)
+        try:
+            sock.connect(str(target))
+        except OSError:
+            return None
+        sock.settimeout(timeout)
+        try:
+            with sock.makefile("rwb") as handle:
+                write_message(handle, request)
+                response = read_message(handle)
+        except (OSError, ValueError) as exc:
+            return {"exit_code": 1, "output": f"themectl daemon error: {exc}\n"}
+    finally:
+        sock.close()
+    if response is None:
+        return {"exit_code": 1, "output": "themectl daemon closed the connection\n"}
+    return response
+
+
+def _terminal_width() -> int:
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        return 80
+
+
+def _run_in_process(argv: Sequence[str]) -> int:
+    from .cli import app
+
+    try:
+        app(args=list(argv), prog_name="themectl")
+    except SystemExit as exc:
+        code = exc.code
+        return code if isinstance(code, int) else (0 if code is None else 1)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    request = parse_request(args)
+    if request is None or os.environ.get("THEMECTL_TRACE"):
+        return _run_in_process(args)
+    request["tty"] = sys.stdout.isatty()
+    request["width"] = _terminal_width()
+    request["env"] = {
+        name: os.environ[name] for name in FORWARDED_ENV if name in os.environ
+    }
+    response = send_request(request)
+    if response is None:
+        return _run_in_process(args)
+    sys.stdout.write(str(response.get("output", "")))
+    sys.stdout.flush()
+    return int(response.get("exit_code", 1))
+
+
+def run() -> None:  # pragma: no cover
+    sys.exit(main())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    run()
@@ -0,0 +1,266 @@
+"""Color math over whole palettes at once.
+
+Every function takes and returns sequences, so a palette (or every palette
+in the metadata) is converted in one call. There is no numpy here: the
+per-channel sRGB transfer curve is a 256-entry lookup table, parsing and
+OKLab conversion are memoized per distinct input (themes share most of their
+colors), and the loops stay in local-variable bytecode.
+
+Supported forms: ``#rgb``, ``#rrggbb[aa]``, Hyprland ``rgba(rrggbbaa)`` /
+``rgb(rrggbb)`` and ``0xaarrggbb``. Contrast follows WCAG 2; lightness
+variants are computed in OKLab so dim/bright steps look even across hues.
+"""
+
+from __future__ import annotations
+
+import colorsys
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Iterable, Sequence
+
+# 8-bit sRGB channel -> linear light.
+LINEAR = tuple(
+    c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (v / 255 for v in range(256))
+)
+
+# 8-bit channel -> two hex digits, so formatting is string concatenation.
+HEX2 = tuple(f"{value:02x}" for value in range(256))
+
+_HEX6 = re.compile(r"#[0-9a-fA-F]{6}")
+_FORMS = re.compile(
+    r"#(?P<short>[0-9a-fA-F]{3})"
+    r"|#(?P<hex>[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?)"
+    r"|rgba?\((?P<hypr>[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?)\)"
+    r"|0x(?P<argb>[0-9a-fA-F]{8})"
+)
+
+Oklab = tuple[float, float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class Color:
+    # The value exactly as written in colors.toml or the theme metadata.
+    source: str
+    rgb: tuple[int, int, int]
+    alpha: float = 1.0
+
+    @property
+    def normalized(self) -> tuple[float, float, float, float]:
+        r, g, b = self.rgb
+        return (r / 255, g / 255, b / 255, self.alpha)
+
+    @property
+    def hex(self) -> str:
+        r, g, b = self.rgb
+        return "#" + HEX2[r] + HEX2[g] + HEX2[b]
+
+    @property
+    def hyprland(self) -> str:
+        """Hyprland's ``rgba(rrggbbaa)`` form."""
+        r, g, b = self.rgb
+        return f"rgba({HEX2[r]}{HEX2[g]}{HEX2[b]}{HEX2[round(self.alpha * 255)]})"
+
+    @property
+    def argb(self) -> str:
+        """The ``0xaarrggbb`` form (Hyprland legacy, Qt)."""
+        r, g, b = self.rgb
+        return f"0x{HEX2[round(self.alpha * 255)]}{HEX2[r]}{HEX2[g]}{HEX2[b]}"
+
+    def css(self, alpha: float | None = None) -> str:
+        """CSS/hyprlock ``rgba(r,g,b,a)``, optionally with a different alpha."""
+        r, g, b = self.rgb
+        return f"rgba({r},{g},{b},{self.alpha if alpha is None else alpha})"
+
+    @property
+    def luminance(self) -> float:
+        """WCAG 2 relative luminance."""
+        r, g, b = self.rgb
+        return 0.2126 * LINEAR[r] + 0.7152 * LINEAR[g] + 0.0722 * LINEAR[b]
+
+
+BLACK = Color("#000000", (0, 0, 0))
+
+
+def parse_color(value: Any) -> Color | None:
+    """Parse one color string; None for anything that is not a color."""
+    return _parse(value) if isinstance(value, str) else None
+
+
+@cache
+def _parse(value: str) -> Color | None:
+    text = value.strip()
+    if _HEX6.fullmatch(text):  # by far the common form
+        n = int(text[1:], 16)
+        return Color(value, (n >> 16, (n >> 8) & 0xFF, n & 0xFF))
+    match = _FORMS.fullmatch(text)
+    if not match:
+        return None
+    if match["short"]:
+        digits = "".join(ch * 2 for ch in match["short"])
+    elif match["argb"]:
+        digits = match["argb"][2:] + match["argb"][:2]
+    else:
+        digits = match["hex"] or match["hypr"]
+    rgb = (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+    alpha = int(digits[6:8], 16) / 255 if len(digits) == 8 else 1.0
+    return Color(value, rgb, alpha)
+
+
+def parse(values: Iterable[Any]) -> list[Color | None]:
+    return [parse_color(value) for value in values]
+
+
+def to_hex(colors: Iterable[Color]) -> list[str]:
+    hex2 = HEX2
+    return ["#" + hex2[r] + hex2[g] + hex2[b] for r, g, b in (c.rgb for c in colors)]
+
+
+def to_hyprland(colors: Iterable[Color]) -> list[str]:
+    hex2 = HEX2
+    return [
+        f"rgba({hex2[c.rgb[0]]}{hex2[c.rgb[1]]}{hex2[c.rgb[2]]}"
+        f"{hex2[round(c.alpha * 255)]})"
+        for c in colors
+    ]
+
+
+def to_argb(colors: Iterable[Color]) -> list[str]:
+    hex2 = HEX2
+    return [
+        f"0x{hex2[round(c.alpha * 255)]}{hex2[c.rgb[0]]}{hex2[c.rgb[1]]}{hex2[c.rgb[2]]}"
+        for c in colors
+    ]
+
+
+def to_css(colors: Iterable[Color], alpha: float | None = None) -> list[str]:
+    return [color.css(alpha) for color in colors]
+
+
+def luminance(colors: Iterable[Color]) -> list[float]:
+    linear = LINEAR
+    return [
+        0.2126 * linear[r] + 0.7152 * linear[g] + 0.0722 * linear[b]
+        for r, g, b in (color.rgb for color in colors)
+    ]
+
+
+def contrast(foregrounds: Sequence[Color], backgrounds: Sequence[Color]) -> list[float]:
+    """WCAG 2 contrast ratios (1.0 to 21.0) of each foreground/background pair."""
+    if len(foregrounds) != len(backgrounds):
+        raise ValueError("contrast() needs as many backgrounds as foregrounds")
+    ratios = []
+    for fg, bg in zip(luminance(foregrounds), luminance(backgrounds)):
+        light, dark = (fg, bg) if fg >= bg else (bg, fg)
+        ratios.append((light + 0.05) / (dark + 0.05))
+    return ratios
+
+
+def contrast_ratio(a: Color, b: Color) -> float:
+    return contrast([a], [b])[0]
+
+
+def to_hsl(colors: Iterable[Color]) -> list[tuple[float, float, float]]:
+    """Hue in degrees, saturation and lightness in 0..1."""
+    hsl = []
+    for r, g, b, _ in (color.normalized for color in colors):
+        h, lightness, s = colorsys.rgb_to_hls(r, g, b)
+        hsl.append((h * 360, s, lightness))
+    return hsl
+
+
+@cache
+def _oklab(rgb: tuple[int, int, int]) -> Oklab:
+    r, g, b = LINEAR[rgb[0]], LINEAR[rgb[1]], LINEAR[rgb[2]]
+    l_ = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m_ = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s_ = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def _encode(channel: float) -> int:
+    """Nearest 8-bit sRGB value for a linear channel (clipped), via ``LINEAR``."""
+    index = bisect_left(LINEAR, channel)
+    if index == 0:
+        return 0
+    if index == 256:
+        return 255
+    return index if LINEAR[index] - channel < channel - LINEAR[index - 1] else index - 1
+
+
+def to_oklab(colors: Iterable[Color]) -> list[Oklab]:
+    return [_oklab(color.rgb) for color in colors]
+
+
+def from_oklab(
+    labs: Iterable[Oklab], alphas: Iterable[float] | None = None
+) -> list[Color]:
+    """Colors for OKLab triples, clipped into sRGB."""
+    colors = []
+    alpha_list = list(alphas) if alphas is not None else None
+    for index, (lightness, a, b) in enumerate(labs):
+        l_ = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
+        m_ = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
+        s_ = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
+        rgb = (
+            _encode(4.0767416621 * l_ - 3.3077115913 * m_ + 0.2309699292 * s_),
+            _encode(-1.2684380046 * l_ + 2.6097574011 * m_ - 0.3413193965 * s_),
+            _encode(-0.0041960863 * l_ - 0.7034186147 * m_ + 1.7076147010 * s_),
+        )
+        alpha = alpha_list[index] if alpha_list is not None else 1.0
+        colors.append(
+            Color("#" + HEX2[rgb[0]] + HEX2[rgb[1]] + HEX2[rgb[2]], rgb, alpha)
+        )
+    return colors
+
+
+def adjust_lightness(colors: Sequence[Color], delta: float) -> list[Color]:
+    """Shift OKLab lightness by ``delta`` (negative dims, positive brightens)."""
+    labs = [
+        (min(1.0, max(0.0, lightness + delta)), a, b)
+        for lightness, a, b in to_oklab(colors)
+    ]
+    return from_oklab(labs, (color.alpha for color in colors))
+
+
+def composite(
+    foregrounds: Sequence[Color], backgrounds: Sequence[Color]
+) -> list[Color]:
+    """Source-over blend each foreground onto its background in sRGB, as CSS does."""
+    if len(foregrounds) != len(backgrounds):
+        raise ValueError("composite() needs as many backgrounds as foregrounds")
+    hex2 = HEX2
+    blended = []
+    for fg, bg in zip(foregrounds, backgrounds):
+        top = fg.alpha
+        under = bg.alpha * (1 - top)
+        alpha = top + under
+        if alpha == 0:
+            blended.append(Color("#000000", (0, 0, 0), 0.0))
+            continue
+        (fr, fg_, fb), (br, bg_, bb) = fg.rgb, bg.rgb
+        rgb = (
+            round((fr * top + br * under) / alpha),
+            round((fg_ * top + bg_ * under) / alpha),
+            round((fb * top + bb * under) / alpha),
+        )
+        blended.append(
+            Color("#" + hex2[rgb[0]] + hex2[rgb[1]] + hex2[rgb[2]], rgb, alpha)
+        )
+    return blended
+
+
+def most_chromatic(colors: Sequence[Color]) -> Color | None:
+    """The color with the highest OKLab chroma, e.g. to derive an accent."""
+    best, best_chroma = None, -1.0
+    for color, (_, a, b) in zip(colors, to_oklab(colors)):
+        chroma = a * a + b * b
+        if chroma > best_chroma:
+            best, best_chroma = color, chroma
+    return best
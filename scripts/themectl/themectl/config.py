@@ -8,7 +8,8 @@ from pathlib import Path
 from typing import Any, Literal, Mapping
 
 import tomllib
-import yaml
+
+from .cache import load_snapshot, snapshot_key, stat_signature, store_snapshot
 
 
 def get_home() -> Path:
@@ -91,11 +92,40 @@ def _load_toml(path: Path) -> Mapping[str, Any]:
 
 
 def load_config(path: Path | None = None) -> ThemectlConfig:
+    return load_config_with_sources(path)[0]
+
+
+def load_config_with_sources(
+    path: Path | None = None,
+) -> tuple[ThemectlConfig, dict[str, str]]:
+    """Return the merged config plus the file each explicit setting came from.
+
+    The merged result is snapshotted under ~/.cache/themectl keyed by the stat
+    signatures of config.toml and automation.yaml, so steady-state invocations
+    neither parse TOML nor import PyYAML. Settings absent from the mapping use
+    their defaults.
+    """
     cfg_path = path or default_config_path()
 
     if not cfg_path.exists():
-        return ThemectlConfig()
+        return ThemectlConfig(), {}
+
+    key = snapshot_key(cfg_path)
+    cached = load_snapshot("config", key)
+    if isinstance(cached, tuple) and len(cached) == 3:
+        cfg, sources, automation_signature = cached
+        if stat_signature(cfg.automation_path) == automation_signature:
+            return cfg, sources
 
+    cfg, sources = _parse_config(cfg_path)
+    automation_signature = stat_signature(cfg.automation_path)
+    for name in _apply_automation_overrides(cfg):
+        sources[f"editor.{name}"] = str(cfg.automation_path)
+    store_snapshot("config", key, (cfg, sources, automation_signature))
+    return cfg, dict(sources)
+
+
+def _parse_config(cfg_path: Path) -> tuple[ThemectlConfig, dict[str, str]]:
     raw = _load_toml(cfg_path)
 
     editor_raw = raw.get("editor", {})
@@ -124,22 +154,56 @@ def load_config(path: Path | None = None) -> ThemectlConfig:
         if "automation_config" in raw
         else None,
     )
-    _apply_automation_overrides(cfg)
-    return cfg
 
-
-def _apply_automation_overrides(cfg: ThemectlConfig) -> None:
+    origin = str(cfg_path)
+    sources = {
+        key: origin
+        for key in (
+            "platform",
+            "theme_metadata",
+            "state_file",
+            "hotkeys_file",
+            "automation_config",
+        )
+        if key in raw
+    }
+    sources.update({f"editor.{key}": origin for key in editor_raw})
+    sources.update({f"order.{key}": origin for key in order_raw})
+    return cfg, sources
+
+
+def effective_settings(cfg: ThemectlConfig) -> list[tuple[str, Any]]:
+    """Flatten the resolved configuration into (setting, value) rows."""
+    return [
+        ("platform", cfg.platform),
+        ("theme_metadata", cfg.metadata_path),
+        ("state_file", cfg.state_path),
+        ("hotkeys_file", cfg.hotkeys_path),
+        ("automation_config", cfg.automation_path),
+        ("editor.vscode", cfg.editor_automation.vscode),
+        ("editor.cursor", cfg.editor_automation.cursor),
+        ("editor.neovim", cfg.editor_automation.neovim),
+        ("order.cycle", list(cfg.order.cycle)),
+    ]
+
+
+def _apply_automation_overrides(cfg: ThemectlConfig) -> list[str]:
     overrides = _load_automation_overrides(cfg.automation_path)
-    if not overrides:
-        return
+    applied: list[str] = []
     for name, value in overrides.items():
         if hasattr(cfg.editor_automation, name):
             setattr(cfg.editor_automation, name, value)
+            applied.append(name)
+    return applied
 
 
 def _load_automation_overrides(path: Path) -> Mapping[str, bool]:
     if not path.exists():
         return {}
+    # PyYAML is the heaviest import on the hot path; only pay for it when an
+    # automation file is actually present.
+    import yaml
+
     try:
         data = yaml.safe_load(path.read_text()) or {}
     except yaml.YAMLError:
@@ -0,0 +1,238 @@
+"""Resident themectl daemon serving hotkey-driven commands over a UNIX socket."""
+
+from __future__ import annotations
+
+import io
+import os
+import socketserver
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from rich.console import Console
+from typer import Exit
+
+from . import cli, environment
+from .cache import StatSignature, stat_signature
+from .client import (
+    FORWARDED_ENV,
+    read_message,
+    send_request,
+    socket_path,
+    write_message,
+)
+from .config import ThemectlConfig, default_config_path, load_config
+from .hotkeys import load_manifest
+from .themes import ThemeRepository, load_theme_metadata
+
+
+@dataclass(slots=True)
+class DaemonState:
+    """Parsed config, theme metadata and hotkey manifest kept in memory."""
+
+    config_path: Path | None
+    cfg: ThemectlConfig
+    repo: ThemeRepository
+    manifest: Mapping[str, Any] | None
+    signatures: tuple[StatSignature, ...]
+
+    @classmethod
+    def load(cls, config_path: Path | None) -> DaemonState:
+        cfg = load_config(config_path)
+        repo = load_theme_metadata(cfg.metadata_path)
+        try:
+            manifest: Mapping[str, Any] | None = load_manifest(cfg.hotkeys_path)
+        except (OSError, ValueError):
+            manifest = None
+        return cls(
+            config_path=config_path,
+            cfg=cfg,
+            repo=repo,
+            manifest=manifest,
+            signatures=_source_signatures(config_path, cfg),
+        )
+
+    def stale(self) -> bool:
+        return self.signatures != _source_signatures(self.config_path, self.cfg)
+
+
+def _source_signatures(
+    config_path: Path | None, cfg: ThemectlConfig
+) -> tuple[StatSignature, ...]:
+    return tuple(
+        stat_signature(path)
+        for path in (
+            config_path or default_config_path(),
+            cfg.automation_path,
+            cfg.metadata_path,
+            cfg.hotkeys_path,
+        )
+    )
+
+
+Handler = Callable[[DaemonState, Mapping[str, Any], Console], None]
+
+
+def _handle_apply(
+    state: DaemonState, args: Mapping[str, Any], console: Console
+) -> None:
+    cli._apply_named(state.cfg, state.repo, str(args.get("theme", "")), console)
+
+
+def _handle_cycle(
+    state: DaemonState, args: Mapping[str, Any], console: Console
+) -> None:
+    cli._cycle(state.cfg, state.repo, str(args.get("direction", "next")), console)
+
+
+def _handle_cycle_background(
+    state: DaemonState, args: Mapping[str, Any], console: Console
+) -> None:
+    cli._cycle_background(state.cfg, str(args.get("direction", "next")), console)
+
+
+def _handle_preview(
+    state: DaemonState, args: Mapping[str, Any], console: Console
+) -> None:
+    # Previews are interactive on the caller's TTY; clients only send --reset.
+    if not args.get("reset"):
+        console.print("[red]Run `themectl preview` in a terminal to preview[/red]")
+        raise Exit(2)
+    cli._reset_preview(console)
+
+
+def _handle_hotkeys(
+    state: DaemonState, args: Mapping[str, Any], console: Console
+) -> None:
+    if state.manifest is None:
+        console.print(
+            f"[red]Hotkey manifest unavailable: {state.cfg.hotkeys_path}[/red]"
+        )
+        raise Exit(1)
+    platform = args.get("platform")
+    cli._show_hotkeys(
+        state.cfg, state.manifest, str(platform) if platform else None, console
+    )
+
+
+def _handle_ping(state: DaemonState, args: Mapping[str, Any], console: Console) -> None:
+    console.print(
+        f"themectl daemon pid {os.getpid()} serving {len(state.repo.themes)} theme(s)"
+    )
+
+
+HANDLERS: dict[str, Handler] = {
+    "apply": _handle_apply,
+    "cycle": _handle_cycle,
+    "cycle-background": _handle_cycle_background,
+    "preview": _handle_preview,
+    "hotkeys": _handle_hotkeys,
+    "ping": _handle_ping,
+}
+
+
+def _caller_environment(env: Any) -> Mapping[str, str] | None:
+    """The daemon's environment with the client's `FORWARDED_ENV` values.
+
+    Forwarded variables the caller does not have are dropped. Requests
+    without ``env`` (older clients) keep the daemon's own environment.
+    """
+    if not isinstance(env, Mapping):
+        return None
+    merged = {
+        name: value for name, value in os.environ.items() if name not in FORWARDED_ENV
+    }
+    for name in FORWARDED_ENV:
+        value = env.get(name)
+        if isinstance(value, str):
+            merged[name] = value
+    return merged
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: ThemectlDaemon
+
+    def handle(self) -> None:
+        try:
+            request = read_message(self.rfile)
+        except ValueError:
+            request = None
+        if request is None:
+            write_message(self.wfile, {"exit_code": 2, "output": "Malformed request\n"})
+            return
+        write_message(self.wfile, self.server.dispatch(request))
+
+
+class ThemectlDaemon(socketserver.UnixStreamServer):
+    """Serve requests sequentially so concurrent keypresses never interleave."""
+
+    def __init__(self, path: Path, config_path: Path | None = None) -> None:
+        self.path = path
+        self.config_path = config_path
+        self._states: dict[Path | None, DaemonState] = {}
+        self._lock = threading.Lock()
+        _prepare_socket_path(path)
+        super().__init__(str(path), _RequestHandler)
+        os.chmod(path, 0o600)
+        self.state_for(config_path)
+
+    def state_for(self, config_path: Path | None) -> DaemonState:
+        state = self._states.get(config_path)
+        if state is None or state.stale():
+            state = DaemonState.load(config_path)
+            self._states[config_path] = state
+        return state
+
+    def dispatch(self, request: Mapping[str, Any]) -> dict[str, Any]:
+        buffer = io.StringIO()
+        width = request.get("width")
+        console = Console(
+            file=buffer,
+            force_terminal=bool(request.get("tty")),
+            width=width if isinstance(width, int) and width > 0 else 80,
+        )
+        handler = HANDLERS.get(str(request.get("command")))
+        if handler is None:
+            console.print(
+                f"[red]Unsupported daemon command: {request.get('command')}[/red]"
+            )
+            return {"exit_code": 2, "output": buffer.getvalue()}
+        raw_config = request.get("config")
+        config_path = Path(raw_config) if raw_config else self.config_path
+        args = request.get("args")
+        exit_code = 0
+        caller_env = _caller_environment(request.get("env"))
+        scope = nullcontext() if caller_env is None else environment.use(caller_env)
+        with self._lock, scope:
+            try:
+                state = self.state_for(config_path)
+                handler(state, args if isinstance(args, Mapping) else {}, console)
+            except Exit as exc:
+                exit_code = exc.exit_code
+            except Exception as exc:  # pragma: no cover - defensive logging
+                console.print(f"[red]themectl daemon error: {exc}[/red]")
+                exit_code = 1
+        return {"exit_code": exit_code, "output": buffer.getvalue()}
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def _prepare_socket_path(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists() and not path.is_symlink():
+        return
+    if send_request({"command": "ping"}, path) is not None:
+        raise RuntimeError(f"themectl daemon already listening on {path}")
+    path.unlink()
+
+
+def serve(config_path: Path | None = None, path: Path | None = None) -> None:
+    daemon = ThemectlDaemon(path or socket_path(), config_path)
+    try:
+        daemon.serve_forever()
+    finally:
+        daemon.server_close()
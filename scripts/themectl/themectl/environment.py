@@ -0,0 +1,44 @@
+"""The environment hooks read and hand to the processes they start.
+
+Normally that is ``os.environ``. The daemon serves each request under the
+caller's forwarded variables instead (see `themectl.client.FORWARDED_ENV`)
+by binding them in a context variable rather than rewriting ``os.environ``:
+hook threads copy the request's context when they start, so a hook that
+outlives its timeout keeps the caller's environment after the request ends.
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Mapping
+
+_override: ContextVar[dict[str, str] | None] = ContextVar(
+    "themectl_environment", default=None
+)
+
+
+def current() -> Mapping[str, str]:
+    override = _override.get()
+    return os.environ if override is None else override
+
+
+def get(name: str, default: str | None = None) -> str | None:
+    return current().get(name, default)
+
+
+def subprocess_env() -> dict[str, str] | None:
+    """``env=`` for ``subprocess.run``; None inherits ``os.environ``."""
+    override = _override.get()
+    return None if override is None else dict(override)
+
+
+@contextmanager
+def use(env: Mapping[str, str]) -> Iterator[None]:
+    """Run the enclosed block (and hook threads it starts) under ``env``."""
+    token = _override.set(dict(env))
+    try:
+        yield
+    finally:
+        _override.reset(token)
@@ -0,0 +1,190 @@
+"""Bounded concurrent runner for reload hooks with ordering edges."""
+
+from __future__ import annotations
+
+import contextvars
+import io
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+from rich.console import Console
+from rich.panel import Panel
+
+from . import environment
+from .trace import span
+
+DEFAULT_WORKERS = 6
+DEFAULT_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """A hook that writes to its own console and may wait on other jobs."""
+
+    label: str
+    action: Callable[[Console], None]
+    after: tuple[str, ...] = ()
+
+
+class BufferedConsole(Console):
+    """Console that records print() calls so they can be replayed in order."""
+
+    def __init__(self, target: Console) -> None:
+        super().__init__(file=io.StringIO(), width=target.width)
+        self._target = target
+        self._calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        self._calls.append((objects, kwargs))
+
+    def replay(self) -> None:
+        for objects, kwargs in self._calls:
+            self._target.print(*objects, **kwargs)
+        self._calls.clear()
+
+
+@dataclass(slots=True)
+class _Run:
+    job: Job
+    output: BufferedConsole
+    deadline: float = 0.0
+    state: str = "pending"  # pending -> running -> done | failed | timeout | skipped
+    error: Exception | None = None
+    waiting_on: set[str] = field(default_factory=set)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(environment.get(name) or default)
+    except ValueError:
+        return default
+
+
+def hook_timeout() -> float:
+    return _env_float("THEMECTL_HOOK_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def hook_workers() -> int:
+    return max(1, int(_env_float("THEMECTL_HOOK_WORKERS", DEFAULT_WORKERS)))
+
+
+def _validate(jobs: Sequence[Job]) -> None:
+    labels = [job.label for job in jobs]
+    if len(set(labels)) != len(labels):
+        raise ValueError("Hook labels must be unique")
+    position = {label: idx for idx, label in enumerate(labels)}
+    for job in jobs:
+        for dep in job.after:
+            if dep not in position:
+                raise ValueError(f"{job.label} depends on unknown hook {dep}")
+            # Edges must point backwards, which also rules out cycles.
+            if position[dep] >= position[job.label]:
+                raise ValueError(f"{job.label} must be declared after {dep}")
+
+
+def run_jobs(
+    jobs: Sequence[Job],
+    console: Console,
+    *,
+    workers: int | None = None,
+    timeout: float | None = None,
+) -> dict[str, str]:
+    """Run jobs concurrently and print their output in declaration order.
+
+    A job starts once every job in ``after`` has finished; if one of those
+    timed out the dependent is skipped rather than racing the straggler.
+    Worker threads are daemonic, so a hook stuck past its timeout never keeps
+    the CLI alive. Returns the final state of every job keyed by label.
+    """
+    _validate(jobs)
+    limit = workers or hook_workers()
+    budget = timeout if timeout is not None else hook_timeout()
+    runs = [
+        _Run(job=job, output=BufferedConsole(console), waiting_on=set(job.after))
+        for job in jobs
+    ]
+    by_label = {run.job.label: run for run in runs}
+    finished: queue.Queue[_Run] = queue.Queue()
+    running: list[_Run] = []
+    flushed = 0
+
+    def work(run: _Run) -> None:
+        try:
+            with span(run.job.label, "hook"):
+                run.job.action(run.output)
+        except Exception as exc:  # reported via Panel once flushed
+            run.error = exc
+        finally:
+            finished.put(run)
+
+    def settle(run: _Run, state: str) -> None:
+        run.state = state
+        for other in runs:
+            if run.job.label in other.waiting_on:
+                other.waiting_on.discard(run.job.label)
+                if state in ("timeout", "skipped") and other.state == "pending":
+                    other.state = "skipped"
+                    other.output.print(
+                        f"[yellow]![/yellow] {other.job.label} skipped "
+                        f"({run.job.label} did not finish)"
+                    )
+                    settle(other, "skipped")
+
+    def flush() -> None:
+        nonlocal flushed
+        while flushed < len(runs) and runs[flushed].state not in ("pending", "running"):
+            run = runs[flushed]
+            run.output.replay()
+            if run.state == "failed":
+                console.print(
+                    Panel(
+                        f"{run.error}",
+                        title=f"{run.job.label} automation failed",
+                        border_style="red",
+                    )
+                )
+            elif run.state == "timeout":
+                console.print(
+                    Panel(
+                        f"No result after {budget:g}s; continuing without it.",
+                        title=f"{run.job.label} automation timed out",
+                        border_style="yellow",
+                    )
+                )
+            flushed += 1
+
+    while True:
+        for run in runs:
+            if len(running) >= limit:
+                break
+            if run.state == "pending" and not run.waiting_on:
+                run.state = "running"
+                run.deadline = time.monotonic() + budget
+                running.append(run)
+                # Each hook keeps the request's environment even past its timeout.
+                threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(work, run),
+                    name=f"themectl-hook-{run.job.label}",
+                    daemon=True,
+                ).start()
+        flush()
+        if not running:
+            break
+        wait = max(0.0, min(run.deadline for run in running) - time.monotonic())
+        try:
+            done = finished.get(timeout=wait)
+        except queue.Empty:
+            now = time.monotonic()
+            for run in [run for run in running if run.deadline <= now]:
+                running.remove(run)
+                settle(run, "timeout")
+            continue
+        if done in running:
+            running.remove(done)
+            settle(done, "failed" if done.error else "done")
+
+    return {label: run.state for label, run in by_label.items()}
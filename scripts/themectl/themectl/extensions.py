@@ -0,0 +1,122 @@
+"""Installed VSCode/Cursor extensions without booting the editor CLI.
+
+`code --list-extensions` starts an Electron runtime (about a second). Both
+editors keep the same inventory in ``<extensions dir>/extensions.json``; its
+id set is snapshotted under the file's stat signature, so checking a theme's
+extension costs one stat until something is installed or removed. The CLI is
+only spawned to install what is actually missing, several ids per call.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Iterable
+
+from .cache import load_snapshot, snapshot_key, stat_signature, store_snapshot
+from .config import get_home
+from .environment import subprocess_env
+from .themes import Theme
+from .tools import which
+
+# editor CLI -> extensions directory relative to $HOME
+EXTENSION_DIRS = {
+    "code": Path(".vscode") / "extensions",
+    "cursor": Path(".cursor") / "extensions",
+}
+
+
+def inventory_path(editor: str) -> Path:
+    return get_home() / EXTENSION_DIRS[editor] / "extensions.json"
+
+
+def _parse_inventory(path: Path) -> frozenset[str] | None:
+    try:
+        entries = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entries, list):
+        return None
+    ids = set()
+    for entry in entries:
+        identifier = entry.get("identifier") if isinstance(entry, dict) else None
+        if isinstance(identifier, dict) and isinstance(identifier.get("id"), str):
+            ids.add(identifier["id"].lower())
+    return frozenset(ids)
+
+
+def _list_via_cli(editor: str) -> frozenset[str] | None:
+    binary = which(editor)
+    if not binary:
+        return None
+    result = subprocess.run(
+        [binary, "--list-extensions"],
+        capture_output=True,
+        text=True,
+        env=subprocess_env(),
+    )
+    if result.returncode != 0:
+        return None
+    return frozenset(line.strip().lower() for line in result.stdout.split() if line)
+
+
+def installed_extensions(editor: str) -> frozenset[str] | None:
+    """Lower-cased ids of installed extensions; None if they cannot be listed.
+
+    Falls back to ``--list-extensions`` only when the editor has no
+    extensions.json yet (fresh profile or a release that predates it).
+    """
+    path = inventory_path(editor)
+    if stat_signature(path) is None:
+        return _list_via_cli(editor)
+    name = f"extensions-{editor}"
+    key = snapshot_key(path)
+    cached = load_snapshot(name, key)
+    if isinstance(cached, frozenset):
+        return cached
+    ids = _parse_inventory(path)
+    if ids is None:
+        return _list_via_cli(editor)
+    store_snapshot(name, key, ids)
+    return ids
+
+
+def missing_extensions(editor: str, extension_ids: Iterable[str]) -> list[str]:
+    """Requested ids not installed yet, deduplicated in request order."""
+    installed = installed_extensions(editor)
+    if installed is None:
+        return []
+    missing: list[str] = []
+    for extension_id in extension_ids:
+        if extension_id.lower() not in installed and extension_id not in missing:
+            missing.append(extension_id)
+    return missing
+
+
+def install_extensions(editor: str, extension_ids: Iterable[str]) -> bool | None:
+    """Install ``extension_ids`` in one CLI call; None if there was nothing to do."""
+    binary = which(editor)
+    ids = list(extension_ids)
+    if not binary or not ids:
+        return None
+    command = [binary]
+    for extension_id in ids:
+        command += ["--install-extension", extension_id]
+    result = subprocess.run(
+        command, capture_output=True, text=True, env=subprocess_env()
+    )
+    return result.returncode == 0
+
+
+def theme_extension(theme: Theme, editor: str) -> str | None:
+    """The extension providing ``theme`` in ``editor``.
+
+    For Cursor, ``cursor.extension = ""`` means "not on the Cursor
+    marketplace, skip" while an absent key falls back to the VSCode one.
+    """
+    if editor == "cursor":
+        cursor_ext = theme.cursor_extension
+        if cursor_ext is not None:
+            return cursor_ext or None
+    return theme.vscode_extension or None
@@ -2,43 +2,34 @@
 
 from __future__ import annotations
 
-import json
-import os
 import platform
 import re
-import shutil
+import signal
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
 
 from rich.console import Console
 from rich.panel import Panel
 
+from . import environment, tools
 from .config import ThemectlConfig, get_home
+from .environment import subprocess_env
+from .executor import Job, run_jobs
+from .processes import process_table, reset_process_table
 from .themes import Theme
+from .tools import which
+from .trace import span
 
-EDITOR_SCRIPT = """
-on run argv
-  set targetApp to item 1 of argv
-  set processName to item 2 of argv
-  set themeName to item 3 of argv
-  tell application targetApp to activate
-  delay 0.15
-  tell application "System Events"
-    if not (exists process processName) then return
-    tell process processName
-      keystroke "k" using {command down}
-      delay 0.05
-      keystroke "t" using {command down}
-      delay 0.2
-      keystroke themeName
-      delay 0.1
-      key code 36
-    end tell
-  end tell
-end run
-"""
+if TYPE_CHECKING:
+    from .prescale import Display
+
+# AppleScript (keystrokes, focus changes) and `sudo touch` (a possible
+# password prompt) run one at a time, as they did before hooks ran
+# concurrently.
+_desktop_lock = threading.Lock()
 
 GHOSTTY_SCRIPT = """
 tell application "System Events"
@@ -69,107 +60,57 @@ end run
 """
 
 
-def _automation_disabled() -> bool:
-    return os.environ.get("THEME_DISABLE_EDITOR_AUTOMATION", "0") == "1"
-
-
-def _process_running(name: str) -> bool:
-    binary = shutil.which("pgrep") or "/usr/bin/pgrep"
-    result = subprocess.run(
-        [binary, "-x", name],
-        capture_output=True,
-        text=True,
-    )
-    return result.returncode == 0
-
-
-def _read_settings(path: Path) -> dict[str, Any] | None:
-    try:
-        raw = path.read_text()
-    except FileNotFoundError:
-        return None
-    cleaned = "\n".join(
-        line for line in raw.splitlines() if not line.strip().startswith("//")
-    )
-    if not cleaned.strip():
-        return {}
-    data = json.loads(cleaned)
-    if isinstance(data, dict):
-        return dict(data)
-    return None
-
-
-def _write_settings(path: Path, data: Mapping[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n")
-
-
 def _update_editor_settings(
     paths: Iterable[Path],
     theme_name: str,
     console: Console,
     label: str,
 ) -> bool:
+    """Point ``workbench.colorTheme`` at ``theme_name``, editing only that value."""
+    from .jsonc import set_member
+    from .writer import write_if_changed
+
     changed = False
     for path in paths:
-        settings = _read_settings(path)
-        if settings is None:
+        try:
+            original = path.read_text()
+        except FileNotFoundError:
             continue
-        if settings.get("workbench.colorTheme") == theme_name:
+        try:
+            updated = set_member(original, "workbench.colorTheme", theme_name)
+        except ValueError as exc:
+            console.print(
+                f"[yellow]![/yellow] Skipped {label} settings at {path}: {exc}"
+            )
             continue
-        settings["workbench.colorTheme"] = theme_name
-        _write_settings(path, settings)
+        if updated == original:
+            continue
+        write_if_changed(path, updated)
         console.print(f"[green]✓[/green] Updated {label} settings at {path}")
         changed = True
     return changed
 
 
 def _run_osascript(script: str, args: list[str]) -> bool:
-    binary = shutil.which("osascript") or "/usr/bin/osascript"
+    binary = which("osascript") or "/usr/bin/osascript"
     with tempfile.NamedTemporaryFile(
         "w", suffix=".applescript", delete=False
     ) as handle:
         handle.write(script.strip())
         tmp_path = Path(handle.name)
     try:
-        result = subprocess.run(
-            [binary, str(tmp_path), *args],
-            capture_output=True,
-            text=True,
-        )
+        with _desktop_lock:
+            result = subprocess.run(
+                [binary, str(tmp_path), *args],
+                capture_output=True,
+                text=True,
+                env=subprocess_env(),
+            )
         return result.returncode == 0
     finally:
         tmp_path.unlink(missing_ok=True)
 
 
-def _trigger_editor_reload(
-    app_name: str,
-    process_name: str,
-    theme_name: str,
-    console: Console,
-) -> None:
-    if platform.system() != "Darwin":
-        return
-    if _automation_disabled():
-        console.print(
-            f"[cyan]-[/cyan] {app_name} automation disabled (THEME_DISABLE_EDITOR_AUTOMATION=1)"
-        )
-        return
-    if not _process_running(process_name):
-        return
-    if _run_osascript(EDITOR_SCRIPT, [app_name, process_name, theme_name]):
-        console.print(f"[green]✓[/green] Reloaded {app_name} theme via AppleScript")
-    else:
-        console.print(
-            Panel(
-                f"Unable to automate {app_name} theme reload. "
-                "Ensure Accessibility permissions are granted to the terminal.",
-                title=f"{app_name}",
-                border_style="yellow",
-            )
-        )
-
-
 def _vscode_settings_paths(platform_name: str) -> list[Path]:
     home = get_home()
     if platform_name == "darwin":
@@ -187,6 +128,8 @@ def _cursor_settings_paths(platform_name: str) -> list[Path]:
 
 
 def _update_neovim_theme_file(colorscheme: str, console: Console) -> None:
+    from .writer import write_if_changed
+
     theme_file = get_home() / ".config" / "nvim" / "lua" / "plugins" / "theme.lua"
     if not theme_file.exists():
         return
@@ -199,7 +142,7 @@ def _update_neovim_theme_file(colorscheme: str, console: Console) -> None:
         updated = original.rstrip() + f"\n{replacement}\n"
         count = 1
     if count > 0 and updated != original:
-        theme_file.write_text(updated)
+        write_if_changed(theme_file, updated)
         console.print(f"[green]✓[/green] Updated Neovim config to {colorscheme}")
 
 
@@ -231,28 +174,29 @@ def _get_nvim_colorscheme_command(colorscheme: str) -> str:
     return f"{bg_cmd} | colorscheme {colorscheme}"
 
 
-def _reload_neovim_instances(colorscheme: str, console: Console) -> None:
-    binary = shutil.which("nvr")
+def _reload_neovim_via_nvr(command: str, console: Console) -> None:
+    binary = which("nvr")
     if not binary:
-        console.print("[cyan]-[/cyan] nvr not found; skipping Neovim reload")
+        console.print("[cyan]-[/cyan] No Neovim sockets found; skipping Neovim reload")
         return
     servers = subprocess.run(
         [binary, "--serverlist"],
         capture_output=True,
         text=True,
+        env=subprocess_env(),
     )
     if servers.returncode != 0:
         console.print("[yellow]![/yellow] Unable to query nvr servers")
         return
     names = [server.strip() for server in servers.stdout.split() if server.strip()]
-    cmd = _get_nvim_colorscheme_command(colorscheme)
     reloaded = 0
     for server in names:
         # Use -c to send command directly (--remote-expr with execute() doesn't work reliably)
         result = subprocess.run(
-            [binary, "--servername", server, "-c", cmd],
+            [binary, "--servername", server, "-c", command],
             capture_output=True,
             text=True,
+            env=subprocess_env(),
         )
         if result.returncode == 0:
             reloaded += 1
@@ -263,6 +207,38 @@ def _reload_neovim_instances(colorscheme: str, console: Console) -> None:
     )
 
 
+def _reload_neovim_instances(colorscheme: str, console: Console) -> None:
+    """Send the colorscheme command to every running Neovim over msgpack-RPC.
+
+    Falls back to `nvr` only when no server sockets are found on disk
+    (e.g. instances started with a custom ``--listen`` address).
+    """
+    from .nvim import discover_sockets, send_command_all
+
+    command = _get_nvim_colorscheme_command(colorscheme)
+    sockets = discover_sockets()
+    if not sockets:
+        _reload_neovim_via_nvr(command, console)
+        return
+    reloaded, stale, failed = send_command_all(sockets, command)
+    if reloaded:
+        console.print(
+            f"[green]✓[/green] Reloaded Neovim theme on {len(reloaded)} instance(s)"
+        )
+    elif not failed:
+        console.print("[cyan]-[/cyan] No running Neovim instances")
+    if stale:
+        console.print(f"[cyan]-[/cyan] Skipped {len(stale)} stale Neovim socket(s)")
+    if failed:
+        console.print(
+            Panel(
+                "\n".join(f"{path}: {reason}" for path, reason in failed.items()),
+                title="Neovim reload failed",
+                border_style="yellow",
+            )
+        )
+
+
 def _tmux_config_lines(tmux_section: Mapping[str, str]) -> list[str]:
     return [
         "# Generated by themectl",
@@ -276,6 +252,8 @@ def _tmux_config_lines(tmux_section: Mapping[str, str]) -> list[str]:
 
 
 def _update_tmux_config(theme: Theme, console: Console) -> None:
+    from .writer import write_if_changed
+
     tmux_section = theme.section("tmux")
     if not tmux_section:
         return
@@ -286,9 +264,8 @@ def _update_tmux_config(theme: Theme, console: Console) -> None:
         return
     home = get_home()
     conf_local = home / ".tmux.conf.local"
-    conf_local.parent.mkdir(parents=True, exist_ok=True)
-    conf_local.write_text("\n".join(_tmux_config_lines(tmux_section)) + "\n")
-    binary = shutil.which("tmux")
+    write_if_changed(conf_local, "\n".join(_tmux_config_lines(tmux_section)) + "\n")
+    binary = which("tmux")
     if not binary:
         console.print("[cyan]-[/cyan] tmux not found; wrote ~/.tmux.conf.local")
         return
@@ -297,12 +274,13 @@ def _update_tmux_config(theme: Theme, console: Console) -> None:
         [binary, "source-file", str(main_conf)],
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
+        env=subprocess_env(),
     )
     console.print("[green]✓[/green] Reloaded tmux theme")
 
 
 def _find_binary(name: str, extra_paths: Iterable[Path]) -> str | None:
-    binary = shutil.which(name)
+    binary = which(name)
     if binary:
         return binary
     for candidate in extra_paths:
@@ -321,14 +299,16 @@ def reload_alacritty(console: Console) -> None:
         console.print("[cyan]-[/cyan] Alacritty config not found; skipping reload")
         return
 
-    sudo = shutil.which("sudo") or "/usr/bin/sudo"
-    touch = shutil.which("touch") or "/usr/bin/touch"
+    sudo = which("sudo") or "/usr/bin/sudo"
+    touch = which("touch") or "/usr/bin/touch"
 
-    result = subprocess.run(
-        [sudo, touch, str(config)],
-        capture_output=True,
-        text=True,
-    )
+    with _desktop_lock:
+        result = subprocess.run(
+            [sudo, touch, str(config)],
+            capture_output=True,
+            text=True,
+            env=subprocess_env(),
+        )
 
     if result.returncode == 0:
         console.print("[green]✓[/green] Reloaded Alacritty config (all windows)")
@@ -343,10 +323,10 @@ def reload_alacritty(console: Console) -> None:
 
 
 def _discover_hypr_signature() -> str | None:
-    signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    signature = environment.get("HYPRLAND_INSTANCE_SIGNATURE")
     if signature:
         return signature
-    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    runtime_dir = environment.get("XDG_RUNTIME_DIR")
     if not runtime_dir:
         return None
     hypr_dir = Path(runtime_dir) / "hypr"
@@ -365,18 +345,48 @@ def _discover_hypr_signature() -> str | None:
     return candidates[0].name
 
 
-def reload_hyprland(console: Console) -> None:
+def _apply_hyprland_keywords(
+    theme: Theme | None, signature: str, console: Console
+) -> bool:
+    from .hyprland import HyprlandIPCError, apply_keywords, keyword_commands
+    from .palette import theme_palette
+
+    if theme is None:
+        return False
+    try:
+        commands = keyword_commands(theme_palette(theme))
+    except ValueError as exc:
+        console.print(f"[yellow]![/yellow] {exc}; falling back to hyprctl reload")
+        return False
+    if not commands:
+        return False
+    try:
+        apply_keywords(signature, commands)
+    except HyprlandIPCError as exc:
+        console.print(
+            f"[yellow]![/yellow] Hyprland IPC failed ({exc}); falling back to reload"
+        )
+        return False
+    console.print(
+        f"[green]✓[/green] Updated Hyprland borders via IPC ({len(commands)} keyword(s))"
+    )
+    return True
+
+
+def reload_hyprland(console: Console, theme: Theme | None = None) -> None:
     if platform.system() != "Linux":
         return
-    binary = shutil.which("hyprctl")
-    if not binary:
-        console.print("[cyan]-[/cyan] hyprctl not found; skipping Hyprland reload")
-        return
     signature = _discover_hypr_signature()
     if not signature:
         console.print("[cyan]-[/cyan] Hyprland signature unavailable; skipping reload")
         return
-    env = os.environ.copy()
+    if _apply_hyprland_keywords(theme, signature, console):
+        return
+    binary = which("hyprctl")
+    if not binary:
+        console.print("[cyan]-[/cyan] hyprctl not found; skipping Hyprland reload")
+        return
+    env = dict(environment.current())
     env["HYPRLAND_INSTANCE_SIGNATURE"] = signature
     result = subprocess.run(
         [binary, "-i", signature, "reload"],
@@ -397,45 +407,113 @@ def reload_hyprland(console: Console) -> None:
 
 
 def update_wallpaper(console: Console) -> None:
+    from .prescale import load_index
+
     background = get_home() / ".config" / "omarchy" / "current" / "background"
     if not background.exists():
         return
     target = _wallpaper_target(background)
+    # Pre-scaled variants from `sync-assets --prescale`, keyed per display.
+    index = load_index()
     system = platform.system()
     if system == "Linux":
-        _update_wallpaper_linux(target, console)
+        displays = (_connected_displays() if index else None) or (
+            index.displays if index else []
+        )
+        variants = index.lookup(target, displays) if index else {}
+        _update_wallpaper_linux(target, console, variants, displays)
     elif system == "Darwin":
-        _update_wallpaper_macos(target, console)
+        variants = index.lookup(target) if index else {}
+        # desktoppr sets every screen at once: only use a variant if all have one.
+        complete = index is not None and len(variants) == len(index.displays)
+        largest = max(variants, key=lambda d: d.width * d.height, default=None)
+        _update_wallpaper_macos(
+            variants[largest] if complete and largest else target, console
+        )
 
 
-def _update_wallpaper_linux(background: Path, console: Console) -> None:
-    binary = shutil.which("swww")
-    if not binary:
-        console.print("[cyan]-[/cyan] swww not found; skipping wallpaper refresh")
-        return
+def _connected_displays() -> list[Display] | None:
+    """Outputs Hyprland drives right now; None when it cannot be asked."""
+    from .hyprland import HyprlandIPCError, monitors
+    from .prescale import displays_from_monitors
+
+    signature = _discover_hypr_signature()
+    if not signature:
+        return None
+    try:
+        return displays_from_monitors(monitors(signature))
+    except HyprlandIPCError:
+        return None
+
+
+def _wallpaper_calls(
+    background: Path,
+    variants: Mapping[Display, Path],
+    displays: Sequence[Display],
+) -> dict[Path, list[str]]:
+    """``swww img`` calls as image -> outputs; no outputs means every output."""
+    if not variants or not displays:
+        return {background: []}
+    if not all(display.name for display in displays):
+        # Unnamed sizes (THEMECTL_WALLPAPER_SIZES) cannot be targeted per output.
+        if len(variants) < len(displays):
+            return {background: []}
+        return {variants[displays[0]]: []}
+    calls: dict[Path, list[str]] = {}
+    for display in displays:
+        calls.setdefault(variants.get(display, background), []).append(display.name)
+    return {next(iter(calls)): []} if len(calls) == 1 else calls
+
+
+def _swww_img(binary: str, image: Path, outputs: Sequence[str]) -> str | None:
+    """Run one ``swww img``; the error text on failure, else None."""
+    command = [
+        binary,
+        "img",
+        str(image),
+        "--transition-type",
+        "simple",
+        "--transition-step",
+        "255",
+    ]
+    if outputs:
+        command += ["--outputs", ",".join(outputs)]
     result = subprocess.run(
-        [
-            binary,
-            "img",
-            str(background),
-            "--transition-type",
-            "simple",
-            "--transition-step",
-            "255",
-        ],
-        capture_output=True,
-        text=True,
+        command, capture_output=True, text=True, env=subprocess_env()
     )
     if result.returncode == 0:
-        console.print("[green]✓[/green] Updated wallpaper via swww")
-    else:
-        console.print(
-            Panel(
-                result.stderr.strip() or "swww img failed",
-                title="Wallpaper reload",
-                border_style="yellow",
-            )
-        )
+        return None
+    return result.stderr.strip() or "swww img failed"
+
+
+def _update_wallpaper_linux(
+    background: Path,
+    console: Console,
+    variants: Mapping[Display, Path] | None = None,
+    displays: Sequence[Display] = (),
+) -> None:
+    binary = which("swww")
+    if not binary:
+        console.print("[cyan]-[/cyan] swww not found; skipping wallpaper refresh")
+        return
+    # One swww call per image; with several sizes each output gets its own.
+    calls = _wallpaper_calls(background, variants or {}, displays)
+    prescaled = background not in calls
+    for image, outputs in calls.items():
+        error = _swww_img(binary, image, outputs)
+        if error is None:
+            continue
+        if image != background or outputs:
+            # A variant or output name went stale: show the original everywhere.
+            console.print(f"[yellow]![/yellow] {error}; using the original wallpaper")
+            error = _swww_img(binary, background, [])
+            prescaled = False
+        if error is not None:
+            console.print(Panel(error, title="Wallpaper reload", border_style="yellow"))
+            return
+        break
+    suffix = " (pre-scaled)" if prescaled else ""
+    console.print(f"[green]✓[/green] Updated wallpaper via swww{suffix}")
 
 
 def _wallpaper_target(background: Path) -> Path:
@@ -448,12 +526,13 @@ def _wallpaper_target(background: Path) -> Path:
 
 
 def _update_wallpaper_macos(background: Path, console: Console) -> None:
-    desktoppr = shutil.which("desktoppr")
+    desktoppr = which("desktoppr")
     if desktoppr:
         result = subprocess.run(
             [desktoppr, str(background)],
             capture_output=True,
             text=True,
+            env=subprocess_env(),
         )
         if result.returncode == 0:
             console.print("[green]✓[/green] Updated macOS wallpaper via desktoppr")
@@ -482,7 +561,7 @@ def _update_wallpaper_macos(background: Path, console: Console) -> None:
 
 
 def _write_defaults_wallpaper(background: Path, console: Console) -> bool:
-    defaults = shutil.which("defaults") or "/usr/bin/defaults"
+    defaults = which("defaults") or "/usr/bin/defaults"
     payload = f'{{default = {{ImageFilePath = "{background}"; }};}}'
     result = subprocess.run(
         [
@@ -495,6 +574,7 @@ def _write_defaults_wallpaper(background: Path, console: Console) -> bool:
         ],
         capture_output=True,
         text=True,
+        env=subprocess_env(),
     )
     if result.returncode == 0:
         console.print("[green]✓[/green] Updated macOS defaults wallpaper record")
@@ -514,6 +594,7 @@ def _restart_dock(console: Console) -> None:
         ["killall", "Dock"],
         capture_output=True,
         text=True,
+        env=subprocess_env(),
     )
     if result.returncode == 0:
         console.print("[green]✓[/green] Restarted Dock to apply wallpapers")
@@ -529,6 +610,8 @@ def _restart_dock(console: Console) -> None:
 
 def update_ghostty(theme: Theme, console: Console) -> None:
     """Update Ghostty theme in main config file."""
+    from .writer import write_if_changed
+
     home = get_home()
     config_file = home / ".config" / "ghostty" / "config"
 
@@ -565,7 +648,7 @@ def update_ghostty(theme: Theme, console: Console) -> None:
             new_lines.append(line)
 
     if updated:
-        config_file.write_text("\n".join(new_lines))
+        write_if_changed(config_file, "\n".join(new_lines))
         console.print(f"[green]✓[/green] Updated Ghostty theme to {theme_name}")
     else:
         console.print("[yellow]-[/yellow] No theme line found in Ghostty config")
@@ -575,19 +658,18 @@ def reload_ghostty(console: Console) -> None:
     config = get_home() / ".config" / "ghostty" / "config"
     if not config.exists():
         return
-    binary = shutil.which("ghostty")
+    binary = which("ghostty")
     if binary:
         result = subprocess.run(
             [binary, "+reload-config"],
             capture_output=True,
             text=True,
+            env=subprocess_env(),
         )
         if result.returncode == 0:
             console.print("[green]✓[/green] Reloaded Ghostty config")
             return
-    if platform.system() == "Darwin" and (
-        _process_running("ghostty") or _process_running("Ghostty")
-    ):
+    if platform.system() == "Darwin" and process_table().running("ghostty", "Ghostty"):
         if _run_osascript(GHOSTTY_SCRIPT, []):
             console.print("[green]✓[/green] Reloaded Ghostty via automation")
             return
@@ -598,31 +680,15 @@ def _ensure_extension_installed(
     editor_cmd: str, extension_id: str, console: Console, label: str
 ) -> None:
     """Install VSCode/Cursor extension if not already installed."""
-    binary = shutil.which(editor_cmd)
-    if not binary:
-        return
+    from .extensions import install_extensions, missing_extensions
 
-    # Check if extension is installed
-    result = subprocess.run(
-        [binary, "--list-extensions"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
+    if not which(editor_cmd):
         return
-
-    installed = result.stdout.strip().split("\n")
-    if extension_id.lower() in [ext.lower() for ext in installed]:
+    if not missing_extensions(editor_cmd, [extension_id]):
         return
 
-    # Install extension
     console.print(f"[cyan]...[/cyan] Installing {label} extension: {extension_id}")
-    install_result = subprocess.run(
-        [binary, "--install-extension", extension_id],
-        capture_output=True,
-        text=True,
-    )
-    if install_result.returncode == 0:
+    if install_extensions(editor_cmd, [extension_id]):
         console.print(f"[green]✓[/green] Installed {label} extension: {extension_id}")
     else:
         console.print(
@@ -631,6 +697,8 @@ def _ensure_extension_installed(
 
 
 def _refresh_vscode(theme: Theme, cfg: ThemectlConfig, console: Console) -> None:
+    from .extensions import theme_extension
+
     if not cfg.editor_automation.vscode:
         return
     theme_name = theme.vscode_theme
@@ -638,7 +706,7 @@ def _refresh_vscode(theme: Theme, cfg: ThemectlConfig, console: Console) -> None
         return
 
     # Install extension if needed
-    extension_id = theme.vscode_extension
+    extension_id = theme_extension(theme, "code")
     if extension_id:
         _ensure_extension_installed("code", extension_id, console, "VSCode")
 
@@ -649,6 +717,8 @@ def _refresh_vscode(theme: Theme, cfg: ThemectlConfig, console: Console) -> None
 
 
 def _refresh_cursor(theme: Theme, cfg: ThemectlConfig, console: Console) -> None:
+    from .extensions import theme_extension
+
     if not cfg.editor_automation.cursor:
         return
     theme_name = theme.cursor_theme or theme.vscode_theme
@@ -656,16 +726,7 @@ def _refresh_cursor(theme: Theme, cfg: ThemectlConfig, console: Console) -> None
         return
 
     # Install extension if needed
-    # cursor_extension="" means explicitly skip (not available in Cursor marketplace)
-    # cursor_extension=None means fallback to vscode_extension
-    cursor_ext = theme.cursor_extension
-    if cursor_ext is None:
-        extension_id = theme.vscode_extension
-    elif cursor_ext:
-        extension_id = cursor_ext
-    else:
-        extension_id = None  # Empty string = skip installation
-
+    extension_id = theme_extension(theme, "cursor")
     if extension_id:
         _ensure_extension_installed("cursor", extension_id, console, "Cursor")
 
@@ -685,6 +746,8 @@ def _refresh_neovim(theme: Theme, cfg: ThemectlConfig, console: Console) -> None
 
 def update_btop(theme: Theme, console: Console) -> None:
     """Update btop theme configuration."""
+    from .writer import write_if_changed
+
     home = get_home()
     btop_themes_dir = home / ".config" / "btop" / "themes"
     btop_conf = home / ".config" / "btop" / "btop.conf"
@@ -716,38 +779,36 @@ def update_btop(theme: Theme, console: Console) -> None:
             new_lines.append(line)
 
     if updated:
-        btop_conf.write_text("\n".join(new_lines))
+        write_if_changed(btop_conf, "\n".join(new_lines))
         # Send SIGUSR2 to reload config in running btop instances
-        try:
-            subprocess.run(["pkill", "-USR2", "btop"], capture_output=True)
-        except Exception:
-            pass  # btop may not be running
+        process_table().signal("btop", signal.SIGUSR2)
         console.print(f"[green]✓[/green] Updated btop theme to {theme.slug}")
     else:
         console.print("[yellow]-[/yellow] No color_theme line found in btop.conf")
 
 
-def run_reload_hooks(theme: Theme, cfg: ThemectlConfig, console: Console) -> None:
-    actions = (
-        ("VSCode", lambda: _refresh_vscode(theme, cfg, console)),
-        ("Cursor", lambda: _refresh_cursor(theme, cfg, console)),
-        ("Neovim", lambda: _refresh_neovim(theme, cfg, console)),
-        ("tmux", lambda: _update_tmux_config(theme, console)),
-        ("Alacritty", lambda: reload_alacritty(console)),
-        ("Hyprland", lambda: reload_hyprland(console)),
-        ("Wallpaper", lambda: update_wallpaper(console)),
-        ("Ghostty (update)", lambda: update_ghostty(theme, console)),
-        ("Ghostty (reload)", lambda: reload_ghostty(console)),
-        ("btop", lambda: update_btop(theme, console)),
+def reload_jobs(theme: Theme, cfg: ThemectlConfig) -> tuple[Job, ...]:
+    """Reload hooks in output order; ``after`` marks the only real orderings."""
+    return (
+        Job("VSCode", lambda out: _refresh_vscode(theme, cfg, out)),
+        Job("Cursor", lambda out: _refresh_cursor(theme, cfg, out)),
+        Job("Neovim", lambda out: _refresh_neovim(theme, cfg, out)),
+        Job("tmux", lambda out: _update_tmux_config(theme, out)),
+        Job("Alacritty", reload_alacritty),
+        Job("Hyprland", lambda out: reload_hyprland(out, theme)),
+        Job("Wallpaper", update_wallpaper),
+        Job("Ghostty (update)", lambda out: update_ghostty(theme, out)),
+        Job("Ghostty (reload)", reload_ghostty, after=("Ghostty (update)",)),
+        Job("btop", lambda out: update_btop(theme, out)),
     )
-    for label, action in actions:
-        try:
-            action()
-        except Exception as exc:  # pragma: no cover - defensive logging
-            console.print(
-                Panel(
-                    f"{exc}",
-                    title=f"{label} automation failed",
-                    border_style="red",
-                )
-            )
+
+
+def run_reload_hooks(theme: Theme, cfg: ThemectlConfig, console: Console) -> None:
+    # Both may be stale in the daemon: rescan processes, recheck PATH.
+    reset_process_table()
+    tools.reset()
+    try:
+        with span("reload_hooks", theme=theme.slug):
+            run_jobs(reload_jobs(theme, cfg), console)
+    finally:
+        tools.flush()
@@ -0,0 +1,108 @@
+"""Minimal client for Hyprland's request socket.
+
+Applying a theme only changes a few ``general`` keywords, so instead of
+``hyprctl reload`` (which re-parses the whole config and resets layout
+state) the new values are sent as one ``[[BATCH]]`` request straight to
+``$XDG_RUNTIME_DIR/hypr/<signature>/.socket.sock``.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+from . import environment
+
+if TYPE_CHECKING:
+    from .palette import ThemePalette
+
+IPC_TIMEOUT = 1.0
+
+# theme `hyprland` section key -> Hyprland keyword
+BORDER_KEYWORDS = {
+    "activeBorder": "general:col.active_border",
+    "inactiveBorder": "general:col.inactive_border",
+}
+
+
+class HyprlandIPCError(Exception):
+    """The socket was unreachable or Hyprland rejected a command."""
+
+
+def socket_path(signature: str) -> Path | None:
+    candidates = []
+    runtime_dir = environment.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        candidates.append(Path(runtime_dir) / "hypr" / signature / ".socket.sock")
+    # Hyprland < 0.40 kept its sockets under /tmp.
+    candidates.append(Path("/tmp") / "hypr" / signature / ".socket.sock")
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def keyword_commands(palette: ThemePalette) -> list[str]:
+    """``keyword`` commands for the border colors set in a theme's palette."""
+    commands = []
+    for key, keyword in BORDER_KEYWORDS.items():
+        value = palette.value(f"hyprland.{key}", "").strip()
+        if not value:
+            continue
+        if ";" in value or "\n" in value:
+            raise ValueError(f"Unsupported character in hyprland.{key}: {value!r}")
+        commands.append(f"keyword {keyword} {value}")
+    return commands
+
+
+def batch_payload(commands: Sequence[str]) -> bytes:
+    return ("[[BATCH]]" + ";".join(commands)).encode()
+
+
+def request(path: Path, payload: bytes, timeout: float | None = None) -> str:
+    """Send ``payload`` and return Hyprland's reply (it closes after answering)."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(IPC_TIMEOUT if timeout is None else timeout)
+        sock.connect(str(path))
+        sock.sendall(payload)
+        chunks = []
+        while chunk := sock.recv(8192):
+            chunks.append(chunk)
+    return b"".join(chunks).decode(errors="replace")
+
+
+def apply_keywords(signature: str, commands: Sequence[str]) -> None:
+    """Apply ``commands`` in one batch; raise unless every one answered ``ok``."""
+    path = socket_path(signature)
+    if path is None:
+        raise HyprlandIPCError(f"No request socket for instance {signature}")
+    try:
+        reply = request(path, batch_payload(commands))
+    except OSError as exc:
+        raise HyprlandIPCError(str(exc) or type(exc).__name__) from exc
+    if reply.split() == ["ok"] * len(commands):
+        return
+    # Some releases join the batch's answers without a separator ("okok").
+    if reply.replace("\n", "") == "ok" * len(commands):
+        return
+    raise HyprlandIPCError(reply.strip() or "empty reply")
+
+
+def monitors(signature: str) -> list[dict[str, Any]]:
+    """The ``j/monitors`` reply: every output Hyprland is driving right now."""
+    path = socket_path(signature)
+    if path is None:
+        raise HyprlandIPCError(f"No request socket for instance {signature}")
+    try:
+        reply = request(path, b"j/monitors")
+    except OSError as exc:
+        raise HyprlandIPCError(str(exc) or type(exc).__name__) from exc
+    try:
+        data = json.loads(reply)
+    except ValueError as exc:
+        raise HyprlandIPCError(reply.strip() or "empty reply") from exc
+    if not isinstance(data, list):
+        raise HyprlandIPCError("unexpected monitors reply")
+    return data
@@ -0,0 +1,160 @@
+"""Minimal-edit patching of JSONC documents such as editor settings.json.
+
+VSCode and Cursor settings allow ``//`` and ``/* */`` comments and trailing
+commas. Instead of parsing and re-serializing the whole document, a small
+tokenizer walks the root object and records where each member's value lives,
+so a single value can be spliced in place. Everything else (comments, key
+order, indentation) is left byte-for-byte intact.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+_PUNCTUATION = frozenset("{}[]:,")
+_LITERAL = re.compile(r"[-+.\w]+")
+_WHITESPACE = frozenset(" \t\r\n\ufeff")
+
+Token = tuple[str, int, int]  # kind, start offset, end offset
+
+
+def tokens(text: str) -> Iterator[Token]:
+    """Yield JSONC tokens lazily, skipping whitespace and comments."""
+    i, n = 0, len(text)
+    while i < n:
+        ch = text[i]
+        if ch in _WHITESPACE:
+            i += 1
+        elif text.startswith("//", i):
+            newline = text.find("\n", i)
+            i = n if newline < 0 else newline + 1
+        elif text.startswith("/*", i):
+            close = text.find("*/", i + 2)
+            if close < 0:
+                raise ValueError(f"Unterminated block comment at offset {i}")
+            i = close + 2
+        elif ch in _PUNCTUATION:
+            yield ch, i, i + 1
+            i += 1
+        elif ch == '"':
+            j = i + 1
+            while j < n and text[j] != '"':
+                if text[j] == "\n":
+                    break
+                j += 2 if text[j] == "\\" else 1
+            if j >= n or text[j] != '"':
+                raise ValueError(f"Unterminated string at offset {i}")
+            yield "string", i, j + 1
+            i = j + 1
+        else:
+            match = _LITERAL.match(text, i)
+            if not match:
+                raise ValueError(f"Unexpected {ch!r} at offset {i}")
+            yield "literal", i, match.end()
+            i = match.end()
+
+
+@dataclass(frozen=True, slots=True)
+class Member:
+    key: str
+    key_start: int
+    value_start: int
+    value_end: int
+    # End offset of the comma after the value, if there is one.
+    comma_end: int | None
+
+
+def _next(stream: Iterator[Token]) -> Token:
+    token = next(stream, None)
+    if token is None:
+        raise ValueError("Unexpected end of document")
+    return token
+
+
+def _value_span(stream: Iterator[Token]) -> tuple[int, int]:
+    kind, start, end = _next(stream)
+    if kind in ("string", "literal"):
+        return start, end
+    if kind not in ("{", "["):
+        raise ValueError(f"Expected a value at offset {start}")
+    depth = 1
+    while depth:
+        kind, _, end = _next(stream)
+        if kind in ("{", "["):
+            depth += 1
+        elif kind in ("}", "]"):
+            depth -= 1
+    return start, end
+
+
+def root_members(text: str) -> list[Member] | None:
+    """Members of the root object in document order; None for an empty document."""
+    stream = tokens(text)
+    first = next(stream, None)
+    if first is None:
+        return None
+    if first[0] != "{":
+        raise ValueError("Document root is not an object")
+    members: list[Member] = []
+    kind, start, end = _next(stream)
+    while kind != "}":
+        if kind != "string":
+            raise ValueError(f"Expected a key at offset {start}")
+        key = json.loads(text[start:end])
+        if _next(stream)[0] != ":":
+            raise ValueError(f"Expected ':' after key {key!r}")
+        value_start, value_end = _value_span(stream)
+        kind, next_start, next_end = _next(stream)
+        comma_end = None
+        if kind == ",":
+            comma_end = next_end
+            kind, next_start, next_end = _next(stream)
+        elif kind != "}":
+            raise ValueError(f"Expected ',' or '}}' at offset {next_start}")
+        members.append(Member(key, start, value_start, value_end, comma_end))
+        start, end = next_start, next_end
+    return members
+
+
+def _indent_before(text: str, offset: int) -> str:
+    line_start = text.rfind("\n", 0, offset) + 1
+    prefix = text[line_start:offset]
+    return prefix if not prefix.strip() else "  "
+
+
+def set_member(text: str, key: str, value: Any) -> str:
+    """Return ``text`` with root member ``key`` set to ``value``.
+
+    An existing value is replaced in place (the last one wins, as in JSON);
+    the document is returned unchanged when it already holds ``value``. A
+    missing key is appended after the last member, keeping its indentation
+    and honouring a trailing comma.
+    """
+    members = root_members(text)
+    encoded_key = json.dumps(key, ensure_ascii=False)
+    encoded = json.dumps(value, ensure_ascii=False)
+    if members is None:
+        prefix = text if not text or text.endswith("\n") else text + "\n"
+        return f"{prefix}{{\n  {encoded_key}: {encoded}\n}}\n"
+    for member in reversed(members):
+        if member.key != key:
+            continue
+        try:
+            if json.loads(text[member.value_start : member.value_end]) == value:
+                return text
+        except ValueError:
+            pass  # a JSONC-only value (e.g. with comments): replace it
+        return text[: member.value_start] + encoded + text[member.value_end :]
+    if not members:
+        brace = next(tokens(text))[1]
+        return f"{text[: brace + 1]}\n  {encoded_key}: {encoded}\n{text[brace + 1 :]}"
+    last = members[-1]
+    indent = _indent_before(text, last.key_start)
+    if last.comma_end is not None:
+        insert = f"\n{indent}{encoded_key}: {encoded},"
+        return text[: last.comma_end] + insert + text[last.comma_end :]
+    insert = f",\n{indent}{encoded_key}: {encoded}"
+    return text[: last.value_end] + insert + text[last.value_end :]
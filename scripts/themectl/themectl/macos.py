@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-import shutil
 import subprocess
 import time
 from dataclasses import dataclass
@@ -15,6 +14,7 @@ from rich.panel import Panel
 
 from .config import get_home
 from .hooks import reload_ghostty
+from .tools import which
 
 LAUNCH_AGENTS = (
     "org.nixos.yabai",
@@ -74,7 +74,7 @@ def ensure_yabai_sa(console: Console | None = None) -> bool:
             )
         return True  # Not a failure, just not applicable
 
-    yabai = shutil.which("yabai")
+    yabai = which("yabai")
     if not yabai:
         if console:
             console.print(
@@ -82,7 +82,7 @@ def ensure_yabai_sa(console: Console | None = None) -> bool:
             )
         return True
 
-    sudo = shutil.which("sudo") or "/usr/bin/sudo"
+    sudo = which("sudo") or "/usr/bin/sudo"
     result = subprocess.run(
         [sudo, yabai, "--load-sa"],
         capture_output=True,
@@ -189,7 +189,7 @@ def _candidate_binaries(name: str) -> list[Path]:
             if entry not in seen:
                 seen.append(entry)
 
-    add(shutil.which(name))
+    add(which(name))
     add(Path("/run/current-system/sw/bin") / name)
     add(Path("/opt/homebrew/bin") / name)
     add(Path("/usr/local/bin") / name)
@@ -301,10 +301,10 @@ def _apply_tcc_statements(
 ) -> bool:
     if not sql.strip():
         return True
-    sqlite3 = shutil.which("sqlite3") or "/usr/bin/sqlite3"
+    sqlite3 = which("sqlite3") or "/usr/bin/sqlite3"
     cmd = [sqlite3, str(db)]
     if needs_sudo:
-        sudo = shutil.which("sudo") or "/usr/bin/sudo"
+        sudo = which("sudo") or "/usr/bin/sudo"
         cmd.insert(0, sudo)
     result = subprocess.run(
         cmd,
@@ -326,7 +326,7 @@ def _apply_tcc_statements(
 
 
 def _restart_tccd(console: Console | None = None) -> None:
-    sudo = shutil.which("sudo") or "/usr/bin/sudo"
+    sudo = which("sudo") or "/usr/bin/sudo"
     commands = [
         [sudo, "killall", "-9", "tccd"],
         ["killall", "-9", "tccd"],
@@ -349,7 +349,7 @@ def ensure_tcc_permissions(console: Console | None = None) -> bool:
     """
 
     # Try tccutil first (the reliable method for macOS 26.1+)
-    tccutil = shutil.which("tccutil")
+    tccutil = which("tccutil")
     if tccutil and Path(tccutil).exists():
         if console:
             console.print(
@@ -393,7 +393,7 @@ def _ensure_tcc_with_tccutil(tccutil: str, console: Console | None = None) -> bo
     # First, clean up any denied entries
     _cleanup_tcc_denials(console)
 
-    sudo = shutil.which("sudo") or "/usr/bin/sudo"
+    sudo = which("sudo") or "/usr/bin/sudo"
     success = True
     granted_any = False
 
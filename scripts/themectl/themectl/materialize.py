@@ -0,0 +1,125 @@
+"""Place wallpapers and other copied assets without duplicating their bytes.
+
+Strategies are tried cheapest first: a FICLONE reflink (btrfs/xfs), a
+hardlink on the same filesystem, a symlink into the read-only Nix store, and
+finally a kernel-side ``copy_file_range`` copy. The winning strategy is
+remembered per (source device, destination device) pair so later files skip
+the probes that already failed.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import Callable
+
+STRATEGIES = ("reflink", "hardlink", "symlink", "copy")
+
+# _IOW(0x94, 9, int) from linux/fs.h
+FICLONE = 0x40049409
+NIX_STORE = Path("/nix/store")
+
+
+def _reflink(source: Path, target: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "FICLONE is Linux-only")
+    import fcntl
+
+    with source.open("rb") as src, target.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(source, target)
+
+
+def _hardlink(source: Path, target: Path) -> None:
+    os.link(source, target)
+
+
+def _symlink(source: Path, target: Path) -> None:
+    resolved = source.resolve()
+    # Only immutable store paths are safe to point at; anything else may move.
+    if not resolved.is_relative_to(NIX_STORE):
+        raise OSError(errno.EPERM, f"{resolved} is not a Nix store path")
+    target.symlink_to(resolved)
+
+
+def _copy(source: Path, target: Path) -> None:
+    with source.open("rb") as src, target.open("wb") as dst:
+        try:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                written = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if written == 0:
+                    break
+                remaining -= written
+        except (AttributeError, OSError):
+            # No copy_file_range (macOS) or the kernel refused this pair.
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst)
+    shutil.copystat(source, target)
+
+
+_STRATEGY_FUNCS: dict[str, Callable[[Path, Path], None]] = {
+    "reflink": _reflink,
+    "hardlink": _hardlink,
+    "symlink": _symlink,
+    "copy": _copy,
+}
+
+
+def forced_strategy() -> str | None:
+    """Strategy pinned through THEMECTL_MATERIALIZE, if it names a known one."""
+    value = os.environ.get("THEMECTL_MATERIALIZE", "").strip().lower()
+    return value if value in STRATEGIES else None
+
+
+class Materializer:
+    """Materialize files, remembering the winning strategy per filesystem pair."""
+
+    def __init__(self, strategy: str | None = None) -> None:
+        self._forced = strategy or forced_strategy()
+        self._chosen: dict[tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+        self.used: set[str] = set()
+
+    def _candidates(self, key: tuple[int, int]) -> tuple[str, ...]:
+        if self._forced:
+            return (self._forced,)
+        with self._lock:
+            chosen = self._chosen.get(key)
+        return STRATEGIES[STRATEGIES.index(chosen) :] if chosen else STRATEGIES
+
+    def materialize(self, source: Path, target: Path) -> str:
+        """Atomically replace ``target`` with ``source``; return the strategy used."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        key = (source.stat().st_dev, target.parent.stat().st_dev)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}")
+        error: OSError | None = None
+        for name in self._candidates(key):
+            tmp.unlink(missing_ok=True)
+            try:
+                _STRATEGY_FUNCS[name](source, tmp)
+            except OSError as exc:
+                error = exc
+                continue
+            os.replace(tmp, target)
+            with self._lock:
+                self._chosen.setdefault(key, name)
+                self.used.add(name)
+            return name
+        tmp.unlink(missing_ok=True)
+        raise error or OSError(errno.EIO, f"Could not materialize {source}")
+
+
+def probe(source: Path, dest_dir: Path) -> str:
+    """Report which strategy files from ``source`` would get under ``dest_dir``."""
+    target = dest_dir / ".themectl-probe"
+    try:
+        return Materializer().materialize(source, target)
+    finally:
+        target.unlink(missing_ok=True)
@@ -0,0 +1,265 @@
+"""Talk to running Neovim instances over their msgpack-RPC sockets.
+
+Replaces one `nvr` process per instance: sockets are discovered on disk and
+every instance gets an ``nvim_command`` request concurrently, each bounded
+by its own timeout. Only the tiny msgpack subset Neovim RPC needs is
+implemented here, so no third-party dependency is required.
+"""
+
+from __future__ import annotations
+
+import socket
+import stat
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Sequence
+
+from . import environment
+
+RPC_TIMEOUT = 2.0
+MAX_WORKERS = 16
+
+
+class RpcError(Exception):
+    """Neovim answered the request with an error."""
+
+
+class StaleSocket(Exception):
+    """Nothing is listening on the socket (the instance has exited)."""
+
+
+def _pack(obj: Any) -> bytes:
+    if obj is None:
+        return b"\xc0"
+    if obj is True:
+        return b"\xc3"
+    if obj is False:
+        return b"\xc2"
+    if isinstance(obj, int):
+        if 0 <= obj < 0x80:
+            return bytes([obj])
+        if -32 <= obj < 0:
+            return struct.pack("b", obj)
+        if 0 <= obj <= 0xFFFFFFFF:
+            return b"\xce" + struct.pack(">I", obj)
+        return b"\xd3" + struct.pack(">q", obj)
+    if isinstance(obj, str):
+        data = obj.encode()
+        size = len(data)
+        if size < 32:
+            return bytes([0xA0 | size]) + data
+        if size <= 0xFF:
+            return b"\xd9" + bytes([size]) + data
+        if size <= 0xFFFF:
+            return b"\xda" + struct.pack(">H", size) + data
+        return b"\xdb" + struct.pack(">I", size) + data
+    if isinstance(obj, bytes):
+        if len(obj) <= 0xFF:
+            return b"\xc4" + bytes([len(obj)]) + obj
+        return b"\xc6" + struct.pack(">I", len(obj)) + obj
+    if isinstance(obj, (list, tuple)):
+        head = (
+            bytes([0x90 | len(obj)])
+            if len(obj) < 16
+            else b"\xdd" + struct.pack(">I", len(obj))
+        )
+        return head + b"".join(_pack(item) for item in obj)
+    if isinstance(obj, dict):
+        head = (
+            bytes([0x80 | len(obj)])
+            if len(obj) < 16
+            else b"\xdf" + struct.pack(">I", len(obj))
+        )
+        return head + b"".join(_pack(k) + _pack(v) for k, v in obj.items())
+    raise TypeError(f"Cannot encode {type(obj).__name__} as msgpack")
+
+
+def _read(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if data is None or len(data) != size:
+        raise EOFError("Neovim closed the connection")
+    return data
+
+
+def _unpack(stream: BinaryIO) -> Any:
+    tag = _read(stream, 1)[0]
+    if tag <= 0x7F:
+        return tag
+    if tag >= 0xE0:
+        return tag - 0x100
+    if 0x80 <= tag <= 0x8F:
+        return _unpack_map(stream, tag & 0x0F)
+    if 0x90 <= tag <= 0x9F:
+        return [_unpack(stream) for _ in range(tag & 0x0F)]
+    if 0xA0 <= tag <= 0xBF:
+        return _read(stream, tag & 0x1F).decode(errors="replace")
+    if tag == 0xC0:
+        return None
+    if tag in (0xC2, 0xC3):
+        return tag == 0xC3
+    fixed = {
+        0xCA: ">f",
+        0xCB: ">d",
+        0xCC: ">B",
+        0xCD: ">H",
+        0xCE: ">I",
+        0xCF: ">Q",
+        0xD0: ">b",
+        0xD1: ">h",
+        0xD2: ">i",
+        0xD3: ">q",
+    }
+    if tag in fixed:
+        fmt = fixed[tag]
+        return struct.unpack(fmt, _read(stream, struct.calcsize(fmt)))[0]
+    lengths = {0xC4: ">B", 0xC5: ">H", 0xC6: ">I", 0xD9: ">B", 0xDA: ">H", 0xDB: ">I"}
+    if tag in lengths:
+        fmt = lengths[tag]
+        size = struct.unpack(fmt, _read(stream, struct.calcsize(fmt)))[0]
+        data = _read(stream, size)
+        return data if tag <= 0xC6 else data.decode(errors="replace")
+    if tag in (0xDC, 0xDD):
+        fmt = ">H" if tag == 0xDC else ">I"
+        size = struct.unpack(fmt, _read(stream, struct.calcsize(fmt)))[0]
+        return [_unpack(stream) for _ in range(size)]
+    if tag in (0xDE, 0xDF):
+        fmt = ">H" if tag == 0xDE else ">I"
+        size = struct.unpack(fmt, _read(stream, struct.calcsize(fmt)))[0]
+        return _unpack_map(stream, size)
+    if 0xD4 <= tag <= 0xD8:  # fixext: Neovim buffer/window/tabpage handles
+        ext_type = _read(stream, 1)[0]
+        return (ext_type, _read(stream, 1 << (tag - 0xD4)))
+    if tag in (0xC7, 0xC8, 0xC9):
+        fmt = {0xC7: ">B", 0xC8: ">H", 0xC9: ">I"}[tag]
+        size = struct.unpack(fmt, _read(stream, struct.calcsize(fmt)))[0]
+        ext_type = _read(stream, 1)[0]
+        return (ext_type, _read(stream, size))
+    raise ValueError(f"Unsupported msgpack tag 0x{tag:02x}")
+
+
+def _unpack_map(stream: BinaryIO, size: int) -> dict[Any, Any]:
+    result = {}
+    for _ in range(size):
+        key = _unpack(stream)
+        result[key] = _unpack(stream)
+    return result
+
+
+def _is_socket(path: Path) -> bool:
+    try:
+        return stat.S_ISSOCK(path.stat().st_mode)
+    except OSError:
+        return False
+
+
+def _search_roots() -> list[Path]:
+    roots = []
+    runtime = environment.get("XDG_RUNTIME_DIR")
+    if runtime:
+        roots.append(Path(runtime))
+    roots.append(Path(environment.get("TMPDIR") or "/tmp"))
+    return roots
+
+
+def discover_sockets(roots: Iterable[Path] | None = None) -> list[Path]:
+    """Find Neovim server sockets.
+
+    Covers ``$XDG_RUNTIME_DIR/nvim.<pid>.0`` (Linux), the per-user
+    ``$TMPDIR/nvim.<user>/<id>/nvim.<pid>.0`` tree (macOS) and the legacy
+    ``$TMPDIR/nvimXXXXXX/0`` directories. Only ``nvim*`` entries are
+    descended into, so large temp directories are not walked.
+    """
+    found: list[Path] = []
+    seen: set[Path] = set()
+
+    def visit(path: Path, depth: int) -> None:
+        if _is_socket(path):
+            if path not in seen:
+                seen.add(path)
+                found.append(path)
+            return
+        if depth == 0 or not path.is_dir() or path.is_symlink():
+            return
+        try:
+            children = sorted(path.iterdir())
+        except OSError:
+            return
+        for child in children:
+            visit(child, depth - 1)
+
+    for root in roots if roots is not None else _search_roots():
+        try:
+            entries = sorted(root.glob("nvim*"))
+        except OSError:
+            continue
+        for entry in entries:
+            visit(entry, 2)
+    return found
+
+
+def send_command(path: Path, command: str, timeout: float | None = None) -> None:
+    """Run ``command`` in the instance behind ``path`` via ``nvim_command``."""
+    timeout = RPC_TIMEOUT if timeout is None else timeout
+    msgid = 1
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError) as exc:
+            raise StaleSocket(str(exc)) from exc
+        sock.sendall(_pack([0, msgid, "nvim_command", [command]]))
+        with sock.makefile("rb") as stream:
+            while True:
+                message = _unpack(stream)
+                # Skip notifications (type 2) Neovim may push first.
+                if (
+                    isinstance(message, list)
+                    and len(message) == 4
+                    and message[0] == 1
+                    and message[1] == msgid
+                ):
+                    break
+    error = message[2]
+    if error is not None:
+        if isinstance(error, list) and len(error) == 2:
+            error = error[1]
+        raise RpcError(str(error))
+
+
+def send_command_all(
+    paths: Sequence[Path], command: str, timeout: float | None = None
+) -> tuple[list[Path], list[Path], dict[Path, str]]:
+    """Send ``command`` to every socket concurrently.
+
+    Returns ``(reloaded, stale, failed)`` where ``failed`` maps each socket
+    that errored or timed out to a short reason.
+    """
+    reloaded: list[Path] = []
+    stale: list[Path] = []
+    failed: dict[Path, str] = {}
+    if not paths:
+        return reloaded, stale, failed
+    timeout = RPC_TIMEOUT if timeout is None else timeout
+
+    def attempt(path: Path) -> str | None:
+        try:
+            send_command(path, command, timeout)
+        except StaleSocket:
+            return "stale"
+        except TimeoutError:
+            return f"no reply within {timeout:g}s"
+        except (OSError, EOFError, ValueError, RpcError) as exc:
+            return str(exc) or type(exc).__name__
+        return None
+
+    workers = min(MAX_WORKERS, len(paths))
+    with ThreadPoolExecutor(workers, thread_name_prefix="themectl-nvim") as pool:
+        for path, outcome in zip(paths, pool.map(attempt, paths)):
+            if outcome is None:
+                reloaded.append(path)
+            elif outcome == "stale":
+                stale.append(path)
+            else:
+                failed[path] = outcome
+    return reloaded, stale, failed
@@ -0,0 +1,178 @@
+"""Compiled per-theme color palettes.
+
+Every theme's ``colors/{slug}.toml`` and the color values in its metadata
+sections (``waybar.foreground``, ``alacritty.primary.background``, ...) are
+compiled into one `ThemePalette`: the values as written, parsed RGBA colors
+with their derived forms, WCAG contrast ratios for the pairs that matter, and
+OKLab dim/bright variants plus an accent, all computed by `themectl.color` in
+one batch across every theme. Palettes are built when theme metadata is
+parsed and travel inside the ``themes.pickle`` snapshot, so renderers and
+hooks read them from the single snapshot load at startup instead of probing
+and parsing TOML per theme.
+
+Stdlib-only so quick paths such as ``themectl preview`` stay cheap.
+"""
+
+from __future__ import annotations
+
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+
+from . import color
+from .color import Color
+
+if TYPE_CHECKING:
+    from .themes import Theme
+
+# Bundled location (package install), then the repo checkout (development).
+COLOR_DIRS = (
+    Path(__file__).parent / "colors",
+    Path(__file__).parent.parent.parent.parent / "modules" / "themes" / "colors",
+)
+
+# colors.toml keys that get precomputed dim/bright variants.
+VARIANT_KEYS = ("foreground", "background", "accent", "cursor") + tuple(
+    f"color{index}" for index in range(16)
+)
+# OKLab lightness step for the dim/bright variants.
+VARIANT_STEP = 0.08
+# ANSI slots (red..cyan) an accent is derived from when colors.toml has none.
+ACCENT_CANDIDATES = tuple(f"color{index}" for index in range(1, 7))
+
+# (foreground, background) keys whose contrast ratio is precomputed.
+CONTRAST_PAIRS = (
+    ("foreground", "background"),
+    ("accent", "background"),
+    ("selection_foreground", "selection_background"),
+    ("cursor", "background"),
+)
+
+
+@dataclass(slots=True)
+class ThemePalette:
+    slug: str
+    # colors.toml keys as-is, theme section values as "section.key[.subkey]"
+    values: dict[str, str] = field(default_factory=dict)
+    colors: dict[str, Color] = field(default_factory=dict)
+    contrast: dict[tuple[str, str], float] = field(default_factory=dict)
+    dim: dict[str, Color] = field(default_factory=dict)
+    bright: dict[str, Color] = field(default_factory=dict)
+    # colors.toml `accent`, else the most chromatic of color1..color6
+    accent: Color | None = None
+
+    def value(self, key: str, default: str) -> str:
+        """The value as written, like ``theme.section(...).get(key, default)``."""
+        return self.values.get(key, default)
+
+    def color(self, key: str) -> Color | None:
+        return self.colors.get(key)
+
+    def toml(self) -> dict[str, str]:
+        """The entries that came from ``colors/{slug}.toml``."""
+        return {key: value for key, value in self.values.items() if "." not in key}
+
+
+def color_files() -> list[Path]:
+    """Every palette file that can feed a theme, for snapshot keys."""
+    return [
+        path for directory in COLOR_DIRS for path in sorted(directory.glob("*.toml"))
+    ]
+
+
+def colors_file(slug: str) -> Path | None:
+    for directory in COLOR_DIRS:
+        path = directory / f"{slug}.toml"
+        if path.exists():
+            return path
+    return None
+
+
+def load_colors(slug: str) -> Mapping[str, str]:
+    """Colors from ``colors/{slug}.toml``; empty when missing or unreadable."""
+    path = colors_file(slug)
+    if path is None:
+        return {}
+    try:
+        with open(path, "rb") as handle:
+            return tomllib.load(handle)
+    except Exception:
+        return {}
+
+
+def _section_values(
+    prefix: str, section: Mapping[str, Any], out: dict[str, str]
+) -> None:
+    for key, value in section.items():
+        name = f"{prefix}.{key}"
+        if isinstance(value, Mapping):
+            _section_values(name, value, out)
+        elif isinstance(value, str):
+            out[name] = value
+
+
+def _raw_values(theme: Theme) -> dict[str, str]:
+    values = {
+        key: value
+        for key, value in load_colors(theme.slug).items()
+        if isinstance(value, str)
+    }
+    for name, section in theme.raw.items():
+        if isinstance(section, Mapping):
+            _section_values(name, section, values)
+    return values
+
+
+def compile_palettes(themes: Sequence[Theme]) -> list[ThemePalette]:
+    """Compile every theme's palette, running each color operation once for all."""
+    palettes = [ThemePalette(theme.slug, _raw_values(theme)) for theme in themes]
+    parsed = iter(color.parse(v for p in palettes for v in p.values.values()))
+    for palette in palettes:
+        for key in palette.values:
+            value = next(parsed)
+            if value is not None:
+                palette.colors[key] = value
+
+    pairs = [
+        (palette, pair)
+        for palette in palettes
+        for pair in CONTRAST_PAIRS
+        if pair[0] in palette.colors and pair[1] in palette.colors
+    ]
+    ratios = color.contrast(
+        [palette.colors[fg] for palette, (fg, _) in pairs],
+        [palette.colors[bg] for palette, (_, bg) in pairs],
+    )
+    for (palette, pair), ratio in zip(pairs, ratios):
+        palette.contrast[pair] = ratio
+
+    slots = [
+        (palette, key)
+        for palette in palettes
+        for key in VARIANT_KEYS
+        if key in palette.colors
+    ]
+    bases = [palette.colors[key] for palette, key in slots]
+    dims = color.adjust_lightness(bases, -VARIANT_STEP)
+    brights = color.adjust_lightness(bases, VARIANT_STEP)
+    for (palette, key), dim, bright in zip(slots, dims, brights):
+        palette.dim[key] = dim
+        palette.bright[key] = bright
+
+    for palette in palettes:
+        palette.accent = palette.colors.get("accent") or color.most_chromatic(
+            [palette.colors[key] for key in ACCENT_CANDIDATES if key in palette.colors]
+        )
+    return palettes
+
+
+def compile_palette(theme: Theme) -> ThemePalette:
+    return compile_palettes([theme])[0]
+
+
+def theme_palette(theme: Theme) -> ThemePalette:
+    """The theme's compiled palette, compiling it if it was not preloaded."""
+    if theme.palette is None:
+        theme.palette = compile_palette(theme)
+    return theme.palette
@@ -0,0 +1,277 @@
+"""Monitor-sized wallpaper variants so cycling never decodes full-size originals.
+
+`sync-assets --prescale` scales every synced wallpaper to each connected
+display's pixel size (cover-crop, fast-decoding PNG) under
+``~/.cache/themectl/wallpapers``. Variants are named by the source's sha256
+(taken from the sync manifests) and the target size, so they survive renames
+and are shared between themes. ``update_wallpaper`` maps the current
+wallpaper's stat signature to its variants with a single snapshot load.
+Variants for resolutions seen within `SIZE_RETENTION` are kept across syncs,
+so docking and undocking do not throw the cache away.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from .cache import (
+    StatSignature,
+    cache_dir,
+    load_snapshot,
+    stat_signature,
+    store_snapshot,
+)
+from .tools import which
+
+INDEX_KEY = ("prescale", 2)
+# How long variants for a display size that is no longer connected are kept.
+SIZE_RETENTION = 30 * 24 * 3600
+
+
+@dataclass(frozen=True, slots=True)
+class Display:
+    # Empty name means "every output" (sizes pinned via THEMECTL_WALLPAPER_SIZES).
+    name: str
+    width: int
+    height: int
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return (self.width, self.height)
+
+
+@dataclass(slots=True)
+class PrescaleIndex:
+    displays: list[Display]
+    # wallpaper file signature -> sha256 of its content
+    sources: dict[StatSignature, str] = field(default_factory=dict)
+    # sha256 -> (width, height) -> cached variant path
+    variants: dict[str, dict[tuple[int, int], str]] = field(default_factory=dict)
+    # (width, height) -> when a connected display last had that size
+    seen: dict[tuple[int, int], float] = field(default_factory=dict)
+
+    def lookup(
+        self, wallpaper: Path, displays: Sequence[Display] | None = None
+    ) -> dict[Display, Path]:
+        """Map ``displays`` (default: those seen at sync) to pre-scaled copies.
+
+        Displays without a variant of their size are left out; callers show
+        the original on those.
+        """
+        digest = self.sources.get(stat_signature(wallpaper))
+        sizes = self.variants.get(digest, {}) if digest else {}
+        picked: dict[Display, Path] = {}
+        for display in self.displays if displays is None else displays:
+            variant = sizes.get(display.size)
+            if variant and os.path.exists(variant):
+                picked[display] = Path(variant)
+        return picked
+
+
+def load_index() -> PrescaleIndex | None:
+    index = load_snapshot("prescale", INDEX_KEY)
+    return index if isinstance(index, PrescaleIndex) else None
+
+
+def displays_from_monitors(monitors: Iterable[Any]) -> list[Display]:
+    """Displays for Hyprland's ``monitors`` JSON, in physical orientation."""
+    displays = []
+    for monitor in monitors:
+        if not isinstance(monitor, dict):
+            continue
+        width, height = int(monitor.get("width", 0)), int(monitor.get("height", 0))
+        if int(monitor.get("transform", 0)) % 2:  # rotated 90/270 degrees
+            width, height = height, width
+        if width and height:
+            displays.append(Display(str(monitor.get("name", "")), width, height))
+    return displays
+
+
+def _parse_sizes(value: str) -> list[Display]:
+    displays = []
+    for item in value.split(","):
+        width, _, height = item.strip().lower().partition("x")
+        if width.isdigit() and height.isdigit():
+            displays.append(Display("", int(width), int(height)))
+    return displays
+
+
+def _hyprland_displays() -> list[Display]:
+    import json
+    import subprocess
+
+    binary = which("hyprctl")
+    if not binary:
+        return []
+    result = subprocess.run([binary, "monitors", "-j"], capture_output=True, text=True)
+    if result.returncode != 0:
+        return []
+    try:
+        monitors = json.loads(result.stdout)
+    except ValueError:
+        return []
+    return displays_from_monitors(monitors) if isinstance(monitors, list) else []
+
+
+def _macos_displays() -> list[Display]:
+    import json
+    import subprocess
+
+    result = subprocess.run(
+        ["system_profiler", "SPDisplaysDataType", "-json"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return []
+    try:
+        gpus = json.loads(result.stdout).get("SPDisplaysDataType", [])
+    except ValueError:
+        return []
+    displays = []
+    for gpu in gpus:
+        for screen in gpu.get("spdisplays_ndrvs", []):
+            pixels = str(screen.get("_spdisplays_pixels", ""))
+            width, _, height = pixels.replace(" ", "").partition("x")
+            if width.isdigit() and height.isdigit():
+                displays.append(
+                    Display(str(screen.get("_name", "")), int(width), int(height))
+                )
+    return displays
+
+
+def detect_displays(platform: str) -> list[Display]:
+    """Connected displays in physical pixels; THEMECTL_WALLPAPER_SIZES overrides."""
+    override = os.environ.get("THEMECTL_WALLPAPER_SIZES")
+    if override:
+        return _parse_sizes(override)
+    if platform == "darwin":
+        return _macos_displays()
+    return _hyprland_displays()
+
+
+def _scale_command(
+    source: Path, target: Path, width: int, height: int
+) -> list[str] | None:
+    vips = which("vipsthumbnail")
+    if vips:
+        return [
+            vips,
+            str(source),
+            "--size",
+            f"{width}x{height}",
+            "--smartcrop",
+            "centre",
+            "-o",
+            f"{target}[compression=1]",
+        ]
+    magick = which("magick") or which("convert")
+    if magick:
+        return [
+            magick,
+            str(source),
+            "-resize",
+            f"{width}x{height}^",
+            "-gravity",
+            "center",
+            "-extent",
+            f"{width}x{height}",
+            "-define",
+            "png:compression-level=1",
+            str(target),
+        ]
+    return None
+
+
+def _render_variant(source: Path, target: Path, size: tuple[int, int]) -> bool:
+    import subprocess
+
+    tmp = target.with_name(f".{target.stem}.{os.getpid()}.png")
+    command = _scale_command(source, tmp, *size)
+    if command is None:
+        return False
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0 or not tmp.exists():
+        tmp.unlink(missing_ok=True)
+        return False
+    os.replace(tmp, target)
+    return True
+
+
+@dataclass(slots=True)
+class PrescaleResult:
+    created: int = 0
+    reused: int = 0
+    failed: int = 0
+
+
+def _retained_sizes(
+    previous: PrescaleIndex | None, sizes: Iterable[tuple[int, int]], now: float
+) -> dict[tuple[int, int], float]:
+    seen = dict(previous.seen) if previous else {}
+    seen.update((size, now) for size in sizes)
+    return {size: at for size, at in seen.items() if now - at < SIZE_RETENTION}
+
+
+def build_index(
+    wallpapers: Iterable[tuple[Path, str]],
+    displays: list[Display],
+    jobs: int = 1,
+) -> tuple[PrescaleIndex, PrescaleResult]:
+    """Ensure a variant of every ``(path, sha256)`` wallpaper for each display size.
+
+    Existing variants for sizes seen within `SIZE_RETENTION` stay indexed and
+    on disk; only variants for the connected sizes are rendered.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    directory = cache_dir() / "wallpapers"
+    directory.mkdir(parents=True, exist_ok=True)
+    index = PrescaleIndex(displays=displays)
+    result = PrescaleResult()
+    sizes = sorted({display.size for display in displays})
+    index.seen = _retained_sizes(load_index(), sizes, time.time())
+    retained = sorted(set(index.seen) - set(sizes))
+    pending: list[tuple[Path, Path, tuple[int, int], str]] = []
+    queued: set[Path] = set()
+    for path, digest in wallpapers:
+        signature = stat_signature(path)
+        if signature is None:
+            continue
+        index.sources[signature] = digest
+        for size in sizes:
+            target = directory / f"{digest[:32]}-{size[0]}x{size[1]}.png"
+            if target.exists():
+                index.variants.setdefault(digest, {})[size] = str(target)
+                result.reused += 1
+            elif target not in queued:
+                queued.add(target)
+                pending.append((path, target, size, digest))
+        for size in retained:
+            target = directory / f"{digest[:32]}-{size[0]}x{size[1]}.png"
+            if target.exists():
+                index.variants.setdefault(digest, {})[size] = str(target)
+
+    with ThreadPoolExecutor(max(1, jobs), thread_name_prefix="themectl-scale") as pool:
+        outcomes = pool.map(lambda item: _render_variant(*item[:3]), pending)
+        for (_, target, size, digest), ok in zip(pending, outcomes):
+            if ok:
+                index.variants.setdefault(digest, {})[size] = str(target)
+                result.created += 1
+            else:
+                result.failed += 1
+
+    keep = {path for sizes in index.variants.values() for path in sizes.values()}
+    for stale in directory.glob("*.png"):
+        if str(stale) not in keep:
+            stale.unlink(missing_ok=True)
+    store_snapshot("prescale", INDEX_KEY, index)
+    return index, result
+
+
+def scaler_available() -> bool:
+    return _scale_command(Path("in"), Path("out"), 1, 1) is not None
@@ -0,0 +1,84 @@
+"""Live palette previews pushed straight to open terminals.
+
+Applying a theme rewrites files and reloads half the desktop; a preview only
+writes OSC escape sequences to every PTY the user owns. OSC 4 sets the 16
+ANSI colors and OSC 10/11/12 the foreground, background and cursor. OSC
+104/110/111/112 hand each terminal back its own configured colors, so a
+cancelled preview leaves nothing behind, on screen or on disk.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import re
+import stat
+from pathlib import Path
+from typing import Iterable, Mapping
+
+ANSI_COLORS = 16
+# OSC number -> colors.toml key
+DYNAMIC_COLORS = {10: "foreground", 11: "background", 12: "cursor"}
+RESET = b"\x1b]104\x1b\\\x1b]110\x1b\\\x1b]111\x1b\\\x1b]112\x1b\\"
+
+_HEX = re.compile(r"#[0-9a-fA-F]{6}")
+_ST = "\x1b\\"
+
+
+def sequences(colors: Mapping[str, object]) -> bytes:
+    """Escape sequences setting a terminal to ``colors``; b"" if none are usable."""
+
+    def hex_color(key: str) -> str | None:
+        value = colors.get(key)
+        return value if isinstance(value, str) and _HEX.fullmatch(value) else None
+
+    ansi = [
+        f"{index};{value}"
+        for index in range(ANSI_COLORS)
+        if (value := hex_color(f"color{index}"))
+    ]
+    parts = [f"\x1b]4;{';'.join(ansi)}{_ST}"] if ansi else []
+    for code, key in DYNAMIC_COLORS.items():
+        if value := hex_color(key):
+            parts.append(f"\x1b]{code};{value}{_ST}")
+    return "".join(parts).encode()
+
+
+def terminals() -> list[Path]:
+    """PTYs owned by the current user: /dev/pts/N on Linux, /dev/ttysNNN on macOS."""
+    if platform.system() == "Linux":
+        candidates: Iterable[Path] = (
+            path for path in Path("/dev/pts").glob("*") if path.name.isdigit()
+        )
+    else:
+        candidates = Path("/dev").glob("ttys[0-9]*")
+    uid = os.getuid()
+    found = []
+    for path in candidates:
+        try:
+            info = path.stat()
+        except OSError:
+            continue
+        if stat.S_ISCHR(info.st_mode) and info.st_uid == uid:
+            found.append(path)
+    return sorted(found)
+
+
+def broadcast(payload: bytes, paths: Iterable[Path] | None = None) -> int:
+    """Write ``payload`` to each PTY without blocking; return how many took it."""
+    if not payload:
+        return 0
+    written = 0
+    for path in terminals() if paths is None else paths:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError:
+            continue
+        try:
+            if os.write(fd, payload) == len(payload):
+                written += 1
+        except OSError:
+            pass  # a stalled terminal must not hold up the others
+        finally:
+            os.close(fd)
+    return written
@@ -0,0 +1,114 @@
+"""One process-table snapshot shared by every reload hook.
+
+Hooks used to spawn `pgrep -x` per "is X running" check and `pkill` to
+signal apps. The table is read once per hook run instead: straight from
+``/proc`` on Linux, from a single ``ps -axo`` elsewhere. Names are matched
+like ``pgrep -x`` (the kernel's 15-character ``comm`` on Linux, the
+executable's basename on macOS), and signals go only to the matching PIDs.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import threading
+from pathlib import Path
+
+# Linux truncates /proc/<pid>/comm to TASK_COMM_LEN - 1 characters.
+COMM_LEN = 15
+
+_lock = threading.Lock()
+_table: ProcessTable | None = None
+
+
+class ProcessTable:
+    def __init__(self, processes: dict[int, str]) -> None:
+        # pid -> process name
+        self.processes = processes
+        self._by_name: dict[str, list[int]] = {}
+        for pid, name in sorted(processes.items()):
+            self._by_name.setdefault(name, []).append(pid)
+
+    def pids(self, name: str) -> list[int]:
+        pids = self._by_name.get(name)
+        if pids is None and len(name) > COMM_LEN:
+            pids = self._by_name.get(name[:COMM_LEN])
+        return list(pids or ())
+
+    def running(self, *names: str) -> bool:
+        return any(self.pids(name) for name in names)
+
+    def signal(self, name: str, signum: int) -> int:
+        """Send ``signum`` to every process called ``name``; return how many got it."""
+        sent = 0
+        for pid in self.pids(name):
+            if pid == os.getpid():
+                continue
+            try:
+                os.kill(pid, signum)
+            except (ProcessLookupError, PermissionError):
+                continue
+            sent += 1
+        return sent
+
+
+def read_proc(root: Path = Path("/proc")) -> dict[int, str]:
+    processes: dict[int, str] = {}
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return processes
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, "comm"), "rb") as handle:
+                    name = handle.read().decode(errors="replace").rstrip("\n")
+            except OSError:
+                continue  # exited while we were scanning
+            processes[int(entry.name)] = name
+    return processes
+
+
+def read_ps() -> dict[int, str]:
+    import subprocess
+
+    from .environment import subprocess_env
+
+    result = subprocess.run(
+        ["ps", "-axo", "pid=,comm="],
+        capture_output=True,
+        text=True,
+        env=subprocess_env(),
+    )
+    processes: dict[int, str] = {}
+    if result.returncode != 0:
+        return processes
+    for line in result.stdout.splitlines():
+        pid, _, command = line.strip().partition(" ")
+        if pid.isdigit() and command:
+            processes[int(pid)] = os.path.basename(command.strip())
+    return processes
+
+
+def snapshot() -> ProcessTable:
+    if platform.system() == "Linux":
+        return ProcessTable(read_proc())
+    return ProcessTable(read_ps())
+
+
+def process_table() -> ProcessTable:
+    """The table for the current hook run, read on first use."""
+    global _table
+    with _lock:
+        if _table is None:
+            _table = snapshot()
+        return _table
+
+
+def reset_process_table() -> None:
+    """Forget the snapshot so the next hook run (e.g. in the daemon) rereads it."""
+    global _table
+    with _lock:
+        _table = None
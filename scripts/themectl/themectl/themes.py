@@ -7,6 +7,9 @@ import json
 from pathlib import Path
 from typing import Any, Iterator, Mapping
 
+from .cache import load_snapshot, snapshot_key, store_snapshot
+from .palette import ThemePalette, color_files, compile_palettes
+
 
 @dataclass(slots=True)
 class Theme:
@@ -16,6 +19,8 @@ class Theme:
     wallpapers: list[Path]
     raw: Mapping[str, Any] = field(repr=False)
     kind: str | None = None
+    # Compiled with the metadata snapshot; see themectl.palette.theme_palette.
+    palette: ThemePalette | None = field(default=None, repr=False, compare=False)
 
     def section(self, name: str) -> Mapping[str, Any]:
         value = self.raw.get(name)
@@ -70,9 +75,25 @@ def _coerce_slug(entry: Mapping[str, Any]) -> str:
 
 
 def load_theme_metadata(path: Path) -> ThemeRepository:
+    """Load the theme repository, reusing the compiled snapshot when current.
+
+    The snapshot holds the sorted themes, their compiled palettes and the
+    prebuilt lookup index (keyed on the metadata and every colors/*.toml), so a
+    cache hit skips JSON decoding and repository construction entirely.
+    """
     if not path.exists():
         return ThemeRepository([])
 
+    key = snapshot_key(path, *color_files())
+    cached = load_snapshot("themes", key)
+    if isinstance(cached, ThemeRepository):
+        return cached
+    repo = _parse_theme_metadata(path)
+    store_snapshot("themes", key, repo)
+    return repo
+
+
+def _parse_theme_metadata(path: Path) -> ThemeRepository:
     data = json.loads(path.read_text())
 
     if isinstance(data, Mapping) and "themes" in data:
@@ -110,5 +131,7 @@ def load_theme_metadata(path: Path) -> ThemeRepository:
                 kind=entry.get("kind"),
             )
         )
+    for theme, palette in zip(result, compile_palettes(result)):
+        theme.palette = palette
     ordered = sorted(result, key=lambda t: t.display_name.lower())
     return ThemeRepository(ordered)
@@ -0,0 +1,94 @@
+"""Memoized lookup of the external tools hooks and macOS helpers run.
+
+`shutil.which` walks every PATH entry on each call, and a Nix profile puts a
+lot of directories on PATH. Each name is resolved at most once per process,
+and the results are snapshotted under PATH plus the stat signature of every
+PATH directory: switching profile generations repoints those directories (and
+installing or removing a binary touches them), which invalidates the snapshot.
+New lookups are persisted by `flush` once per command rather than per name;
+long-lived processes call `reset` before each command so the directory stat
+key is rechecked.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from . import environment
+from .cache import load_snapshot, snapshot_key, store_snapshot
+
+# Tools `themectl doctor` reports on, per platform.
+TOOLS = {
+    "linux": ("hyprctl", "swww", "ghostty", "tmux", "nvr", "code", "cursor"),
+    "darwin": (
+        "osascript",
+        "defaults",
+        "desktoppr",
+        "yabai",
+        "sqlite3",
+        "tccutil",
+        "ghostty",
+        "tmux",
+        "nvr",
+        "code",
+        "cursor",
+    ),
+}
+
+_lock = threading.Lock()
+_resolver: _Resolver | None = None
+
+
+@dataclass(slots=True)
+class _Resolver:
+    path: str
+    key: tuple[Any, ...]
+    # name -> absolute path, or None when it is not on PATH
+    found: dict[str, str | None] = field(default_factory=dict)
+    # lookups not yet in the snapshot
+    dirty: bool = False
+
+
+def _load(path: str) -> _Resolver:
+    directories = [Path(entry) for entry in path.split(os.pathsep) if entry]
+    key = (path,) + snapshot_key(*directories)
+    cached = load_snapshot("tools", key)
+    return _Resolver(path, key, dict(cached) if isinstance(cached, dict) else {})
+
+
+def which(name: str) -> str | None:
+    """`shutil.which(name)`, looked up once per process and PATH."""
+    global _resolver
+    path = environment.get("PATH") or os.defpath
+    with _lock:
+        if _resolver is None or _resolver.path != path:
+            _resolver = _load(path)
+        if name not in _resolver.found:
+            _resolver.found[name] = shutil.which(name, path=path)
+            _resolver.dirty = True
+        return _resolver.found[name]
+
+
+def inventory(names: Iterable[str]) -> dict[str, str | None]:
+    return {name: which(name) for name in names}
+
+
+def flush() -> None:
+    """Persist lookups made since the last flush in one snapshot write."""
+    with _lock:
+        if _resolver is not None and _resolver.dirty:
+            store_snapshot("tools", _resolver.key, _resolver.found)
+            _resolver.dirty = False
+
+
+def reset() -> None:
+    """Flush, then forget resolved paths; the next lookup revalidates PATH."""
+    global _resolver
+    flush()
+    with _lock:
+        _resolver = None
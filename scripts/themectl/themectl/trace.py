@@ -0,0 +1,142 @@
+"""Chrome trace-event recording for `themectl --trace FILE`.
+
+Spans are no-ops until :func:`session` enables recording, so instrumented
+code paths cost a single ``None`` check per span when tracing is off. While
+enabled, ``subprocess.run`` is wrapped so every child process shows up with
+its argv, exit code and duration. Open the output in Perfetto or
+chrome://tracing.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+_lock = threading.Lock()
+_events: list[dict[str, Any]] | None = None
+_threads: dict[int, str] = {}
+_origin_ns = 0
+_original_run: Callable[..., Any] | None = None
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def enable() -> None:
+    global _events, _origin_ns, _original_run
+    if _events is not None:
+        return
+    import subprocess
+
+    _events = []
+    _threads.clear()
+    _origin_ns = time.perf_counter_ns()
+    _original_run = subprocess.run
+    subprocess.run = _traced_run
+
+
+def disable() -> None:
+    global _events, _original_run
+    if _original_run is not None:
+        import subprocess
+
+        if subprocess.run is _traced_run:
+            subprocess.run = _original_run
+    _events = None
+    _original_run = None
+
+
+def _record(
+    name: str, cat: str, start_ns: int, end_ns: int, args: dict[str, Any]
+) -> None:
+    events = _events
+    if events is None:
+        return
+    thread = threading.current_thread()
+    tid = thread.ident or 0
+    event = {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": (start_ns - _origin_ns) / 1000,
+        "dur": (end_ns - start_ns) / 1000,
+        "pid": os.getpid(),
+        "tid": tid,
+        "args": args,
+    }
+    with _lock:
+        events.append(event)
+        _threads.setdefault(tid, thread.name)
+
+
+@contextmanager
+def span(name: str, cat: str = "themectl", **args: Any) -> Iterator[dict[str, Any]]:
+    """Time the enclosed block; callers may add result fields to the yielded args."""
+    if _events is None:
+        yield args
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield args
+    except BaseException as exc:
+        args.setdefault("error", repr(exc))
+        raise
+    finally:
+        _record(name, cat, start, time.perf_counter_ns(), args)
+
+
+def _traced_run(*popenargs: Any, **kwargs: Any) -> Any:
+    assert _original_run is not None
+    command = popenargs[0] if popenargs else kwargs.get("args")
+    if isinstance(command, (list, tuple)):
+        argv = [str(part) for part in command]
+    else:
+        argv = [str(command)]
+    with span(Path(argv[0]).name if argv else "process", "process", argv=argv) as args:
+        result = _original_run(*popenargs, **kwargs)
+        args["exit_code"] = getattr(result, "returncode", None)
+    return result
+
+
+def write(path: Path) -> None:
+    import json
+
+    with _lock:
+        events = list(_events or [])
+        threads = dict(_threads)
+    pid = os.getpid()
+    metadata = [
+        {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "themectl"}}
+    ] + [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": tid,
+            "args": {"name": name},
+        }
+        for tid, name in threads.items()
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"traceEvents": metadata + events, "displayTimeUnit": "ms"})
+    )
+
+
+@contextmanager
+def session(path: Path, name: str) -> Iterator[None]:
+    """Record everything inside the block and write the trace on exit."""
+    enable()
+    try:
+        with span(name, "command"):
+            yield
+    finally:
+        try:
+            write(path)
+        finally:
+            disable()
@@ -0,0 +1,104 @@
+"""Persistent index of synced wallpapers for `themectl cycle-background`.
+
+`sync-assets` records every wallpaper under ``~/.config/omarchy/themes`` in
+cycle order together with its inode and mtime, plus the stat signatures of
+the directories it scanned. Validating the index costs one stat per theme
+directory, so cycling stays flat as the wallpaper count grows; any
+directory change triggers a single rescan.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .cache import (
+    StatSignature,
+    load_snapshot,
+    snapshot_key,
+    stat_signature,
+    store_snapshot,
+)
+
+SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
+
+@dataclass(slots=True)
+class WallpaperIndex:
+    root: Path
+    # (path relative to root, st_ino, st_mtime_ns) in cycle order
+    entries: list[tuple[str, int, int]]
+    # directory (relative to root) -> signature when it was scanned
+    dirs: dict[str, StatSignature]
+    _positions: dict[str, int] | None = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def path(self, idx: int) -> Path:
+        return self.root / self.entries[idx][0]
+
+    def fresh(self) -> bool:
+        return all(
+            stat_signature(self.root / rel) == sig for rel, sig in self.dirs.items()
+        )
+
+    def find(self, current: str | None, hint: int | None = None) -> int | None:
+        """Locate ``current``, trying the stored position ``hint`` first."""
+        if not current or not self.entries:
+            return None
+        if hint is not None and 0 <= hint < len(self.entries):
+            if str(self.path(hint)) == current:
+                return hint
+        if self._positions is None:
+            self._positions = {rel: idx for idx, (rel, _, _) in enumerate(self.entries)}
+        path = Path(current)
+        if path.is_relative_to(self.root):
+            idx = self._positions.get(path.relative_to(self.root).as_posix())
+            if idx is not None:
+                return idx
+        # Recorded elsewhere (e.g. a resolved store path): match by inode.
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        for idx, (_, ino, mtime_ns) in enumerate(self.entries):
+            if ino == stat.st_ino and mtime_ns == stat.st_mtime_ns:
+                return idx
+        return None
+
+
+def scan(root: Path) -> WallpaperIndex:
+    """Walk ``root`` in the same order cycle-background always used."""
+    dirs: dict[str, StatSignature] = {}
+    entries: list[tuple[str, int, int]] = []
+    for theme_dir in sorted(root.iterdir()):
+        if not theme_dir.is_dir():
+            continue
+        dirs[theme_dir.name] = stat_signature(theme_dir)
+        backgrounds = theme_dir / "backgrounds"
+        if not backgrounds.is_dir():
+            continue
+        rel_dir = f"{theme_dir.name}/backgrounds"
+        dirs[rel_dir] = stat_signature(backgrounds)
+        for bg in sorted(backgrounds.iterdir()):
+            if bg.suffix.lower() not in SUFFIXES or not bg.is_file():
+                continue
+            stat = bg.stat()
+            entries.append((f"{rel_dir}/{bg.name}", stat.st_ino, stat.st_mtime_ns))
+    return WallpaperIndex(root=root, entries=entries, dirs=dirs)
+
+
+def rebuild_index(root: Path) -> WallpaperIndex:
+    key = snapshot_key(root)
+    index = scan(root)
+    store_snapshot("wallpapers", key, index)
+    return index
+
+
+def load_index(root: Path) -> WallpaperIndex:
+    """Return the stored index for ``root``, rescanning only when stale."""
+    index = load_snapshot("wallpapers", snapshot_key(root))
+    if isinstance(index, WallpaperIndex) and index.root == root and index.fresh():
+        return index
+    return rebuild_index(root)
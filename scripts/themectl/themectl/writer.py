@@ -0,0 +1,80 @@
+"""Atomic, skip-unchanged file writes shared by asset sync and reload hooks."""
+
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from pathlib import Path
+
+
+def _matches(path: Path, payload: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(payload):
+            return False
+        return path.read_bytes() == payload
+    except OSError:
+        return False
+
+
+class AtomicWriter:
+    """Write files via temp-file-plus-rename, leaving identical files untouched.
+
+    Skipping unchanged files keeps their mtime, so inotify watchers such as
+    Alacritty, Waybar and Walker do not reload, and the rename means they never
+    read a half-written file. Directories created through one writer are
+    remembered, so filling a tree issues each ``mkdir`` once.
+    """
+
+    def __init__(self) -> None:
+        self._dirs: set[Path] = set()
+
+    def ensure_dir(self, path: Path) -> None:
+        if path not in self._dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(path)
+
+    def _open_tmp(self, tmp: Path, mode: int) -> int:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            return os.open(tmp, flags, mode)
+        except FileNotFoundError:
+            # The directory was removed after we cached it (e.g. pruned).
+            self._dirs.discard(tmp.parent)
+            self.ensure_dir(tmp.parent)
+            return os.open(tmp, flags, mode)
+
+    def write(self, path: Path, data: str | bytes, force: bool = False) -> bool:
+        """Replace ``path`` with ``data``; return False if it already matched.
+
+        Symlinked paths are written through to their target so Home Manager
+        style links are preserved. ``force`` skips the comparison.
+        """
+        payload = data.encode() if isinstance(data, str) else data
+        target = Path(os.path.realpath(path)) if path.is_symlink() else path
+        if not force and _matches(target, payload):
+            return False
+        try:
+            mode = stat.S_IMODE(target.stat().st_mode)
+        except OSError:
+            mode = None
+        self.ensure_dir(target.parent)
+        tmp = target.with_name(
+            f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        fd = self._open_tmp(tmp, 0o666 if mode is None else mode)
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return True
+
+
+def write_if_changed(path: Path, data: str | bytes) -> bool:
+    """One-off :meth:`AtomicWriter.write`; returns True when the file changed."""
+    return AtomicWriter().write(path, data)